@@ -2,7 +2,13 @@
 AuthenticationService for the User Management domain model.
 """
 
-from typing import Optional, Dict, Any
+import functools
+import random
+import time
+from collections import Counter
+from typing import Optional, Dict, Any, List, Tuple
+
+import jwt
 
 from user import User
 from user_credentials import UserCredentials
@@ -20,6 +26,30 @@ from exceptions import (
 from logging_config import logger
 
 
+@functools.lru_cache(maxsize=10000)
+def _build_token_payload(
+    user_id: str,
+    email: str,
+    name: str,
+    role_value: str,
+    employee_id: str,
+    version: Any
+) -> Dict[str, Any]:
+    """
+    Build a JWT payload dict, memoized per user state.
+
+    The version argument (the user's updated_at timestamp) makes stale
+    entries unreachable whenever the user record changes.
+    """
+    return {
+        "user_id": user_id,
+        "email": email,
+        "name": name,
+        "role": role_value,
+        "employee_id": employee_id
+    }
+
+
 class AuthenticationService:
     """
     Service for handling user authentication workflow.
@@ -31,7 +61,17 @@ class AuthenticationService:
     - Security audit logging
     - Logout operations
     """
-    
+
+    # JWT configuration
+    JWT_SECRET_KEY = "secret_key"
+    JWT_ALGORITHM = "HS256"
+
+    # Cache configuration
+    TOKEN_CACHE_TTL_SECONDS = 60
+
+    # Audit log entries buffered before a batch flush to the repository
+    AUDIT_FLUSH_BATCH_SIZE = 50
+
     def __init__(
         self,
         user_repository: UserRepository,
@@ -52,6 +92,19 @@ class AuthenticationService:
         self.credentials_repository = credentials_repository
         self.token_repository = token_repository
         self.audit_log_repository = audit_log_repository
+
+        # Cache-aside layer for validate_token, keyed by token hash.
+        # Each entry maps token_hash -> (cache_expiry_epoch, validation_result).
+        self._token_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Write-behind buffer for audit log entries (batched repository writes)
+        self._audit_buffer: List[SecurityAuditLog] = []
+
+        # Sampling for failure audit logs (1.0 = log every failure). Lower
+        # this under credential-stuffing load; dropped events are tallied
+        # and flushed as a single summary entry.
+        self._audit_sampling_rate = 1.0
+        self._dropped_failure_counts: Counter = Counter()
     
     def authenticate_user(
         self,
@@ -84,25 +137,33 @@ class AuthenticationService:
         failure_reason = None
         
         try:
-            # Step 1: Find user by email
-            user = self.user_repository.find_by_email(email)
+            # Step 1: Find user and credentials in one combined lookup
+            user, credentials = self._find_user_and_credentials(email)
             if not user:
                 failure_reason = "User not found"
                 raise InvalidCredentialsException("Invalid email or password")
-            
+
             # Step 2: Check if account is active
             if not user.is_active:
                 failure_reason = "Account not activated"
                 raise AccountNotActivatedException("Account is not activated. Please verify your email.")
-            
-            # Step 3: Find user credentials
-            credentials = self.credentials_repository.find_by_user_id(user.id)
+
+            # Step 3: Check that credentials exist
             if not credentials:
                 failure_reason = "Credentials not found"
                 raise InvalidCredentialsException("Invalid email or password")
             
-            # Step 4: Verify password (this handles account lockout internally)
-            if not credentials.verify_password(password):
+            # Step 4: Verify password (this handles account lockout internally).
+            # verify_password mutates the stored instance's attempt counter
+            # and lockout timestamp in place — on the lockout check too, via
+            # expiry auto-reset — so re-sync the repository's security
+            # aggregates however it exits
+            try:
+                password_valid = credentials.verify_password(password)
+            finally:
+                self.credentials_repository.refresh_security_state(credentials)
+
+            if not password_valid:
                 failure_reason = "Invalid password"
                 raise InvalidCredentialsException("Invalid email or password")
             
@@ -113,7 +174,7 @@ class AuthenticationService:
             token_payload = self._create_token_payload(user)
             access_token = self._generate_jwt_token(token_payload)
             
-            # Step 7: Store token record
+            # Step 7: Store token record and last-login update as one batch
             token_record = AuthenticationToken(
                 user_id=user.id,
                 token=access_token,
@@ -121,13 +182,10 @@ class AuthenticationService:
                 ip_address=ip_address,
                 user_agent=user_agent
             )
-            self.token_repository.save(token_record)
-            
-            # Step 8: Update user last login
             user.update_last_login()
-            self.user_repository.save(user)
+            self._persist_login_state(user, token_record)
             
-            # Step 9: Log successful login
+            # Step 8: Log successful login
             self._log_authentication_event(
                 user_id=user.id,
                 success=True,
@@ -196,42 +254,110 @@ class AuthenticationService:
             
             raise AuthenticationException("Authentication failed due to internal error")
     
+    def _resolve_token(
+        self,
+        token: str,
+        token_hash: Optional[str] = None
+    ) -> Tuple[AuthenticationToken, User]:
+        """
+        Resolve a token string to its stored record and associated user.
+
+        Hashes the token and queries the repositories exactly once so callers
+        (validate_token, logout_user) do not repeat the work.
+
+        Args:
+            token: JWT token to resolve
+            token_hash: Optional precomputed token hash to avoid re-hashing
+
+        Returns:
+            Tuple of (token_record, user)
+
+        Raises:
+            ValidationException: If token is invalid, expired, or revoked,
+                or the user is missing or inactive
+        """
+        # Step 1: Reject tokens with bad signatures before touching storage
+        self._verify_jwt_signature(token)
+
+        # Step 2: Encode once; hashing and verification reuse the same bytes
+        token_bytes = token.encode('utf-8')
+        if token_hash is None:
+            token_hash = AuthenticationToken._hash_token(token_bytes)
+
+        # Step 3: Find token record
+        token_record = self.token_repository.find_by_token_hash(token_hash)
+        if not token_record:
+            raise ValidationException("Invalid token")
+
+        # Step 4: Verify token
+        if not token_record.verify_token(token_bytes):
+            raise ValidationException("Token validation failed")
+
+        # Step 5: Reject tokens invalidated by a mass revocation
+        if not self.token_repository.is_token_current(token_record):
+            raise ValidationException("Token has been revoked")
+
+        # Step 6: Find user
+        user = self.user_repository.find_by_id(token_record.user_id)
+        if not user:
+            raise ValidationException("User not found for token")
+
+        # Step 7: Check if user is still active
+        if not user.is_active:
+            raise ValidationException("User account is not active")
+
+        return token_record, user
+
+    def _verify_jwt_signature(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a token's JWT signature without any repository access.
+
+        Args:
+            token: JWT token to check
+
+        Returns:
+            Decoded token payload
+
+        Raises:
+            ValidationException: If the signature is invalid or token malformed
+        """
+        try:
+            return jwt.decode(
+                token,
+                self.JWT_SECRET_KEY,
+                algorithms=[self.JWT_ALGORITHM]
+            )
+        except jwt.InvalidTokenError:
+            raise ValidationException("Invalid token")
+
     def validate_token(self, token: str) -> Dict[str, Any]:
         """
         Validate an authentication token.
-        
+
+        This is a read-only hot path executed on every authenticated
+        request: it must never write audit log entries on success, only
+        failures/anomalies are logged (see _log_authentication_event).
+
         Args:
             token: JWT token to validate
-        
+
         Returns:
             Dictionary with validation result and user info
-        
+
         Raises:
             ValidationException: If token is invalid, expired, or revoked
         """
         try:
-            # Step 1: Decode token to get token hash
-            token_hash = AuthenticationToken._hash_token(None, token)
-            
-            # Step 2: Find token record
-            token_record = self.token_repository.find_by_token_hash(token_hash)
-            if not token_record:
-                raise ValidationException("Invalid token")
-            
-            # Step 3: Verify token
-            if not token_record.verify_token(token):
-                raise ValidationException("Token validation failed")
-            
-            # Step 4: Find user
-            user = self.user_repository.find_by_id(token_record.user_id)
-            if not user:
-                raise ValidationException("User not found for token")
-            
-            # Step 5: Check if user is still active
-            if not user.is_active:
-                raise ValidationException("User account is not active")
-            
-            return {
+            token_hash = AuthenticationToken._hash_token(token.encode('utf-8'))
+
+            # Cache hit: skip both repository lookups
+            cached = self._token_cache.get(token_hash)
+            if cached and time.time() < cached[0]:
+                return cached[1]
+
+            token_record, user = self._resolve_token(token, token_hash=token_hash)
+
+            result = {
                 "valid": True,
                 "user_id": user.id,
                 "email": user.email,
@@ -240,12 +366,44 @@ class AuthenticationService:
                 "token_id": token_record.id,
                 "expires_at": token_record.expires_at.isoformat()
             }
-            
+
+            # Cache the result, never beyond the token's own expiry
+            cache_expiry = min(
+                time.time() + self.TOKEN_CACHE_TTL_SECONDS,
+                token_record.expires_at.timestamp()
+            )
+            self._token_cache[token_hash] = (cache_expiry, result)
+
+            return result
+
         except ValidationException:
             raise
         except Exception as e:
             logger.error(f"Unexpected error during token validation: {str(e)}")
             raise ValidationException("Token validation failed")
+
+    def _invalidate_token_cache(self, token_hash: str) -> None:
+        """
+        Remove a single token from the validation cache.
+
+        Args:
+            token_hash: Hash of the token to invalidate
+        """
+        self._token_cache.pop(token_hash, None)
+
+    def _invalidate_user_token_cache(self, user_id: str) -> None:
+        """
+        Remove all cached validation results for a user.
+
+        Args:
+            user_id: User whose cached tokens should be invalidated
+        """
+        stale_hashes = [
+            token_hash for token_hash, (_, result) in self._token_cache.items()
+            if result.get("user_id") == user_id
+        ]
+        for token_hash in stale_hashes:
+            del self._token_cache[token_hash]
     
     def logout_user(
         self,
@@ -265,17 +423,14 @@ class AuthenticationService:
             Dictionary with logout result
         """
         try:
-            # Step 1: Validate token first
-            token_info = self.validate_token(token)
-            user_id = token_info["user_id"]
-            
-            # Step 2: Find and revoke token
-            token_hash = AuthenticationToken._hash_token(None, token)
-            token_record = self.token_repository.find_by_token_hash(token_hash)
-            
-            if token_record:
-                token_record.revoke("User logout")
-                self.token_repository.save(token_record)
+            # Step 1: Validate token and resolve its record in a single pass
+            token_record, user = self._resolve_token(token)
+            user_id = user.id
+
+            # Step 2: Revoke the already-resolved token record
+            token_record.revoke("User logout")
+            self.token_repository.save(token_record)
+            self._invalidate_token_cache(token_record.token_hash)
             
             # Step 3: Log logout event
             audit_log = SecurityAuditLog(
@@ -287,7 +442,7 @@ class AuthenticationService:
                 user_agent=user_agent,
                 additional_data={"reason": "User logout"}
             )
-            self.audit_log_repository.save(audit_log)
+            self._enqueue_audit_log(audit_log)
             
             logger.info(f"User logged out successfully: {user_id}")
             
@@ -321,6 +476,7 @@ class AuthenticationService:
         logger.info(f"Revoking all tokens for user: {user_id}")
         
         revoked_count = self.token_repository.revoke_user_tokens(user_id, reason)
+        self._invalidate_user_token_cache(user_id)
         
         # Log revocation event
         audit_log = SecurityAuditLog(
@@ -333,7 +489,7 @@ class AuthenticationService:
                 "tokens_revoked": revoked_count
             }
         )
-        self.audit_log_repository.save(audit_log)
+        self._enqueue_audit_log(audit_log)
         
         logger.info(f"Revoked {revoked_count} tokens for user: {user_id}")
         
@@ -350,32 +506,28 @@ class AuthenticationService:
         Returns:
             Dictionary with authentication statistics
         """
-        # Get login events
-        login_attempts = self.audit_log_repository.find_login_attempts()
-        successful_logins = [log for log in login_attempts if log.success]
-        failed_logins = [log for log in login_attempts if not log.success]
-        
+        # Make sure buffered audit entries are visible to the queries below
+        self.flush_audit_logs()
+
+        # Get login attempt counts (aggregated repository-side)
+        login_counts = self.audit_log_repository.count_login_attempts()
+        total_attempts = login_counts["total"]
+
         # Get token statistics
         token_stats = self.token_repository.get_token_stats()
-        
-        # Get locked accounts
-        locked_accounts = self.credentials_repository.find_locked_accounts()
-        
-        # Get accounts with failed attempts
-        accounts_with_failures = self.credentials_repository.find_accounts_with_failed_attempts()
-        
+
         return {
             "login_statistics": {
-                "total_login_attempts": len(login_attempts),
-                "successful_logins": len(successful_logins),
-                "failed_logins": len(failed_logins),
-                "success_rate": (len(successful_logins) / len(login_attempts) * 100) 
-                              if login_attempts else 0
+                "total_login_attempts": total_attempts,
+                "successful_logins": login_counts["successful"],
+                "failed_logins": login_counts["failed"],
+                "success_rate": (login_counts["successful"] / total_attempts * 100)
+                              if total_attempts else 0
             },
             "token_statistics": token_stats,
             "security_statistics": {
-                "locked_accounts": len(locked_accounts),
-                "accounts_with_failed_attempts": len(accounts_with_failures)
+                "locked_accounts": self.credentials_repository.get_locked_account_count(),
+                "accounts_with_failed_attempts": self.credentials_repository.get_failed_attempts_count()
             }
         }
     
@@ -389,43 +541,69 @@ class AuthenticationService:
         Returns:
             Token payload dictionary
         """
-        return {
-            "user_id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "role": user.role.value,
-            "employee_id": user.employee_id
-        }
+        return _build_token_payload(
+            user.id,
+            user.email,
+            user.name,
+            user.role.value,
+            user.employee_id,
+            user.updated_at
+        )
     
     def _generate_jwt_token(self, payload: Dict[str, Any]) -> str:
         """
         Generate JWT token from payload.
-        
+
         Args:
             payload: Token payload
-        
+
         Returns:
-            JWT token string
-        
-        Note: This is a simplified implementation. In production, use proper JWT library.
+            HMAC-SHA256 signed JWT token string
         """
-        import json
-        import base64
-        import hashlib
-        
-        # Simple JWT-like token for demo purposes
-        header = {"alg": "HS256", "typ": "JWT"}
-        
-        # Encode header and payload
-        header_encoded = base64.urlsafe_b64encode(json.dumps(header).encode()).decode().rstrip('=')
-        payload_encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
-        
-        # Create signature (simplified)
-        message = f"{header_encoded}.{payload_encoded}"
-        signature = hashlib.sha256(f"{message}.secret_key".encode()).hexdigest()[:32]
-        
-        return f"{header_encoded}.{payload_encoded}.{signature}"
+        return jwt.encode(payload, self.JWT_SECRET_KEY, algorithm=self.JWT_ALGORITHM)
     
+    def _find_user_and_credentials(
+        self,
+        email: str
+    ) -> Tuple[Optional[User], Optional[UserCredentials]]:
+        """
+        Fetch a user and their credentials in one combined lookup.
+
+        A database-backed repository can implement this as a single JOIN;
+        callers distinguish "user not found" from "credentials not found"
+        by which side of the tuple is None.
+
+        Args:
+            email: User email address
+
+        Returns:
+            Tuple of (user, credentials); either side may be None
+        """
+        user = self.user_repository.find_by_email(email)
+        if not user:
+            return None, None
+
+        return user, self.credentials_repository.find_by_user_id(user.id)
+
+    def _persist_login_state(self, user: User, token_record: AuthenticationToken) -> None:
+        """
+        Persist the new token record and updated user as a single batch.
+
+        The in-memory repositories have no transaction support, so this keeps
+        both writes together and rolls the token record back if the user save
+        fails, leaving storage consistent.
+
+        Args:
+            user: User with updated last-login timestamp
+            token_record: Newly created token record
+        """
+        self.token_repository.save(token_record)
+        try:
+            self.user_repository.save(user)
+        except Exception:
+            self.token_repository.delete_by_id(token_record.id)
+            raise
+
     def _log_authentication_event(
         self,
         user_id: Optional[str],
@@ -447,22 +625,67 @@ class AuthenticationService:
             additional_data: Additional data to log
         """
         try:
+            # Sample failure logs under attack load; tally dropped events
+            if not success and random.random() >= self._audit_sampling_rate:
+                self._dropped_failure_counts[failure_reason or "Unknown"] += 1
+                return
+
             audit_log = SecurityAuditLog.create_login_log(
                 user_id=user_id,
                 success=success,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                failure_reason=failure_reason
+                failure_reason=failure_reason,
+                additional_data=additional_data
             )
-            
-            # Add additional data if provided
-            if additional_data:
-                for key, value in additional_data.items():
-                    audit_log.add_additional_data(key, value)
-            
-            self.audit_log_repository.save(audit_log)
+
+            self._enqueue_audit_log(audit_log)
         except Exception as e:
             logger.error(f"Failed to log authentication event: {str(e)}")
+
+    def _enqueue_audit_log(self, audit_log: SecurityAuditLog) -> None:
+        """
+        Buffer an audit log entry for a batched repository write.
+
+        Args:
+            audit_log: Audit log entry to buffer
+        """
+        self._audit_buffer.append(audit_log)
+
+        if len(self._audit_buffer) >= self.AUDIT_FLUSH_BATCH_SIZE:
+            self.flush_audit_logs()
+
+    def flush_audit_logs(self) -> int:
+        """
+        Flush all buffered audit log entries to the repository.
+
+        Returns:
+            Number of entries flushed
+        """
+        # Summarize any failure events dropped by sampling as one entry
+        if self._dropped_failure_counts:
+            dropped = dict(self._dropped_failure_counts)
+            self._dropped_failure_counts.clear()
+            self._audit_buffer.append(SecurityAuditLog(
+                event_type=SecurityEventType.LOGIN_FAILURE,
+                event_description="Sampled login failures (dropped by audit sampling)",
+                success=False,
+                additional_data={
+                    "dropped_counts": dropped,
+                    "sampling_rate": self._audit_sampling_rate
+                }
+            ))
+
+        if not self._audit_buffer:
+            return 0
+
+        pending = self._audit_buffer
+        self._audit_buffer = []
+
+        for audit_log in pending:
+            self.audit_log_repository.save(audit_log)
+
+        return len(pending)
     
     def cleanup_expired_tokens(self) -> Dict[str, int]:
         """
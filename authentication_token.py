@@ -3,14 +3,37 @@ AuthenticationToken entity for the User Management domain model.
 """
 
 import hashlib
+import hmac
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Optional, Union
 
 from base_entity import BaseEntity
 from enums import TokenType
 from exceptions import ValidationException, RevokedTokenException
 
 
+# Server-side key for HMAC token hashing; override via set_token_hmac_key
+_TOKEN_HMAC_KEY = b"token_hmac_secret_key"
+
+
+def set_token_hmac_key(key: bytes) -> None:
+    """
+    Set the server-side HMAC key used for token hashing.
+
+    Args:
+        key: HMAC key bytes
+
+    Raises:
+        ValidationException: If key is empty
+    """
+    global _TOKEN_HMAC_KEY
+
+    if not key:
+        raise ValidationException("HMAC key is required")
+
+    _TOKEN_HMAC_KEY = key
+
+
 class AuthenticationToken(BaseEntity):
     """
     AuthenticationToken entity managing JWT tokens for stateless authentication.
@@ -30,9 +53,19 @@ class AuthenticationToken(BaseEntity):
         updated_at (datetime): When the token was last updated
     """
     
+    __slots__ = (
+        'user_id', 'token_hash', 'token_type', 'expires_at', '_expires_at_ts',
+        'is_revoked', 'revoked_at', 'revoked_reason', 'ip_address', 'user_agent',
+        'token_version'
+    )
+
     # Configuration constants
     ACCESS_TOKEN_EXPIRY_HOURS = 24
     REFRESH_TOKEN_EXPIRY_DAYS = 30
+
+    # Prebuilt expiry deltas (avoids a timedelta construction per token)
+    _ACCESS_EXPIRY = timedelta(hours=ACCESS_TOKEN_EXPIRY_HOURS)
+    _REFRESH_EXPIRY = timedelta(days=REFRESH_TOKEN_EXPIRY_DAYS)
     
     def __init__(
         self,
@@ -65,11 +98,18 @@ class AuthenticationToken(BaseEntity):
         self.token_hash = self._hash_token(token)
         self.token_type = self._validate_token_type(token_type)
         self.expires_at = custom_expiry or self._calculate_expiry(token_type)
+        # Unix-timestamp mirror of expires_at for cheap scalar comparisons
+        # in bulk repository scans
+        self._expires_at_ts = self.expires_at.timestamp()
         self.is_revoked = False
         self.revoked_at: Optional[datetime] = None
         self.revoked_reason: Optional[str] = None
-        self.ip_address = ip_address
+        # Normalize here so index keys always match lookup keys
+        self.ip_address = ip_address.strip() if ip_address else ip_address
         self.user_agent = user_agent
+        # Per-user revocation generation; stamped by the repository on first
+        # save and compared against the user's current version on validation
+        self.token_version = 0
     
     def _validate_user_id(self, user_id: str) -> str:
         """Validate user ID."""
@@ -83,20 +123,24 @@ class AuthenticationToken(BaseEntity):
             raise ValidationException("Token type must be a valid TokenType enum")
         return token_type
     
-    def _hash_token(self, token: str) -> str:
+    @staticmethod
+    def _hash_token(token: Union[str, bytes]) -> str:
         """
-        Create SHA-256 hash of the token for storage.
-        
+        Create keyed HMAC-SHA256 hash of the token for storage.
+
         Args:
-            token: JWT token string
-        
+            token: JWT token string or its already-encoded bytes
+
         Returns:
-            SHA-256 hash of the token
+            HMAC-SHA256 hash of the token
         """
         if not token:
             raise ValidationException("Token is required")
-        
-        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+        if not isinstance(token, (bytes, bytearray)):
+            token = token.encode('utf-8')
+
+        return hmac.new(_TOKEN_HMAC_KEY, token, hashlib.sha256).hexdigest()
     
     def _calculate_expiry(self, token_type: TokenType) -> datetime:
         """
@@ -109,43 +153,79 @@ class AuthenticationToken(BaseEntity):
             Expiry datetime
         """
         now = datetime.now(timezone.utc)
-        
-        if token_type == TokenType.ACCESS:
-            return now + timedelta(hours=self.ACCESS_TOKEN_EXPIRY_HOURS)
-        elif token_type == TokenType.REFRESH:
-            return now + timedelta(days=self.REFRESH_TOKEN_EXPIRY_DAYS)
-        else:
-            # Default to access token expiry
-            return now + timedelta(hours=self.ACCESS_TOKEN_EXPIRY_HOURS)
+
+        if token_type == TokenType.REFRESH:
+            return now + self._REFRESH_EXPIRY
+
+        # ACCESS and any other type default to access token expiry
+        return now + self._ACCESS_EXPIRY
     
-    def is_valid(self) -> bool:
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """
         Check if the token is valid (not revoked and not expired).
-        
+
+        Args:
+            now: Optional precomputed current time to avoid repeated
+                datetime.now calls in bulk scans
+
         Returns:
             True if token is valid, False otherwise
         """
         if self.is_revoked:
             return False
-        
-        return datetime.now(timezone.utc) < self.expires_at
-    
-    def is_expired(self) -> bool:
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        return now < self.expires_at
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """
         Check if the token has expired.
-        
+
+        Args:
+            now: Optional precomputed current time to avoid repeated
+                datetime.now calls in bulk scans
+
         Returns:
             True if expired, False otherwise
         """
-        return datetime.now(timezone.utc) >= self.expires_at
-    
-    def verify_token(self, token: str) -> bool:
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        return now >= self.expires_at
+
+    def is_expired_ts(self, now_ts: float) -> bool:
+        """
+        Check expiry against a precomputed Unix timestamp.
+
+        Args:
+            now_ts: Current time as returned by time.time()
+
+        Returns:
+            True if expired, False otherwise
+        """
+        return now_ts >= self._expires_at_ts
+
+    def is_valid_ts(self, now_ts: float) -> bool:
+        """
+        Check validity (not revoked, not expired) against a Unix timestamp.
+
+        Args:
+            now_ts: Current time as returned by time.time()
+
+        Returns:
+            True if token is valid, False otherwise
+        """
+        return not self.is_revoked and now_ts < self._expires_at_ts
+
+    def verify_token(self, token: Union[str, bytes]) -> bool:
         """
         Verify if the provided token matches this token record.
-        
+
         Args:
-            token: JWT token string to verify
-        
+            token: JWT token string (or pre-encoded bytes) to verify
+
         Returns:
             True if token matches and is valid, False otherwise
         
@@ -158,8 +238,8 @@ class AuthenticationToken(BaseEntity):
         if self.is_expired():
             return False
         
-        token_hash = self._hash_token(token)
-        return token_hash == self.token_hash
+        # Constant-time comparison against the precomputed stored digest
+        return hmac.compare_digest(self._hash_token(token), self.token_hash)
     
     def revoke(self, reason: str = "Manual revocation") -> None:
         """
@@ -202,6 +282,7 @@ class AuthenticationToken(BaseEntity):
             raise ValidationException("Cannot extend expiry of revoked token")
         
         self.expires_at += additional_time
+        self._expires_at_ts = self.expires_at.timestamp()
         self.update_timestamp()
     
     def to_dict(self) -> dict:
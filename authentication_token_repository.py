@@ -2,13 +2,20 @@
 AuthenticationTokenRepository for the User Management domain model.
 """
 
-from typing import List, Optional
-from datetime import datetime, timezone
+import bisect
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import List, Optional, Tuple, Dict
+from datetime import datetime, timezone, timedelta
 
 from base_repository import InMemoryRepository
 from authentication_token import AuthenticationToken
 from enums import TokenType
 
+# Upper bound for token ids when bisecting (expires_at, token_id) pairs
+_MAX_TOKEN_ID = '\uffff'
+
 
 class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
     """
@@ -17,21 +24,264 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
     Provides methods for finding tokens by user ID, hash, type, and status.
     Supports token lifecycle management and security operations.
     """
-    
+
+    # Maximum entries in the hot token_hash lookup cache
+    HASH_CACHE_MAX_SIZE = 1024
+
+    # Background cleanup defaults
+    CLEANUP_INTERVAL_SECONDS = 300
+    CLEANUP_BATCH_SIZE = 1000
+
+    def __init__(self):
+        """Initialize the repository with secondary indexes on user_id and is_revoked."""
+        super().__init__()
+        self.register_index('user_id')
+        self.register_index('is_revoked')
+        self.register_index('token_hash')
+        # Partitions the id space by type so type-filtered scans only touch
+        # their own bucket rather than the whole store
+        self.register_index('token_type')
+
+        # LRU cache over find_by_token_hash, invalidated on save/delete
+        self._hash_cache: 'OrderedDict[str, AuthenticationToken]' = OrderedDict()
+
+        # Timer driving periodic batched cleanup, None while stopped
+        self._cleanup_timer: Optional[threading.Timer] = None
+
+        # Per-user revocation generation: bumping a user's version
+        # invalidates every token stamped with an older one
+        self._user_token_version: Dict[str, int] = defaultdict(int)
+
+        # Sorted (expires_at, token_id) pairs plus the expiry each token is
+        # currently filed under, so expiry queries are O(log N + k)
+        self._by_expiry: List[Tuple[datetime, str]] = []
+        self._expiry_of: Dict[str, datetime] = {}
+
+        # Persistent tallies kept in sync on save/delete so get_token_stats
+        # does not need to scan storage. _counted keeps the (token_type,
+        # is_revoked) pair each token was last counted under.
+        self._counters: Dict[str, int] = {'total': 0, 'access': 0, 'refresh': 0, 'revoked': 0}
+        self._counted: Dict[str, Tuple[TokenType, bool]] = {}
+
+    def save(self, token: AuthenticationToken) -> AuthenticationToken:
+        """
+        Save a token, keeping the sorted expiry index up to date.
+
+        Args:
+            token: Token to save
+
+        Returns:
+            Saved token
+        """
+        old_values = self._index_values.get(token.id)
+        old_hash = old_values.get('token_hash') if old_values else None
+
+        saved = super().save(token)
+
+        if old_hash is not None and old_hash != saved.token_hash:
+            self._hash_cache.pop(old_hash, None)
+
+        old_expiry = self._expiry_of.get(saved.id)
+        if old_expiry != saved.expires_at:
+            if old_expiry is not None:
+                self._discard_expiry_entry(saved.id, old_expiry)
+            bisect.insort(self._by_expiry, (saved.expires_at, saved.id))
+            self._expiry_of[saved.id] = saved.expires_at
+
+        # Stamp new tokens with their user's current revocation generation
+        if saved.id not in self._counted:
+            saved.token_version = self._user_token_version[saved.user_id]
+
+        self._count_token(saved)
+
+        return saved
+
+    def delete_by_id(self, entity_id: str) -> bool:
+        """
+        Delete a token, keeping the sorted expiry index up to date.
+
+        Args:
+            entity_id: ID of the token to delete
+
+        Returns:
+            True if the token was deleted, False if not found
+        """
+        token = self._storage.get(entity_id)
+
+        if not super().delete_by_id(entity_id):
+            return False
+
+        self._hash_cache.pop(token.token_hash, None)
+
+        expires_at = self._expiry_of.pop(entity_id, None)
+        if expires_at is not None:
+            self._discard_expiry_entry(entity_id, expires_at)
+
+        counted = self._counted.pop(entity_id, None)
+        if counted is not None:
+            token_type, is_revoked = counted
+            self._counters['total'] -= 1
+            if token_type == TokenType.ACCESS:
+                self._counters['access'] -= 1
+            elif token_type == TokenType.REFRESH:
+                self._counters['refresh'] -= 1
+            if is_revoked:
+                self._counters['revoked'] -= 1
+
+        return True
+
+    def bulk_delete(self, entity_ids) -> int:
+        """
+        Delete a batch of tokens, keeping caches and tallies consistent.
+
+        Args:
+            entity_ids: IDs of the tokens to delete
+
+        Returns:
+            Number of tokens deleted
+        """
+        ids = [entity_id for entity_id in entity_ids if entity_id in self._storage]
+        if not ids:
+            return 0
+
+        for entity_id in ids:
+            self._hash_cache.pop(self._storage[entity_id].token_hash, None)
+            self._expiry_of.pop(entity_id, None)
+
+            counted = self._counted.pop(entity_id, None)
+            if counted is not None:
+                token_type, is_revoked = counted
+                self._counters['total'] -= 1
+                if token_type == TokenType.ACCESS:
+                    self._counters['access'] -= 1
+                elif token_type == TokenType.REFRESH:
+                    self._counters['refresh'] -= 1
+                if is_revoked:
+                    self._counters['revoked'] -= 1
+
+        # One filtering pass over the expiry index beats a bisected delete
+        # per token for batch-sized removals
+        dropped = set(ids)
+        self._by_expiry = [pair for pair in self._by_expiry if pair[1] not in dropped]
+
+        return super().bulk_delete(ids)
+
+    def clear(self) -> None:
+        """Clear all tokens and the expiry index."""
+        super().clear()
+        self._by_expiry.clear()
+        self._expiry_of.clear()
+        self._counted.clear()
+        self._counters = {'total': 0, 'access': 0, 'refresh': 0, 'revoked': 0}
+        self._hash_cache.clear()
+
+    def _count_token(self, token: AuthenticationToken) -> None:
+        """Refresh the cached counters for a token on save."""
+        counted = self._counted.get(token.id)
+
+        if counted is None:
+            self._counters['total'] += 1
+            if token.token_type == TokenType.ACCESS:
+                self._counters['access'] += 1
+            elif token.token_type == TokenType.REFRESH:
+                self._counters['refresh'] += 1
+            if token.is_revoked:
+                self._counters['revoked'] += 1
+        elif counted[1] != token.is_revoked:
+            self._counters['revoked'] += 1 if token.is_revoked else -1
+
+        self._counted[token.id] = (token.token_type, token.is_revoked)
+
+    def _discard_expiry_entry(self, token_id: str, expires_at: datetime) -> None:
+        """Remove one (expires_at, token_id) pair from the sorted index."""
+        i = bisect.bisect_left(self._by_expiry, (expires_at, token_id))
+        if i < len(self._by_expiry) and self._by_expiry[i] == (expires_at, token_id):
+            del self._by_expiry[i]
+
+    def _expired_prefix_length(self, now: datetime) -> int:
+        """Number of leading expiry index entries with expires_at <= now."""
+        return bisect.bisect_right(self._by_expiry, (now, _MAX_TOKEN_ID))
+
+    def current_token_version(self, user_id: str) -> int:
+        """
+        Get the current revocation generation for a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Current token version for the user
+        """
+        return self._user_token_version.get(user_id, 0) if user_id else 0
+
+    def is_token_current(self, token: AuthenticationToken) -> bool:
+        """
+        Check whether a token survived all mass revocations for its user.
+
+        Args:
+            token: Token to check
+
+        Returns:
+            True if the token's version matches the user's current one
+        """
+        return token.token_version >= self._user_token_version.get(token.user_id, 0)
+
+    def _bulk_mark_revoked(self, tokens: List[AuthenticationToken], reason: str) -> int:
+        """
+        Revoke every still-valid token in a batch.
+
+        Entities are mutated in place; the is_revoked index, its value
+        snapshots and the cached counters are refreshed with one batched
+        set update instead of a per-token save() round-trip.
+
+        Args:
+            tokens: Candidate tokens to revoke
+            reason: Reason for revocation
+
+        Returns:
+            Number of tokens revoked
+        """
+        now = datetime.now(timezone.utc)
+        revoked_ids = set()
+
+        for token in tokens:
+            if token.is_valid(now):
+                token.revoke(reason)
+                revoked_ids.add(token.id)
+                self._counted[token.id] = (token.token_type, True)
+
+        if not revoked_ids:
+            return 0
+
+        self._counters['revoked'] += len(revoked_ids)
+
+        buckets = self._indexes['is_revoked']
+        false_bucket = buckets.get(False)
+        if false_bucket is not None:
+            false_bucket -= revoked_ids
+            if not false_bucket:
+                del buckets[False]
+        buckets.setdefault(True, set()).update(revoked_ids)
+
+        for token_id in revoked_ids:
+            self._index_values[token_id]['is_revoked'] = True
+
+        return len(revoked_ids)
+
     def find_by_user_id(self, user_id: str) -> List[AuthenticationToken]:
         """
         Find all authentication tokens for a user.
-        
+
         Args:
             user_id: User ID to search for
-        
+
         Returns:
             List of authentication tokens for the user
         """
         if not user_id:
             return []
-        
-        return self.find_by_attribute('user_id', user_id.strip())
+
+        return self.find_by_indexed_attribute('user_id', user_id)
     
     def find_by_token_hash(self, token_hash: str) -> Optional[AuthenticationToken]:
         """
@@ -45,8 +295,22 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         """
         if not token_hash:
             return None
-        
-        return self.find_first_by_attribute('token_hash', token_hash.strip())
+
+        cached = self._hash_cache.get(token_hash)
+        if cached is not None:
+            self._hash_cache.move_to_end(token_hash)
+            return cached
+
+        matches = self.find_by_indexed_attribute('token_hash', token_hash)
+        if not matches:
+            return None
+
+        token = matches[0]
+        self._hash_cache[token_hash] = token
+        if len(self._hash_cache) > self.HASH_CACHE_MAX_SIZE:
+            self._hash_cache.popitem(last=False)
+
+        return token
     
     def find_by_user_and_type(self, user_id: str, token_type: TokenType) -> List[AuthenticationToken]:
         """
@@ -61,11 +325,11 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         """
         if not user_id:
             return []
-        
-        return self.find_by_multiple_attributes(
-            user_id=user_id.strip(),
-            token_type=token_type
-        )
+
+        return [
+            token for token in self.find_by_indexed_attribute('user_id', user_id)
+            if token.token_type == token_type
+        ]
     
     def find_valid_tokens_by_user(self, user_id: str) -> List[AuthenticationToken]:
         """
@@ -77,8 +341,11 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             List of valid tokens for the user
         """
-        tokens = self.find_by_user_id(user_id)
-        return [token for token in tokens if token.is_valid()]
+        now_ts = time.time()
+        return [
+            token for token in self.find_by_user_id(user_id)
+            if token.is_valid_ts(now_ts) and self.is_token_current(token)
+        ]
     
     def find_expired_tokens(self) -> List[AuthenticationToken]:
         """
@@ -87,11 +354,14 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             List of expired tokens
         """
-        expired = []
-        for token in self.find_all():
-            if token.is_expired() and not token.is_revoked:
-                expired.append(token)
-        return expired
+        now = datetime.now(timezone.utc)
+        prefix = self._expired_prefix_length(now)
+
+        return [
+            self._storage[token_id]
+            for _, token_id in self._by_expiry[:prefix]
+            if not self._storage[token_id].is_revoked
+        ]
     
     def find_revoked_tokens(self) -> List[AuthenticationToken]:
         """
@@ -100,7 +370,7 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             List of revoked tokens
         """
-        return self.find_by_attribute('is_revoked', True)
+        return self.find_by_indexed_attribute('is_revoked', True)
     
     def find_active_tokens(self) -> List[AuthenticationToken]:
         """
@@ -109,11 +379,11 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             List of active tokens
         """
-        active = []
-        for token in self.find_all():
-            if token.is_valid():
-                active.append(token)
-        return active
+        now_ts = time.time()
+        return [
+            token for token in self.iter_all()
+            if token.is_valid_ts(now_ts) and self.is_token_current(token)
+        ]
     
     def find_tokens_by_type(self, token_type: TokenType) -> List[AuthenticationToken]:
         """
@@ -125,7 +395,7 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             List of tokens of the specified type
         """
-        return self.find_by_attribute('token_type', token_type)
+        return self.find_by_indexed_attribute('token_type', token_type)
     
     def find_tokens_by_ip_address(self, ip_address: str) -> List[AuthenticationToken]:
         """
@@ -140,28 +410,34 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         if not ip_address:
             return []
         
-        return self.find_by_attribute('ip_address', ip_address.strip())
+        return self.find_by_attribute('ip_address', ip_address)
     
     def revoke_user_tokens(self, user_id: str, reason: str = "User logout") -> int:
         """
         Revoke all active tokens for a user.
-        
+
+        The user's revocation generation is bumped first so stale token
+        instances fail is_token_current immediately; the outstanding
+        records are then flipped through the batched revocation path (one
+        set update per index, no per-token save round-trips) so the
+        is_revoked index, find_revoked_tokens and get_token_stats keep
+        reporting the truth.
+
         Args:
             user_id: User ID
             reason: Reason for revocation
-        
+
         Returns:
             Number of tokens revoked
         """
-        active_tokens = self.find_valid_tokens_by_user(user_id)
-        count = 0
-        
-        for token in active_tokens:
-            token.revoke(reason)
-            self.save(token)
-            count += 1
-        
-        return count
+        if not user_id:
+            return 0
+
+        self._user_token_version[user_id] += 1
+
+        return self._bulk_mark_revoked(
+            self.find_by_indexed_attribute('user_id', user_id), reason
+        )
     
     def revoke_tokens_by_type(self, user_id: str, token_type: TokenType, reason: str = "Token type revocation") -> int:
         """
@@ -175,16 +451,7 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             Number of tokens revoked
         """
-        tokens = self.find_by_user_and_type(user_id, token_type)
-        count = 0
-        
-        for token in tokens:
-            if token.is_valid():
-                token.revoke(reason)
-                self.save(token)
-                count += 1
-        
-        return count
+        return self._bulk_mark_revoked(self.find_by_user_and_type(user_id, token_type), reason)
     
     def cleanup_expired_tokens(self) -> int:
         """
@@ -193,14 +460,69 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             Number of expired tokens removed
         """
-        expired = self.find_expired_tokens()
-        count = 0
-        
-        for token in expired:
-            if self.delete_by_id(token.id):
-                count += 1
-        
-        return count
+        total = 0
+
+        while True:
+            removed = self._cleanup_batch(self.CLEANUP_BATCH_SIZE)
+            total += removed
+            if removed < self.CLEANUP_BATCH_SIZE:
+                return total
+
+    def _cleanup_batch(self, batch_size: int) -> int:
+        """
+        Remove up to batch_size expired, non-revoked tokens.
+
+        Bounding the work per call keeps individual cleanup runs short so
+        the background scheduler never stalls callers for long.
+
+        Args:
+            batch_size: Maximum number of tokens to remove
+
+        Returns:
+            Number of expired tokens removed
+        """
+        now = datetime.now(timezone.utc)
+        prefix = self._expired_prefix_length(now)
+
+        # Only the expired prefix of the sorted index is touched
+        expired_ids = [
+            token_id for _, token_id in self._by_expiry[:prefix]
+            if not self._storage[token_id].is_revoked
+        ][:batch_size]
+
+        return self.bulk_delete(expired_ids)
+
+    def start_background_cleanup(
+        self,
+        interval_seconds: int = CLEANUP_INTERVAL_SECONDS,
+        batch_size: int = CLEANUP_BATCH_SIZE
+    ) -> None:
+        """
+        Schedule periodic batched cleanup of expired tokens.
+
+        Args:
+            interval_seconds: Seconds between cleanup runs
+            batch_size: Maximum tokens removed per run
+        """
+        if self._cleanup_timer is not None:
+            return
+
+        def run() -> None:
+            self._cleanup_batch(batch_size)
+            if self._cleanup_timer is not None:
+                self._cleanup_timer = threading.Timer(interval_seconds, run)
+                self._cleanup_timer.daemon = True
+                self._cleanup_timer.start()
+
+        self._cleanup_timer = threading.Timer(interval_seconds, run)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+
+    def stop_background_cleanup(self) -> None:
+        """Stop the periodic cleanup scheduler if it is running."""
+        if self._cleanup_timer is not None:
+            self._cleanup_timer.cancel()
+            self._cleanup_timer = None
     
     def cleanup_revoked_tokens(self, older_than_days: int = 30) -> int:
         """
@@ -212,19 +534,12 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             Number of revoked tokens removed
         """
-        cutoff_date = datetime.now(timezone.utc) - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(days=older_than_days)
-        
-        revoked_tokens = self.find_revoked_tokens()
-        count = 0
-        
-        for token in revoked_tokens:
-            if token.revoked_at and token.revoked_at < cutoff_date:
-                if self.delete_by_id(token.id):
-                    count += 1
-        
-        return count
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+        return self.bulk_delete(
+            token.id for token in self.find_revoked_tokens()
+            if token.revoked_at and token.revoked_at < cutoff_date
+        )
     
     def get_token_stats(self) -> dict:
         """
@@ -233,33 +548,25 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             Dictionary with token statistics
         """
-        all_tokens = self.find_all()
-        active_count = 0
-        expired_count = 0
-        revoked_count = 0
-        access_count = 0
-        refresh_count = 0
-        
-        for token in all_tokens:
-            if token.is_revoked:
-                revoked_count += 1
-            elif token.is_expired():
-                expired_count += 1
-            else:
-                active_count += 1
-            
-            if token.token_type == TokenType.ACCESS:
-                access_count += 1
-            elif token.token_type == TokenType.REFRESH:
-                refresh_count += 1
-        
+        now = datetime.now(timezone.utc)
+        prefix = self._expired_prefix_length(now)
+
+        # Counters are kept current in save/delete; only expired-but-not-
+        # revoked needs a pass over the expired prefix of the expiry index.
+        expired_count = sum(
+            1 for _, token_id in self._by_expiry[:prefix]
+            if not self._storage[token_id].is_revoked
+        )
+        total = self._counters['total']
+        revoked_count = self._counters['revoked']
+
         return {
-            "total_tokens": len(all_tokens),
-            "active": active_count,
+            "total_tokens": total,
+            "active": total - revoked_count - expired_count,
             "expired": expired_count,
             "revoked": revoked_count,
-            "access_tokens": access_count,
-            "refresh_tokens": refresh_count
+            "access_tokens": self._counters['access'],
+            "refresh_tokens": self._counters['refresh']
         }
     
     def find_recent_tokens(self, hours: int = 24) -> List[AuthenticationToken]:
@@ -272,16 +579,9 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             List of recent tokens
         """
-        cutoff_time = datetime.now(timezone.utc) - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(hours=hours)
-        
-        recent = []
-        for token in self.find_all():
-            if token.created_at >= cutoff_time:
-                recent.append(token)
-        
-        return recent
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        return [token for token in self.iter_all() if token.created_at >= cutoff_time]
     
     def find_tokens_expiring_soon(self, hours: int = 1) -> List[AuthenticationToken]:
         """
@@ -293,16 +593,17 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             List of tokens expiring soon
         """
-        expiry_threshold = datetime.now(timezone.utc) + timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(hours=hours)
-        
-        expiring_soon = []
-        for token in self.find_all():
-            if not token.is_revoked and not token.is_expired() and token.expires_at <= expiry_threshold:
-                expiring_soon.append(token)
-        
-        return expiring_soon
+        now = datetime.now(timezone.utc)
+        expiry_threshold = now + timedelta(hours=hours)
+
+        start = self._expired_prefix_length(now)
+        end = bisect.bisect_right(self._by_expiry, (expiry_threshold, _MAX_TOKEN_ID))
+
+        return [
+            self._storage[token_id]
+            for _, token_id in self._by_expiry[start:end]
+            if not self._storage[token_id].is_revoked
+        ]
     
     def delete_by_user_id(self, user_id: str) -> int:
         """
@@ -314,14 +615,16 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             Number of tokens deleted
         """
-        tokens = self.find_by_user_id(user_id)
-        count = 0
-        
-        for token in tokens:
-            if self.delete_by_id(token.id):
-                count += 1
-        
-        return count
+        if not user_id:
+            return 0
+
+        # Grab the user's id bucket directly; bulk_delete drops the bucket
+        # itself with one set difference per affected index
+        token_ids = self._indexes['user_id'].get(user_id)
+        if not token_ids:
+            return 0
+
+        return self.bulk_delete(list(token_ids))
     
     def has_valid_token(self, user_id: str, token_type: Optional[TokenType] = None) -> bool:
         """
@@ -334,13 +637,15 @@ class AuthenticationTokenRepository(InMemoryRepository[AuthenticationToken]):
         Returns:
             True if user has valid tokens, False otherwise
         """
-        if token_type:
-            tokens = self.find_by_user_and_type(user_id, token_type)
-        else:
-            tokens = self.find_by_user_id(user_id)
-        
-        for token in tokens:
-            if token.is_valid():
-                return True
-        
-        return False
+        if not user_id:
+            return False
+
+        token_ids = self._indexes['user_id'].get(user_id, ())
+        now_ts = time.time()
+
+        return any(
+            token.is_valid_ts(now_ts)
+            and self.is_token_current(token)
+            and (token_type is None or token.token_type == token_type)
+            for token in map(self._storage.__getitem__, token_ids)
+        )
@@ -16,7 +16,11 @@ class BaseEntity:
         created_at (datetime): When the entity was created (UTC)
         updated_at (datetime): When the entity was last updated (UTC)
     """
-    
+
+    # Entities are stored in bulk by the in-memory repositories, so skip the
+    # per-instance __dict__ to keep them compact
+    __slots__ = ('id', 'created_at', 'updated_at')
+
     def __init__(self, entity_id: Optional[str] = None):
         """
         Initialize base entity with common attributes.
@@ -25,12 +29,20 @@ class BaseEntity:
             entity_id: Optional UUID string. If not provided, a new UUID4 will be generated.
         """
         self.id: str = entity_id or str(uuid.uuid4())
-        self.created_at: datetime = datetime.now(timezone.utc)
-        self.updated_at: datetime = datetime.now(timezone.utc)
+        # One clock read keeps created_at == updated_at for fresh entities
+        now = datetime.now(timezone.utc)
+        self.created_at: datetime = now
+        self.updated_at: datetime = now
     
-    def update_timestamp(self) -> None:
-        """Update the updated_at timestamp to current UTC time."""
-        self.updated_at = datetime.now(timezone.utc)
+    def update_timestamp(self, now: Optional[datetime] = None) -> None:
+        """
+        Update the updated_at timestamp to current UTC time.
+
+        Args:
+            now: Optional precomputed current time so callers updating
+                several fields can share a single clock read
+        """
+        self.updated_at = now if now is not None else datetime.now(timezone.utc)
     
     def __eq__(self, other) -> bool:
         """Check equality based on entity ID."""
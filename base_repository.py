@@ -2,8 +2,9 @@
 Base repository interface for the User Management domain model.
 """
 
+import operator
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic, Dict, Any
+from typing import Iterable, List, Optional, Tuple, TypeVar, Generic, Dict, Any, Set
 
 from base_entity import BaseEntity
 
@@ -22,6 +23,19 @@ class BaseRepository(ABC, Generic[T]):
     def __init__(self):
         """Initialize the repository with in-memory storage."""
         self._storage: Dict[str, T] = {}
+
+        # Secondary hash indexes: attribute name -> value -> set of entity ids.
+        # _index_values keeps the attribute values each entity was indexed
+        # under, so in-place mutations can be diffed on the next save.
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {}
+        self._index_values: Dict[str, Dict[str, Any]] = {}
+
+        # Specialized scanners compiled per attribute tuple (see _make_scanner)
+        self._scanners: Dict[Tuple[str, ...], Any] = {}
+
+        # Bumped on every write so derived caches can key on repository
+        # state instead of registering change callbacks
+        self._version = 0
     
     @abstractmethod
     def save(self, entity: T) -> T:
@@ -88,15 +102,116 @@ class BaseRepository(ABC, Generic[T]):
     def count(self) -> int:
         """
         Get the total count of entities in the repository.
-        
+
         Returns:
             Total count of entities
         """
         return len(self._storage)
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic write counter, bumped on every mutation.
+
+        Derived caches key on this to detect whether the repository has
+        changed since they were last populated.
+
+        Returns:
+            Current write counter value
+        """
+        return self._version
     
+    def register_index(self, attribute_name: str) -> None:
+        """
+        Register a secondary hash index over an entity attribute.
+
+        Indexed lookups via find_by_indexed_attribute are O(1) + O(k)
+        instead of a full storage scan.
+
+        Args:
+            attribute_name: Name of the attribute to index
+        """
+        if attribute_name in self._indexes:
+            return
+
+        buckets: Dict[Any, Set[str]] = {}
+        self._indexes[attribute_name] = buckets
+
+        # Index any entities already in storage
+        for entity in self._storage.values():
+            value = getattr(entity, attribute_name)
+            buckets.setdefault(value, set()).add(entity.id)
+            self._index_values.setdefault(entity.id, {})[attribute_name] = value
+
+    def _update_indexes(self, entity: T) -> None:
+        """Refresh all secondary index entries for an entity on save."""
+        if not self._indexes:
+            return
+
+        old_values = self._index_values.get(entity.id)
+        new_values = {}
+
+        for attribute_name, buckets in self._indexes.items():
+            value = getattr(entity, attribute_name)
+            new_values[attribute_name] = value
+
+            if old_values is not None:
+                old_value = old_values.get(attribute_name, value)
+                if old_value == value:
+                    continue
+                old_bucket = buckets.get(old_value)
+                if old_bucket is not None:
+                    old_bucket.discard(entity.id)
+                    if not old_bucket:
+                        del buckets[old_value]
+
+            buckets.setdefault(value, set()).add(entity.id)
+
+        self._index_values[entity.id] = new_values
+
+    def _remove_from_indexes(self, entity_id: str) -> None:
+        """Drop all secondary index entries for an entity on delete."""
+        if not self._indexes:
+            return
+
+        old_values = self._index_values.pop(entity_id, None)
+        if old_values is None:
+            return
+
+        for attribute_name, value in old_values.items():
+            buckets = self._indexes.get(attribute_name)
+            if buckets is None:
+                continue
+            bucket = buckets.get(value)
+            if bucket is not None:
+                bucket.discard(entity_id)
+                if not bucket:
+                    del buckets[value]
+
+    def find_by_indexed_attribute(self, attribute_name: str, value: Any) -> List[T]:
+        """
+        Find entities through a registered secondary index.
+
+        Args:
+            attribute_name: Name of the indexed attribute
+            value: Value to look up
+
+        Returns:
+            List of entities matching the indexed value
+        """
+        entity_ids = self._indexes[attribute_name].get(value)
+        if not entity_ids:
+            return []
+
+        return [self._storage[entity_id] for entity_id in entity_ids]
+
     def clear(self) -> None:
         """Clear all entities from the repository."""
         self._storage.clear()
+        self._index_values.clear()
+        for buckets in self._indexes.values():
+            buckets.clear()
+        self._version += 1
 
 
 class InMemoryRepository(BaseRepository[T]):
@@ -123,8 +238,10 @@ class InMemoryRepository(BaseRepository[T]):
         # Update timestamp if entity already exists
         if entity.id in self._storage:
             entity.update_timestamp()
-        
+
         self._storage[entity.id] = entity
+        self._update_indexes(entity)
+        self._version += 1
         return entity
     
     def find_by_id(self, entity_id: str) -> Optional[T]:
@@ -142,12 +259,24 @@ class InMemoryRepository(BaseRepository[T]):
     def find_all(self) -> List[T]:
         """
         Find all entities in the repository.
-        
+
         Returns:
             List of all entities
         """
         return list(self._storage.values())
-    
+
+    def iter_all(self):
+        """
+        Iterate all entities without materializing a snapshot list.
+
+        Prefer this over find_all for internal scans; the returned view
+        must not be consumed while entities are being added or removed.
+
+        Returns:
+            View over all stored entities
+        """
+        return self._storage.values()
+
     def delete_by_id(self, entity_id: str) -> bool:
         """
         Delete an entity by its ID.
@@ -160,21 +289,67 @@ class InMemoryRepository(BaseRepository[T]):
         """
         if entity_id in self._storage:
             del self._storage[entity_id]
+            self._remove_from_indexes(entity_id)
+            self._version += 1
             return True
         return False
     
     def exists_by_id(self, entity_id: str) -> bool:
         """
         Check if an entity exists by its ID.
-        
+
         Args:
             entity_id: ID of the entity to check
-        
+
         Returns:
             True if entity exists, False otherwise
         """
         return entity_id in self._storage
-    
+
+    def bulk_delete(self, entity_ids: Iterable[str]) -> int:
+        """
+        Delete a batch of entities by id.
+
+        Secondary index maintenance is batched: ids are grouped by the
+        indexed value they were filed under, then each affected bucket is
+        shrunk with a single set difference instead of one discard per
+        entity.
+
+        Args:
+            entity_ids: IDs of the entities to delete
+
+        Returns:
+            Number of entities deleted
+        """
+        ids = [entity_id for entity_id in entity_ids if entity_id in self._storage]
+        if not ids:
+            return 0
+
+        if self._indexes:
+            grouped: Dict[Tuple[str, Any], Set[str]] = {}
+            for entity_id in ids:
+                old_values = self._index_values.pop(entity_id, None)
+                if old_values is None:
+                    continue
+                for attribute_name, value in old_values.items():
+                    grouped.setdefault((attribute_name, value), set()).add(entity_id)
+
+            for (attribute_name, value), bucket_ids in grouped.items():
+                buckets = self._indexes.get(attribute_name)
+                if buckets is None:
+                    continue
+                bucket = buckets.get(value)
+                if bucket is not None:
+                    bucket -= bucket_ids
+                    if not bucket:
+                        del buckets[value]
+
+        for entity_id in ids:
+            del self._storage[entity_id]
+
+        self._version += 1
+        return len(ids)
+
     def find_by_attribute(self, attribute_name: str, value: Any) -> List[T]:
         """
         Find entities by a specific attribute value.
@@ -186,12 +361,8 @@ class InMemoryRepository(BaseRepository[T]):
         Returns:
             List of entities matching the criteria
         """
-        results = []
-        for entity in self._storage.values():
-            if hasattr(entity, attribute_name):
-                if getattr(entity, attribute_name) == value:
-                    results.append(entity)
-        return results
+        get = operator.attrgetter(attribute_name)
+        return [entity for entity in self._storage.values() if get(entity) == value]
     
     def find_first_by_attribute(self, attribute_name: str, value: Any) -> Optional[T]:
         """
@@ -204,32 +375,57 @@ class InMemoryRepository(BaseRepository[T]):
         Returns:
             First entity matching the criteria, or None if not found
         """
+        get = operator.attrgetter(attribute_name)
         for entity in self._storage.values():
-            if hasattr(entity, attribute_name):
-                if getattr(entity, attribute_name) == value:
-                    return entity
+            if get(entity) == value:
+                return entity
         return None
     
+    def _make_scanner(self, attr_names: Tuple[str, ...]):
+        """
+        Compile and cache a scanner specialized to an attribute tuple.
+
+        The generated function reads each attribute directly and compares
+        in one tight comprehension, so repeated queries over the same
+        attributes skip per-call getattr dispatch entirely.
+
+        Args:
+            attr_names: Attribute names the scanner filters on
+
+        Returns:
+            Callable taking (storage, *values) and returning matches
+        """
+        scanner = self._scanners.get(attr_names)
+        if scanner is None:
+            predicate = ' and '.join(
+                f'entity.{name} == v{i}' for i, name in enumerate(attr_names)
+            )
+            args = ', '.join(f'v{i}' for i in range(len(attr_names)))
+            namespace: Dict[str, Any] = {}
+            exec(
+                f'def scan(storage, {args}):\n'
+                f'    return [entity for entity in storage.values() if {predicate}]\n',
+                namespace
+            )
+            scanner = self._scanners[attr_names] = namespace['scan']
+
+        return scanner
+
     def find_by_multiple_attributes(self, **kwargs) -> List[T]:
         """
         Find entities by multiple attribute values.
-        
+
         Args:
             **kwargs: Attribute name-value pairs to search by
-        
+
         Returns:
             List of entities matching all criteria
         """
-        results = []
-        for entity in self._storage.values():
-            match = True
-            for attr_name, attr_value in kwargs.items():
-                if not hasattr(entity, attr_name) or getattr(entity, attr_name) != attr_value:
-                    match = False
-                    break
-            if match:
-                results.append(entity)
-        return results
+        if not kwargs:
+            return list(self._storage.values())
+
+        scanner = self._make_scanner(tuple(kwargs.keys()))
+        return scanner(self._storage, *kwargs.values())
     
     def update(self, entity: T) -> T:
         """
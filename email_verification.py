@@ -3,12 +3,18 @@ EmailVerification entity for the User Management domain model.
 """
 
 import secrets
+import sys
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
 from base_entity import BaseEntity
 from exceptions import ValidationException, ExpiredTokenException
 
+# Token generator bound at module scope so the hot signup path skips the
+# method-dispatch and class-attribute hops
+_TOKEN_LENGTH = 32
+_generate_token = secrets.token_urlsafe
+
 
 class EmailVerification(BaseEntity):
     """
@@ -28,10 +34,20 @@ class EmailVerification(BaseEntity):
         updated_at (datetime): When the verification was last updated
     """
     
+    __slots__ = (
+        'user_id', 'email', 'verification_token', 'token_expires_at',
+        '_token_expires_at_ts', 'is_verified', 'verified_at',
+        'resend_count', 'last_resend_at'
+    )
+
     # Configuration constants
     TOKEN_EXPIRY_DAYS = 7
     MAX_RESEND_COUNT = 3
-    TOKEN_LENGTH = 32
+
+    # Field tuples driving to_dict: plain values copied as-is, datetimes
+    # formatted (or None) in one pass
+    _DICT_FIELDS = ('id', 'user_id', 'email', 'verification_token', 'is_verified', 'resend_count')
+    _DATETIME_FIELDS = ('token_expires_at', 'verified_at', 'created_at', 'last_resend_at', 'updated_at')
     
     def __init__(
         self,
@@ -54,8 +70,12 @@ class EmailVerification(BaseEntity):
         
         self.user_id = self._validate_user_id(user_id)
         self.email = self._validate_email(email)
-        self.verification_token = self._generate_verification_token()
-        self.token_expires_at = datetime.now(timezone.utc) + timedelta(days=self.TOKEN_EXPIRY_DAYS)
+        self.verification_token = _generate_token(_TOKEN_LENGTH)
+        # Reuse the creation timestamp instead of reading the clock again
+        self.token_expires_at = self.created_at + timedelta(days=self.TOKEN_EXPIRY_DAYS)
+        # Unix-timestamp mirror of token_expires_at for cheap scalar
+        # comparisons in bulk repository scans
+        self._token_expires_at_ts = self.token_expires_at.timestamp()
         self.is_verified = False
         self.verified_at: Optional[datetime] = None
         self.resend_count = 0
@@ -65,22 +85,15 @@ class EmailVerification(BaseEntity):
         """Validate user ID."""
         if not user_id or not user_id.strip():
             raise ValidationException("User ID is required")
-        return user_id.strip()
-    
+        # Interned so repeated index lookups compare keys by identity
+        return sys.intern(user_id.strip())
+
     def _validate_email(self, email: str) -> str:
-        """Validate email format."""
+        """Validate and canonicalize email (stored lowercased/stripped)."""
         if not email or not email.strip():
             raise ValidationException("Email is required")
-        return email.strip().lower()
-    
-    def _generate_verification_token(self) -> str:
-        """
-        Generate a secure random verification token.
-        
-        Returns:
-            Secure random token string
-        """
-        return secrets.token_urlsafe(self.TOKEN_LENGTH)
+        # Interned so repeated index lookups compare keys by identity
+        return sys.intern(email.strip().lower())
     
     def is_token_valid(self) -> bool:
         """
@@ -140,11 +153,13 @@ class EmailVerification(BaseEntity):
         if self.resend_count >= self.MAX_RESEND_COUNT:
             raise ValidationException(f"Maximum resend limit ({self.MAX_RESEND_COUNT}) exceeded")
         
-        # Generate new token and extend expiry
-        self.verification_token = self._generate_verification_token()
-        self.token_expires_at = datetime.now(timezone.utc) + timedelta(days=self.TOKEN_EXPIRY_DAYS)
+        # Generate new token and extend expiry; one clock read covers both
+        now = datetime.now(timezone.utc)
+        self.verification_token = _generate_token(_TOKEN_LENGTH)
+        self.token_expires_at = now + timedelta(days=self.TOKEN_EXPIRY_DAYS)
+        self._token_expires_at_ts = self.token_expires_at.timestamp()
         self.resend_count += 1
-        self.last_resend_at = datetime.now(timezone.utc)
+        self.last_resend_at = now
         self.update_timestamp()
         
         return self.verification_token
@@ -157,6 +172,18 @@ class EmailVerification(BaseEntity):
             True if expired, False otherwise
         """
         return datetime.now(timezone.utc) >= self.token_expires_at
+
+    def is_expired_ts(self, now_ts: float) -> bool:
+        """
+        Check token expiry against a precomputed Unix timestamp.
+
+        Args:
+            now_ts: Current time as returned by time.time()
+
+        Returns:
+            True if expired, False otherwise
+        """
+        return now_ts >= self._token_expires_at_ts
     
     def get_time_until_expiry(self) -> timedelta:
         """
@@ -181,19 +208,11 @@ class EmailVerification(BaseEntity):
     
     def to_dict(self) -> dict:
         """Convert verification to dictionary representation."""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "email": self.email,
-            "verification_token": self.verification_token,
-            "token_expires_at": self.token_expires_at.isoformat(),
-            "is_verified": self.is_verified,
-            "verified_at": self.verified_at.isoformat() if self.verified_at else None,
-            "created_at": self.created_at.isoformat(),
-            "resend_count": self.resend_count,
-            "last_resend_at": self.last_resend_at.isoformat() if self.last_resend_at else None,
-            "updated_at": self.updated_at.isoformat()
-        }
+        result = {field: getattr(self, field) for field in self._DICT_FIELDS}
+        for field in self._DATETIME_FIELDS:
+            value = getattr(self, field)
+            result[field] = value.isoformat() if value else None
+        return result
     
     def __str__(self) -> str:
         """String representation of the verification."""
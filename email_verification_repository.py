@@ -2,12 +2,22 @@
 EmailVerificationRepository for the User Management domain model.
 """
 
-from typing import List, Optional
-from datetime import datetime, timezone
+import bisect
+import sys
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from datetime import datetime, timezone, timedelta
 
 from base_repository import InMemoryRepository
 from email_verification import EmailVerification
 
+# Upper bound for verification ids when bisecting (expires_at, id) pairs
+_MAX_VERIFICATION_ID = '\uffff'
+
+# Bloom filter sizing for the token lookup fast path: 2^20 bits, 3 probe
+# positions carved out of one 64-bit string hash
+_BLOOM_BITS = 1 << 20
+_BLOOM_MASK = _BLOOM_BITS - 1
+
 
 class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
     """
@@ -16,7 +26,225 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
     Provides methods for finding verifications by user ID, token, email, and status.
     Supports managing email verification lifecycle.
     """
-    
+
+    def __init__(self):
+        """Initialize the repository with secondary indexes on the hot lookup keys."""
+        super().__init__()
+        self.register_index('verification_token')
+        self.register_index('user_id')
+        self.register_index('email')
+        # resend_count only takes values 0..MAX_RESEND_COUNT, so threshold
+        # queries union a handful of small buckets instead of scanning
+        self.register_index('resend_count')
+
+        # Most recent verification per user, precomputed on save so
+        # find_latest_by_user_id never scans the user's bucket
+        self._latest_by_user: Dict[str, EmailVerification] = {}
+
+        # Memoized get_verification_stats result, dropped on any write
+        self._stats_cache: Optional[dict] = None
+
+        # Sorted (token_expires_at, id) pairs plus the expiry each
+        # verification is filed under, so expiry queries are O(log N + k).
+        # Resends re-file the entry via the save-time diff.
+        self._by_expiry: List[Tuple[datetime, str]] = []
+        self._expiry_of: Dict[str, datetime] = {}
+
+        # Sorted (created_at, id) pairs; created_at never changes, so
+        # entries are inserted once and recency queries bisect the suffix
+        self._by_created_at: List[Tuple[datetime, str]] = []
+
+        # Composite (user_id, email, is_verified) -> id buckets so the
+        # verified/pending checks are one dict probe. _pair_of snapshots
+        # the key each entry is filed under for re-filing on save.
+        self._by_pair: Dict[Tuple[str, str, bool], Set[str]] = {}
+        self._pair_of: Dict[str, Tuple[str, str, bool]] = {}
+
+        # Bloom filter fronting the token index so brute-forced tokens are
+        # rejected from three byte probes without touching the index dict.
+        # Deletions leave bits set (blooms cannot unset); the filter is
+        # rebuilt from the live tokens during expired-verification cleanup.
+        self._token_bloom = bytearray(_BLOOM_BITS >> 3)
+
+    def save(self, verification: EmailVerification) -> EmailVerification:
+        """
+        Save a verification, keeping the latest-per-user cache current.
+
+        Args:
+            verification: Verification to save
+
+        Returns:
+            Saved verification
+        """
+        is_new = verification.id not in self._storage
+
+        saved = super().save(verification)
+        self._stats_cache = None
+
+        if is_new:
+            bisect.insort(self._by_created_at, (saved.created_at, saved.id))
+
+        old_expiry = self._expiry_of.get(saved.id)
+        if old_expiry != saved.token_expires_at:
+            if old_expiry is not None:
+                self._discard_expiry_entry(saved.id, old_expiry)
+            bisect.insort(self._by_expiry, (saved.token_expires_at, saved.id))
+            self._expiry_of[saved.id] = saved.token_expires_at
+
+        pair = (saved.user_id, saved.email, saved.is_verified)
+        old_pair = self._pair_of.get(saved.id)
+        if old_pair != pair:
+            if old_pair is not None:
+                self._discard_pair_entry(saved.id, old_pair)
+            self._by_pair.setdefault(pair, set()).add(saved.id)
+            self._pair_of[saved.id] = pair
+
+        latest = self._latest_by_user.get(saved.user_id)
+        if latest is None or saved.created_at >= latest.created_at:
+            self._latest_by_user[saved.user_id] = saved
+
+        # Idempotent, and covers the fresh token a resend generates
+        self._bloom_add(saved.verification_token)
+
+        return saved
+
+    def delete_by_id(self, entity_id: str) -> bool:
+        """
+        Delete a verification, keeping the latest-per-user cache current.
+
+        Args:
+            entity_id: ID of the verification to delete
+
+        Returns:
+            True if the verification was deleted, False if not found
+        """
+        verification = self._storage.get(entity_id)
+
+        if not super().delete_by_id(entity_id):
+            return False
+
+        self._stats_cache = None
+
+        expires_at = self._expiry_of.pop(entity_id, None)
+        if expires_at is not None:
+            self._discard_expiry_entry(entity_id, expires_at)
+
+        i = bisect.bisect_left(self._by_created_at, (verification.created_at, entity_id))
+        if i < len(self._by_created_at) and self._by_created_at[i] == (verification.created_at, entity_id):
+            del self._by_created_at[i]
+
+        old_pair = self._pair_of.pop(entity_id, None)
+        if old_pair is not None:
+            self._discard_pair_entry(entity_id, old_pair)
+
+        # Recompute only if the deleted entry was the cached latest
+        if self._latest_by_user.get(verification.user_id) is verification:
+            remaining = self.find_by_indexed_attribute('user_id', verification.user_id)
+            if remaining:
+                self._latest_by_user[verification.user_id] = max(
+                    remaining, key=lambda v: v.created_at
+                )
+            else:
+                del self._latest_by_user[verification.user_id]
+
+        return True
+
+    def bulk_delete(self, entity_ids) -> int:
+        """
+        Delete a batch of verifications, repairing caches afterwards.
+
+        Args:
+            entity_ids: IDs of the verifications to delete
+
+        Returns:
+            Number of verifications deleted
+        """
+        ids = [entity_id for entity_id in entity_ids if entity_id in self._storage]
+        if not ids:
+            return 0
+
+        affected_users = {self._storage[entity_id].user_id for entity_id in ids}
+        for entity_id in ids:
+            self._expiry_of.pop(entity_id, None)
+            old_pair = self._pair_of.pop(entity_id, None)
+            if old_pair is not None:
+                self._discard_pair_entry(entity_id, old_pair)
+
+        dropped = set(ids)
+        self._by_expiry = [pair for pair in self._by_expiry if pair[1] not in dropped]
+        self._by_created_at = [pair for pair in self._by_created_at if pair[1] not in dropped]
+
+        count = super().bulk_delete(ids)
+        self._stats_cache = None
+
+        # Repair the latest-per-user cache once per affected user
+        for user_id in affected_users:
+            remaining = self.find_by_indexed_attribute('user_id', user_id)
+            if remaining:
+                self._latest_by_user[user_id] = max(remaining, key=lambda v: v.created_at)
+            else:
+                self._latest_by_user.pop(user_id, None)
+
+        return count
+
+    def clear(self) -> None:
+        """Clear all verifications and the latest-per-user cache."""
+        super().clear()
+        self._latest_by_user.clear()
+        self._stats_cache = None
+        self._by_expiry.clear()
+        self._expiry_of.clear()
+        self._by_created_at.clear()
+        self._by_pair.clear()
+        self._pair_of.clear()
+        self._token_bloom = bytearray(_BLOOM_BITS >> 3)
+
+    @staticmethod
+    def _bloom_positions(token: str) -> Tuple[int, int, int]:
+        """Derive the three bloom bit positions for a token."""
+        h = hash(token)
+        return h & _BLOOM_MASK, (h >> 20) & _BLOOM_MASK, (h >> 40) & _BLOOM_MASK
+
+    def _bloom_add(self, token: str) -> None:
+        """Set the bloom bits for a token."""
+        bloom = self._token_bloom
+        for position in self._bloom_positions(token):
+            bloom[position >> 3] |= 1 << (position & 7)
+
+    def _bloom_might_contain(self, token: str) -> bool:
+        """Check whether a token can possibly be in the token index."""
+        bloom = self._token_bloom
+        return all(
+            bloom[position >> 3] & (1 << (position & 7))
+            for position in self._bloom_positions(token)
+        )
+
+    def _bloom_rebuild(self) -> None:
+        """Rebuild the token bloom from the live token index."""
+        bloom = bytearray(_BLOOM_BITS >> 3)
+        for token in self._indexes['verification_token']:
+            for position in self._bloom_positions(token):
+                bloom[position >> 3] |= 1 << (position & 7)
+        self._token_bloom = bloom
+
+    def _discard_pair_entry(self, verification_id: str, pair: Tuple[str, str, bool]) -> None:
+        """Remove an entry from its composite (user, email, verified) bucket."""
+        bucket = self._by_pair.get(pair)
+        if bucket is not None:
+            bucket.discard(verification_id)
+            if not bucket:
+                del self._by_pair[pair]
+
+    def _discard_expiry_entry(self, verification_id: str, expires_at: datetime) -> None:
+        """Remove one (expires_at, id) pair from the sorted index."""
+        i = bisect.bisect_left(self._by_expiry, (expires_at, verification_id))
+        if i < len(self._by_expiry) and self._by_expiry[i] == (expires_at, verification_id):
+            del self._by_expiry[i]
+
+    def _expired_prefix_length(self, now: datetime) -> int:
+        """Number of leading expiry index entries with expires_at <= now."""
+        return bisect.bisect_right(self._by_expiry, (now, _MAX_VERIFICATION_ID))
+
     def find_by_user_id(self, user_id: str) -> List[EmailVerification]:
         """
         Find all email verifications for a user.
@@ -30,8 +258,24 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         if not user_id:
             return []
         
-        return self.find_by_attribute('user_id', user_id.strip())
-    
+        return self.find_by_indexed_attribute('user_id', sys.intern(user_id.strip()))
+
+    def iter_by_user_id(self, user_id: str) -> Iterator[EmailVerification]:
+        """
+        Iterate over a user's verifications without building a list.
+
+        Args:
+            user_id: User ID to iterate over
+
+        Yields:
+            Email verifications belonging to the user
+        """
+        if not user_id:
+            return
+
+        for verification_id in self._indexes['user_id'].get(sys.intern(user_id.strip()), ()):
+            yield self._storage[verification_id]
+
     def find_by_verification_token(self, token: str) -> Optional[EmailVerification]:
         """
         Find email verification by token.
@@ -44,8 +288,16 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         """
         if not token:
             return None
-        
-        return self.find_first_by_attribute('verification_token', token.strip())
+
+        token = token.strip()
+
+        # Definitely-absent tokens (the bulk of any brute-force traffic)
+        # fail the bloom probes and never reach the index
+        if not self._bloom_might_contain(token):
+            return None
+
+        matches = self.find_by_indexed_attribute('verification_token', token)
+        return matches[0] if matches else None
     
     def find_by_email(self, email: str) -> List[EmailVerification]:
         """
@@ -59,9 +311,10 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         """
         if not email:
             return []
-        
-        email_lower = email.lower().strip()
-        return self.find_by_attribute('email', email_lower)
+
+        # Stored emails are canonical (lowercased/stripped at entity
+        # construction), so only the caller-supplied value needs normalizing
+        return self.find_by_indexed_attribute('email', sys.intern(email.strip().lower()))
     
     def find_latest_by_user_id(self, user_id: str) -> Optional[EmailVerification]:
         """
@@ -73,12 +326,10 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             Latest EmailVerification if found, None otherwise
         """
-        verifications = self.find_by_user_id(user_id)
-        if not verifications:
+        if not user_id:
             return None
-        
-        # Sort by created_at descending and return the first (latest)
-        return max(verifications, key=lambda v: v.created_at)
+
+        return self._latest_by_user.get(sys.intern(user_id.strip()))
     
     def find_verified_by_user_id(self, user_id: str) -> List[EmailVerification]:
         """
@@ -90,8 +341,7 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             List of verified email verifications
         """
-        verifications = self.find_by_user_id(user_id)
-        return [v for v in verifications if v.is_verified]
+        return [v for v in self.iter_by_user_id(user_id) if v.is_verified]
     
     def find_pending_by_user_id(self, user_id: str) -> List[EmailVerification]:
         """
@@ -103,8 +353,7 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             List of pending email verifications
         """
-        verifications = self.find_by_user_id(user_id)
-        return [v for v in verifications if not v.is_verified]
+        return [v for v in self.iter_by_user_id(user_id) if not v.is_verified]
     
     def find_expired_verifications(self) -> List[EmailVerification]:
         """
@@ -113,11 +362,14 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             List of expired email verifications
         """
-        expired = []
-        for verification in self.find_all():
-            if verification.is_expired() and not verification.is_verified:
-                expired.append(verification)
-        return expired
+        now = datetime.now(timezone.utc)
+        prefix = self._expired_prefix_length(now)
+
+        return [
+            self._storage[verification_id]
+            for _, verification_id in self._by_expiry[:prefix]
+            if not self._storage[verification_id].is_verified
+        ]
     
     def find_active_verifications(self) -> List[EmailVerification]:
         """
@@ -126,11 +378,16 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             List of active email verifications
         """
-        active = []
-        for verification in self.find_all():
-            if verification.is_token_valid():
-                active.append(verification)
-        return active
+        now = datetime.now(timezone.utc)
+        prefix = self._expired_prefix_length(now)
+
+        # Everything past the expired prefix is unexpired; only the
+        # verified flag still needs checking
+        return [
+            self._storage[verification_id]
+            for _, verification_id in self._by_expiry[prefix:]
+            if not self._storage[verification_id].is_verified
+        ]
     
     def find_verifications_by_resend_count(self, min_count: int) -> List[EmailVerification]:
         """
@@ -143,9 +400,9 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
             List of verifications with high resend count
         """
         results = []
-        for verification in self.find_all():
-            if verification.resend_count >= min_count:
-                results.append(verification)
+        for count, verification_ids in self._indexes['resend_count'].items():
+            if count >= min_count:
+                results.extend(map(self._storage.__getitem__, verification_ids))
         return results
     
     def is_email_verified_for_user(self, user_id: str, email: str) -> bool:
@@ -162,13 +419,8 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         if not user_id or not email:
             return False
         
-        email_lower = email.lower().strip()
-        verifications = self.find_by_multiple_attributes(
-            user_id=user_id.strip(),
-            email=email_lower,
-            is_verified=True
-        )
-        return len(verifications) > 0
+        key = (sys.intern(user_id.strip()), sys.intern(email.strip().lower()), True)
+        return bool(self._by_pair.get(key))
     
     def has_pending_verification(self, user_id: str, email: str) -> bool:
         """
@@ -183,20 +435,21 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         """
         if not user_id or not email:
             return False
-        
-        email_lower = email.lower().strip()
-        verifications = self.find_by_multiple_attributes(
-            user_id=user_id.strip(),
-            email=email_lower,
-            is_verified=False
-        )
-        
-        # Check if any are still valid (not expired)
-        for verification in verifications:
-            if verification.is_token_valid():
-                return True
-        
-        return False
+
+        user_id = sys.intern(user_id.strip())
+        email = sys.intern(email.strip().lower())
+
+        # Fast path: resends mutate the existing record, so the user's
+        # latest verification usually answers this with one inspection
+        latest = self._latest_by_user.get(user_id)
+        if (latest is not None and latest.email == email
+                and not latest.is_verified and latest.is_token_valid()):
+            return True
+
+        # Older pending records can outlive the latest one (resends extend
+        # expiry), so fall back to the composite bucket before saying no
+        pending_ids = self._by_pair.get((user_id, email, False), ())
+        return any(self._storage[verification_id].is_token_valid() for verification_id in pending_ids)
     
     def cleanup_expired_verifications(self) -> int:
         """
@@ -205,13 +458,15 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             Number of expired verifications removed
         """
-        expired = self.find_expired_verifications()
-        count = 0
-        
-        for verification in expired:
-            if self.delete_by_id(verification.id):
-                count += 1
-        
+        count = self.bulk_delete(
+            verification.id for verification in self.find_expired_verifications()
+        )
+
+        # Deletions leave stale bloom bits behind; cleanup is the natural
+        # point to rebuild the filter from the surviving tokens
+        if count:
+            self._bloom_rebuild()
+
         return count
     
     def get_verification_stats(self) -> dict:
@@ -221,6 +476,9 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             Dictionary with verification statistics
         """
+        if self._stats_cache is not None:
+            return dict(self._stats_cache)
+
         all_verifications = self.find_all()
         verified_count = 0
         pending_count = 0
@@ -238,13 +496,14 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
             if verification.resend_count >= 2:  # High resend threshold
                 high_resend_count += 1
         
-        return {
+        self._stats_cache = {
             "total_verifications": len(all_verifications),
             "verified": verified_count,
             "pending": pending_count,
             "expired": expired_count,
             "high_resend_count": high_resend_count
         }
+        return dict(self._stats_cache)
     
     def delete_by_user_id(self, user_id: str) -> int:
         """
@@ -256,14 +515,14 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             Number of verifications deleted
         """
-        verifications = self.find_by_user_id(user_id)
-        count = 0
-        
-        for verification in verifications:
-            if self.delete_by_id(verification.id):
-                count += 1
-        
-        return count
+        if not user_id:
+            return 0
+
+        verification_ids = self._indexes['user_id'].get(sys.intern(user_id.strip()))
+        if not verification_ids:
+            return 0
+
+        return self.bulk_delete(list(verification_ids))
     
     def find_recent_verifications(self, hours: int = 24) -> List[EmailVerification]:
         """
@@ -275,13 +534,10 @@ class EmailVerificationRepository(InMemoryRepository[EmailVerification]):
         Returns:
             List of recent verifications
         """
-        cutoff_time = datetime.now(timezone.utc) - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(hours=hours)
-        
-        recent = []
-        for verification in self.find_all():
-            if verification.created_at >= cutoff_time:
-                recent.append(verification)
-        
-        return recent
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        start = bisect.bisect_left(self._by_created_at, (cutoff_time,))
+        return [
+            self._storage[verification_id]
+            for _, verification_id in self._by_created_at[start:]
+        ]
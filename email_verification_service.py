@@ -2,7 +2,8 @@
 EmailVerificationService for the User Management domain model.
 """
 
-from typing import Optional, Dict, Any
+import logging
+from typing import Optional, Dict, Any, List
 
 from user import User
 from email_verification import EmailVerification
@@ -14,6 +15,9 @@ from enums import SecurityEventType
 from exceptions import ValidationException, ExpiredTokenException, EntityNotFoundException
 from logging_config import logger
 
+# Pre-bound enum member for the hot audit-logging paths
+_EV = SecurityEventType.EMAIL_VERIFICATION
+
 
 class EmailVerificationService:
     """
@@ -25,7 +29,11 @@ class EmailVerificationService:
     - Resending verification emails
     - Security audit logging
     """
-    
+
+    # Buffered audit entries are written through once the buffer reaches
+    # this size (or on an explicit flush)
+    AUDIT_FLUSH_BATCH_SIZE = 50
+
     def __init__(
         self,
         user_repository: UserRepository,
@@ -43,6 +51,9 @@ class EmailVerificationService:
         self.user_repository = user_repository
         self.email_verification_repository = email_verification_repository
         self.audit_log_repository = audit_log_repository
+
+        # Write-behind buffer for audit log entries (batched repository writes)
+        self._audit_buffer: List[SecurityAuditLog] = []
     
     def verify_email(
         self,
@@ -66,8 +77,19 @@ class EmailVerificationService:
             ExpiredTokenException: If token has expired
             EntityNotFoundException: If verification record not found
         """
-        logger.info(f"Starting email verification for token: {verification_token[:10]}...")
-        
+        # Level-gated so the per-request call skips argument setup when INFO
+        # is off; %.10s defers the prefix slice to actual emission, and the
+        # fallback keeps a None/empty token loggable
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting email verification for token: %.10s...",
+                verification_token or "<none>"
+            )
+
+        # Bound up front so the except block can reuse whatever the happy
+        # path already resolved instead of re-querying the repositories
+        user = None
+
         try:
             # Step 1: Find verification record
             verification = self.email_verification_repository.find_by_verification_token(verification_token)
@@ -97,7 +119,7 @@ class EmailVerificationService:
                     user_agent=user_agent
                 )
                 
-                logger.info(f"Email verification successful for user: {user.email}")
+                logger.info("Email verification successful for user: %s", user.email)
                 
                 return {
                     "success": True,
@@ -111,17 +133,12 @@ class EmailVerificationService:
                 raise ValidationException("Token verification failed")
                 
         except (ValidationException, ExpiredTokenException, EntityNotFoundException) as e:
-            logger.warning(f"Email verification failed: {str(e)}")
-            
-            # Try to get user info for logging (if possible)
-            user_id = None
-            email = None
-            if 'verification' in locals() and verification:
-                user = self.user_repository.find_by_id(verification.user_id)
-                if user:
-                    user_id = user.id
-                    email = user.email
-            
+            logger.warning("Email verification failed: %s", e)
+
+            # Reuse the user resolved before the failure, if we got that far
+            user_id = user.id if user else None
+            email = user.email if user else None
+
             # Log failed verification
             self._log_verification_event(
                 user_id=user_id,
@@ -133,11 +150,7 @@ class EmailVerificationService:
             )
             
             raise
-        
-        except Exception as e:
-            logger.error(f"Unexpected error during email verification: {str(e)}")
-            raise ValidationException("Email verification failed due to internal error")
-    
+
     def resend_verification_email(
         self,
         email: str,
@@ -159,8 +172,11 @@ class EmailVerificationService:
             EntityNotFoundException: If user not found
             ValidationException: If email already verified or max resends exceeded
         """
-        logger.info(f"Resending verification email for: {email}")
-        
+        logger.info("Resending verification email for: %s", email)
+
+        # Bound up front so the except block can reuse the resolved user
+        user = None
+
         try:
             # Step 1: Find user by email
             user = self.user_repository.find_by_email(email)
@@ -197,7 +213,7 @@ class EmailVerificationService:
                 }
             )
             
-            logger.info(f"Verification email resent for user: {email}")
+            logger.info("Verification email resent for user: %s", email)
             
             return {
                 "success": True,
@@ -210,13 +226,11 @@ class EmailVerificationService:
             }
             
         except (EntityNotFoundException, ValidationException) as e:
-            logger.warning(f"Resend verification failed for {email}: {str(e)}")
+            logger.warning("Resend verification failed for %s: %s", email, e)
             
             # Log failed resend
-            user_id = None
-            if 'user' in locals() and user:
-                user_id = user.id
-            
+            user_id = user.id if user else None
+
             self._log_verification_event(
                 user_id=user_id,
                 email=email,
@@ -230,11 +244,7 @@ class EmailVerificationService:
             )
             
             raise
-        
-        except Exception as e:
-            logger.error(f"Unexpected error during resend verification for {email}: {str(e)}")
-            raise ValidationException("Resend verification failed due to internal error")
-    
+
     def check_verification_status(self, email: str) -> Dict[str, Any]:
         """
         Check the verification status for an email address.
@@ -284,20 +294,26 @@ class EmailVerificationService:
         Returns:
             Dictionary with verification statistics
         """
+        # Make sure buffered audit entries are visible to the queries below
+        self.flush_audit_logs()
+
         # Get verification stats from repository
         verification_stats = self.email_verification_repository.get_verification_stats()
         
-        # Get user stats
+        # Get user stats (index-backed counts, no list materialization)
         total_users = self.user_repository.count()
-        active_users = len(self.user_repository.find_active_users())
-        inactive_users = len(self.user_repository.find_inactive_users())
-        
-        # Get recent verification events
-        recent_verifications = self.audit_log_repository.find_by_event_type(
-            SecurityEventType.EMAIL_VERIFICATION
-        )
-        successful_verifications = [log for log in recent_verifications if log.success]
-        failed_verifications = [log for log in recent_verifications if not log.success]
+        active_users = self.user_repository.count_active_users()
+        inactive_users = self.user_repository.count_inactive_users()
+        
+        # Tally verification events in one streaming pass instead of
+        # materializing and re-filtering the full event list
+        total_attempts = 0
+        successful_count = 0
+        for log in self.audit_log_repository.iter_by_event_type(_EV):
+            total_attempts += 1
+            if log.success:
+                successful_count += 1
+        failed_count = total_attempts - successful_count
         
         return {
             "user_statistics": {
@@ -308,11 +324,11 @@ class EmailVerificationService:
             },
             "verification_statistics": verification_stats,
             "recent_activity": {
-                "total_verification_attempts": len(recent_verifications),
-                "successful_verifications": len(successful_verifications),
-                "failed_verifications": len(failed_verifications),
-                "success_rate": (len(successful_verifications) / len(recent_verifications) * 100) 
-                              if recent_verifications else 0
+                "total_verification_attempts": total_attempts,
+                "successful_verifications": successful_count,
+                "failed_verifications": failed_count,
+                "success_rate": (successful_count / total_attempts * 100)
+                              if total_attempts else 0
             }
         }
     
@@ -327,7 +343,7 @@ class EmailVerificationService:
         
         expired_count = self.email_verification_repository.cleanup_expired_verifications()
         
-        logger.info(f"Cleaned up {expired_count} expired email verifications")
+        logger.info("Cleaned up %d expired email verifications", expired_count)
         
         return {
             "expired_verifications_cleaned": expired_count
@@ -353,27 +369,45 @@ class EmailVerificationService:
             user_agent: User agent
             additional_data: Additional data to log
         """
-        try:
-            description = "Email verification completed" if success else "Email verification failed"
-            
-            # Add email to additional data if provided
-            if additional_data is None:
-                additional_data = {}
-            if email:
-                additional_data["email"] = email
-            
-            audit_log = SecurityAuditLog(
-                event_type=SecurityEventType.EMAIL_VERIFICATION,
-                event_description=description,
-                success=success,
-                user_id=user_id,
-                ip_address=ip_address,
-                user_agent=user_agent,
-                additional_data=additional_data
-            )
+        description = "Email verification completed" if success else "Email verification failed"
+
+        # Add email to additional data if provided
+        if additional_data is None:
+            additional_data = {}
+        if email:
+            additional_data["email"] = email
+
+        audit_log = SecurityAuditLog(
+            event_type=_EV,
+            event_description=description,
+            success=success,
+            user_id=user_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            additional_data=additional_data
+        )
+        self._audit_buffer.append(audit_log)
+
+        if len(self._audit_buffer) >= self.AUDIT_FLUSH_BATCH_SIZE:
+            self.flush_audit_logs()
+
+    def flush_audit_logs(self) -> int:
+        """
+        Flush all buffered audit log entries to the repository.
+
+        Returns:
+            Number of entries flushed
+        """
+        if not self._audit_buffer:
+            return 0
+
+        pending = self._audit_buffer
+        self._audit_buffer = []
+
+        for audit_log in pending:
             self.audit_log_repository.save(audit_log)
-        except Exception as e:
-            logger.error(f"Failed to log verification event: {str(e)}")
+
+        return len(pending)
     
     def force_verify_email(self, email: str, admin_user_id: str) -> Dict[str, Any]:
         """
@@ -390,7 +424,7 @@ class EmailVerificationService:
             EntityNotFoundException: If user not found
             ValidationException: If already verified
         """
-        logger.info(f"Force verifying email: {email} by admin: {admin_user_id}")
+        logger.info("Force verifying email: %s by admin: %s", email, admin_user_id)
         
         user = self.user_repository.find_by_email(email)
         if not user:
@@ -421,7 +455,7 @@ class EmailVerificationService:
             }
         )
         
-        logger.info(f"Email force verified for user: {email}")
+        logger.info("Email force verified for user: %s", email)
         
         return {
             "success": True,
@@ -2,28 +2,22 @@
 Enums for the User Management domain model.
 """
 
-from enum import Enum
+from enum import StrEnum
 
 
-class UserRole(Enum):
+class UserRole(StrEnum):
     """User roles in the system."""
     SOLUTION_ARCHITECT = "SolutionArchitect"
     SALES_MANAGER = "SalesManager"
-    
-    def __str__(self) -> str:
-        return self.value
 
 
-class TokenType(Enum):
+class TokenType(StrEnum):
     """Types of authentication tokens."""
     ACCESS = "ACCESS"
     REFRESH = "REFRESH"
-    
-    def __str__(self) -> str:
-        return self.value
 
 
-class SecurityEventType(Enum):
+class SecurityEventType(StrEnum):
     """Types of security events for audit logging."""
     USER_REGISTRATION = "USER_REGISTRATION"
     EMAIL_VERIFICATION = "EMAIL_VERIFICATION"
@@ -35,6 +29,3 @@ class SecurityEventType(Enum):
     ACCOUNT_LOCKED = "ACCOUNT_LOCKED"
     ACCOUNT_UNLOCKED = "ACCOUNT_UNLOCKED"
     TOKEN_REVOKED = "TOKEN_REVOKED"
-    
-    def __str__(self) -> str:
-        return self.value
@@ -5,64 +5,64 @@ Custom exceptions for the User Management domain model.
 
 class DomainException(Exception):
     """Base exception for all domain-related errors."""
-    pass
+    __slots__ = ()
 
 
 class ValidationException(DomainException):
     """Raised when domain validation fails."""
-    pass
+    __slots__ = ()
 
 
 class AuthenticationException(DomainException):
     """Raised when authentication fails."""
-    pass
+    __slots__ = ()
 
 
 class AuthorizationException(DomainException):
     """Raised when authorization fails."""
-    pass
+    __slots__ = ()
 
 
 class EntityNotFoundException(DomainException):
     """Raised when a requested entity is not found."""
-    pass
+    __slots__ = ()
 
 
 class DuplicateEntityException(DomainException):
     """Raised when attempting to create a duplicate entity."""
-    pass
+    __slots__ = ()
 
 
 class TokenException(DomainException):
     """Raised when token operations fail."""
-    pass
+    __slots__ = ()
 
 
 class AccountLockedException(AuthenticationException):
     """Raised when attempting to authenticate with a locked account."""
-    pass
+    __slots__ = ()
 
 
 class AccountNotActivatedException(AuthenticationException):
     """Raised when attempting to authenticate with an inactive account."""
-    pass
+    __slots__ = ()
 
 
 class InvalidCredentialsException(AuthenticationException):
     """Raised when provided credentials are invalid."""
-    pass
+    __slots__ = ()
 
 
 class ExpiredTokenException(TokenException):
     """Raised when a token has expired."""
-    pass
+    __slots__ = ()
 
 
 class InvalidTokenException(TokenException):
     """Raised when a token is invalid or malformed."""
-    pass
+    __slots__ = ()
 
 
 class RevokedTokenException(TokenException):
     """Raised when attempting to use a revoked token."""
-    pass
+    __slots__ = ()
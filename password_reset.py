@@ -2,13 +2,25 @@
 PasswordReset entity for the User Management domain model.
 """
 
-import secrets
+import hashlib
+import hmac
+from base64 import urlsafe_b64encode
+from os import urandom
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
 from base_entity import BaseEntity
 from exceptions import ValidationException, ExpiredTokenException
 
+# Bound once so the hot validity checks skip the timezone.utc attribute
+# resolution on every call
+_UTC = timezone.utc
+
+
+def _now() -> datetime:
+    """Current UTC time."""
+    return datetime.now(_UTC)
+
 
 class PasswordReset(BaseEntity):
     """
@@ -17,7 +29,7 @@ class PasswordReset(BaseEntity):
     Attributes:
         id (str): Unique identifier for the password reset
         user_id (str): Reference to the User entity
-        reset_token (str): Unique token for password reset
+        reset_token_hash (str): BLAKE2b hash of the reset token
         token_expires_at (datetime): When the reset token expires (24 hours)
         is_used (bool): Whether the reset token has been used
         used_at (datetime): When the reset token was used
@@ -26,7 +38,12 @@ class PasswordReset(BaseEntity):
         user_agent (str): User agent from which reset was requested
         updated_at (datetime): When the reset was last updated
     """
-    
+
+    __slots__ = (
+        'user_id', 'reset_token_hash', '_plain_token', 'token_expires_at',
+        'is_used', 'used_at', 'ip_address', 'user_agent'
+    )
+
     # Configuration constants
     TOKEN_EXPIRY_HOURS = 24
     TOKEN_LENGTH = 32
@@ -53,8 +70,12 @@ class PasswordReset(BaseEntity):
         super().__init__(reset_id)
         
         self.user_id = self._validate_user_id(user_id)
-        self.reset_token = self._generate_reset_token()
-        self.token_expires_at = datetime.now(timezone.utc) + timedelta(hours=self.TOKEN_EXPIRY_HOURS)
+        # Only the token hash is kept; the plaintext is held transiently so
+        # the caller can hand it to the user exactly once
+        plain_token = self._generate_reset_token()
+        self.reset_token_hash = self._hash_token(plain_token)
+        self._plain_token: Optional[str] = plain_token
+        self.token_expires_at = _now() + timedelta(hours=self.TOKEN_EXPIRY_HOURS)
         self.is_used = False
         self.used_at: Optional[datetime] = None
         self.ip_address = ip_address
@@ -73,19 +94,88 @@ class PasswordReset(BaseEntity):
         Returns:
             Secure random token string
         """
-        return secrets.token_urlsafe(self.TOKEN_LENGTH)
-    
-    def is_token_valid(self) -> bool:
+        # Equivalent to secrets.token_urlsafe without its per-call module
+        # indirection; urandom feeds the same CSPRNG
+        return urlsafe_b64encode(urandom(self.TOKEN_LENGTH)).rstrip(b'=').decode('ascii')
+
+    @staticmethod
+    def _hash_token(token: str) -> str:
+        """
+        Hash a reset token for storage and comparison.
+
+        Args:
+            token: Plaintext reset token
+
+        Returns:
+            BLAKE2b hex digest of the token
+        """
+        return hashlib.blake2b(token.encode('utf-8'), digest_size=32).hexdigest()
+
+    def reveal_token(self) -> str:
+        """
+        Return the plaintext reset token, exactly once.
+
+        Returns:
+            Plaintext reset token
+
+        Raises:
+            ValidationException: If the token was already revealed
+        """
+        if self._plain_token is None:
+            raise ValidationException("Reset token has already been revealed")
+
+        plain_token = self._plain_token
+        self._plain_token = None
+        return plain_token
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PasswordReset':
+        """
+        Rehydrate a password reset from its to_dict representation.
+
+        Bypasses __init__ entirely: persisted data is already validated and
+        carries its own token hash, so re-validating and generating a fresh
+        token (the expensive urandom call) would be wasted work.
+
+        Args:
+            data: Dictionary produced by to_dict
+
+        Returns:
+            PasswordReset instance
+        """
+        reset = object.__new__(cls)
+        reset.id = data['id']
+        reset.user_id = data['user_id']
+        reset.reset_token_hash = data['reset_token_hash']
+        # Plaintext is never persisted; a rehydrated reset has none to reveal
+        reset._plain_token = None
+        reset.token_expires_at = datetime.fromisoformat(data['token_expires_at'])
+        reset.is_used = data['is_used']
+        reset.used_at = datetime.fromisoformat(data['used_at']) if data['used_at'] else None
+        reset.ip_address = data['ip_address']
+        reset.user_agent = data['user_agent']
+        reset.created_at = datetime.fromisoformat(data['created_at'])
+        reset.updated_at = datetime.fromisoformat(data['updated_at'])
+        return reset
+
+    def is_token_valid(self, now: Optional[datetime] = None) -> bool:
         """
         Check if the reset token is still valid.
-        
+
+        Args:
+            now: Optional precomputed current time to avoid repeated
+                datetime.now calls in bulk scans
+
         Returns:
             True if token is valid, not used, and not expired, False otherwise
         """
         if self.is_used:
             return False
-        
-        return datetime.now(timezone.utc) < self.token_expires_at
+
+        if now is None:
+            now = _now()
+
+        return now < self.token_expires_at
     
     def validate_token(self, token: str) -> bool:
         """
@@ -106,8 +196,13 @@ class PasswordReset(BaseEntity):
         
         if not self.is_token_valid():
             raise ExpiredTokenException("Reset token has expired")
-        
-        return token == self.reset_token
+
+        if not token:
+            return False
+
+        # Constant-time comparison of fixed-length digests; hashing first
+        # also keeps the compare independent of the supplied token's length
+        return hmac.compare_digest(self._hash_token(token), self.reset_token_hash)
     
     def use_token(self, token: str) -> bool:
         """
@@ -128,19 +223,26 @@ class PasswordReset(BaseEntity):
         
         # Mark token as used
         self.is_used = True
-        self.used_at = datetime.now(timezone.utc)
+        self.used_at = _now()
         self.update_timestamp()
         
         return True
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """
         Check if the reset token has expired.
-        
+
+        Args:
+            now: Optional precomputed current time to avoid repeated
+                datetime.now calls in bulk scans
+
         Returns:
             True if expired, False otherwise
         """
-        return datetime.now(timezone.utc) >= self.token_expires_at
+        if now is None:
+            now = _now()
+
+        return now >= self.token_expires_at
     
     def get_time_until_expiry(self) -> timedelta:
         """
@@ -152,7 +254,7 @@ class PasswordReset(BaseEntity):
         if self.is_expired():
             return timedelta(0)
         
-        return self.token_expires_at - datetime.now(timezone.utc)
+        return self.token_expires_at - _now()
     
     def invalidate(self) -> None:
         """
@@ -160,7 +262,7 @@ class PasswordReset(BaseEntity):
         Useful for security purposes when a token needs to be revoked.
         """
         self.is_used = True
-        self.used_at = datetime.now(timezone.utc)
+        self.used_at = _now()
         self.update_timestamp()
     
     def to_dict(self) -> dict:
@@ -168,7 +270,7 @@ class PasswordReset(BaseEntity):
         return {
             "id": self.id,
             "user_id": self.user_id,
-            "reset_token": self.reset_token,
+            "reset_token_hash": self.reset_token_hash,
             "token_expires_at": self.token_expires_at.isoformat(),
             "is_used": self.is_used,
             "used_at": self.used_at.isoformat() if self.used_at else None,
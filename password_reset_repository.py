@@ -2,11 +2,16 @@
 PasswordResetRepository for the User Management domain model.
 """
 
-from typing import List, Optional
-from datetime import datetime, timezone
+import bisect
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone, timedelta
 
 from base_repository import InMemoryRepository
-from password_reset import PasswordReset
+from password_reset import PasswordReset, _now
+
+# Upper bound for reset ids when bisecting (token_expires_at, id) pairs
+_MAX_RESET_ID = '\uffff'
 
 
 class PasswordResetRepository(InMemoryRepository[PasswordReset]):
@@ -16,7 +21,181 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
     Provides methods for finding password resets by user ID, token, and status.
     Supports managing password reset lifecycle and security.
     """
-    
+
+    def __init__(self):
+        """Initialize the repository with secondary indexes on the hot lookup keys."""
+        super().__init__()
+        self.register_index('reset_token_hash')
+        self.register_index('user_id')
+        # Used/unused split backs both the find methods and the O(1)
+        # counters in get_reset_stats; save-time diffing moves ids between
+        # the two buckets when a reset is consumed or invalidated
+        self.register_index('is_used')
+        # Abuse investigations query by source address; resets from one
+        # address cluster into a handful of buckets
+        self.register_index('ip_address')
+
+        # Most recent reset per user, precomputed on save so the rate-limit
+        # style "latest reset" check never scans the user's bucket
+        self._latest_by_user: Dict[str, PasswordReset] = {}
+
+        # Sorted (token_expires_at, id) pairs; reset expiry is fixed at
+        # construction, so entries are inserted once and expiry queries
+        # bisect the expired prefix in O(log N + k)
+        self._by_expiry: List[Tuple[datetime, str]] = []
+        self._expiry_of: Dict[str, datetime] = {}
+
+        # Sorted (created_at, id) pairs; creation time never changes, so the
+        # recency queries bisect the recent suffix instead of scanning
+        self._by_created_at: List[Tuple[datetime, str]] = []
+
+        # Stats cursor over the expired prefix: (entries examined, used
+        # entries among them). Expiry is a wall-clock transition, so the
+        # cursor only ever advances between mutations; structural changes
+        # and used-flag flips reset it
+        self._expired_scan: Tuple[int, int] = (0, 0)
+
+    def save(self, reset: PasswordReset) -> PasswordReset:
+        """
+        Save a password reset, keeping the latest-per-user cache current.
+
+        Args:
+            reset: Password reset to save
+
+        Returns:
+            Saved password reset
+        """
+        # A used-flag flip can change an already-examined expired entry,
+        # so the stats cursor must restart from the front
+        old_values = self._index_values.get(reset.id)
+        if old_values is not None and old_values.get('is_used') != reset.is_used:
+            self._expired_scan = (0, 0)
+
+        saved = super().save(reset)
+
+        if saved.id not in self._expiry_of:
+            bisect.insort(self._by_expiry, (saved.token_expires_at, saved.id))
+            self._expiry_of[saved.id] = saved.token_expires_at
+            bisect.insort(self._by_created_at, (saved.created_at, saved.id))
+
+        latest = self._latest_by_user.get(saved.user_id)
+        if latest is None or saved.created_at >= latest.created_at:
+            self._latest_by_user[saved.user_id] = saved
+
+        return saved
+
+    def delete_by_id(self, entity_id: str) -> bool:
+        """
+        Delete a password reset, keeping the latest-per-user cache current.
+
+        Args:
+            entity_id: ID of the password reset to delete
+
+        Returns:
+            True if the reset was deleted, False if not found
+        """
+        reset = self._storage.get(entity_id)
+
+        if not super().delete_by_id(entity_id):
+            return False
+
+        expires_at = self._expiry_of.pop(entity_id, None)
+        if expires_at is not None:
+            self._discard_expiry_entry(entity_id, expires_at)
+            self._discard_sorted_entry(self._by_created_at, (reset.created_at, entity_id))
+            self._expired_scan = (0, 0)
+
+        # Recompute only if the deleted entry was the cached latest
+        if self._latest_by_user.get(reset.user_id) is reset:
+            remaining = self.find_by_indexed_attribute('user_id', reset.user_id)
+            if remaining:
+                self._latest_by_user[reset.user_id] = max(
+                    remaining, key=lambda r: r.created_at
+                )
+            else:
+                del self._latest_by_user[reset.user_id]
+
+        return True
+
+    def bulk_delete(self, entity_ids) -> int:
+        """
+        Delete a batch of password resets, repairing caches afterwards.
+
+        Args:
+            entity_ids: IDs of the password resets to delete
+
+        Returns:
+            Number of password resets deleted
+        """
+        ids = [entity_id for entity_id in entity_ids if entity_id in self._storage]
+        if not ids:
+            return 0
+
+        affected_users = {self._storage[entity_id].user_id for entity_id in ids}
+        for entity_id in ids:
+            self._expiry_of.pop(entity_id, None)
+
+        dropped = set(ids)
+        self._by_expiry = [pair for pair in self._by_expiry if pair[1] not in dropped]
+        self._by_created_at = [pair for pair in self._by_created_at if pair[1] not in dropped]
+        self._expired_scan = (0, 0)
+
+        count = super().bulk_delete(ids)
+
+        # Repair the latest-per-user cache once per affected user
+        for user_id in affected_users:
+            remaining = self.find_by_indexed_attribute('user_id', user_id)
+            if remaining:
+                self._latest_by_user[user_id] = max(remaining, key=lambda r: r.created_at)
+            else:
+                self._latest_by_user.pop(user_id, None)
+
+        return count
+
+    def bulk_load(self, snapshots) -> int:
+        """
+        Load persisted password resets from their to_dict snapshots.
+
+        Rehydrates through PasswordReset.from_dict, which skips validation
+        and token generation, then saves normally so every index and cache
+        is built as usual.
+
+        Args:
+            snapshots: Iterable of dictionaries produced by to_dict
+
+        Returns:
+            Number of resets loaded
+        """
+        count = 0
+        for snapshot in snapshots:
+            self.save(PasswordReset.from_dict(snapshot))
+            count += 1
+        return count
+
+    def clear(self) -> None:
+        """Clear all password resets and the latest-per-user cache."""
+        super().clear()
+        self._latest_by_user.clear()
+        self._by_expiry.clear()
+        self._expiry_of.clear()
+        self._by_created_at.clear()
+        self._expired_scan = (0, 0)
+
+    def _discard_expiry_entry(self, reset_id: str, expires_at: datetime) -> None:
+        """Remove an entry from the sorted expiry list."""
+        self._discard_sorted_entry(self._by_expiry, (expires_at, reset_id))
+
+    @staticmethod
+    def _discard_sorted_entry(pairs: List[Tuple[datetime, str]], pair: Tuple[datetime, str]) -> None:
+        """Remove a (datetime, id) entry from a sorted pair list if present."""
+        i = bisect.bisect_left(pairs, pair)
+        if i < len(pairs) and pairs[i] == pair:
+            del pairs[i]
+
+    def _expired_prefix_length(self, now: datetime) -> int:
+        """Length of the expired prefix of the sorted expiry list."""
+        return bisect.bisect_right(self._by_expiry, (now, _MAX_RESET_ID))
+
     def find_by_user_id(self, user_id: str) -> List[PasswordReset]:
         """
         Find all password resets for a user.
@@ -29,23 +208,26 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         """
         if not user_id:
             return []
-        
-        return self.find_by_attribute('user_id', user_id.strip())
+
+        return self.find_by_indexed_attribute('user_id', user_id.strip())
     
     def find_by_reset_token(self, token: str) -> Optional[PasswordReset]:
         """
-        Find password reset by token.
-        
+        Find password reset by its plaintext token.
+
         Args:
             token: Reset token to search for
-        
+
         Returns:
             PasswordReset if found, None otherwise
         """
         if not token:
             return None
-        
-        return self.find_first_by_attribute('reset_token', token.strip())
+
+        # Only hashes are stored, so hash the supplied token for the probe
+        token_hash = PasswordReset._hash_token(token.strip())
+        matches = self.find_by_indexed_attribute('reset_token_hash', token_hash)
+        return matches[0] if matches else None
     
     def find_latest_by_user_id(self, user_id: str) -> Optional[PasswordReset]:
         """
@@ -57,12 +239,10 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             Latest PasswordReset if found, None otherwise
         """
-        resets = self.find_by_user_id(user_id)
-        if not resets:
+        if not user_id:
             return None
-        
-        # Sort by created_at descending and return the first (latest)
-        return max(resets, key=lambda r: r.created_at)
+
+        return self._latest_by_user.get(user_id.strip())
     
     def find_active_by_user_id(self, user_id: str) -> List[PasswordReset]:
         """
@@ -74,8 +254,8 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             List of active password resets
         """
-        resets = self.find_by_user_id(user_id)
-        return [r for r in resets if r.is_token_valid()]
+        now = _now()
+        return [r for r in self.find_by_user_id(user_id) if r.is_token_valid(now)]
     
     def find_used_resets(self) -> List[PasswordReset]:
         """
@@ -84,7 +264,7 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             List of used password resets
         """
-        return self.find_by_attribute('is_used', True)
+        return self.find_by_indexed_attribute('is_used', True)
     
     def find_unused_resets(self) -> List[PasswordReset]:
         """
@@ -93,7 +273,7 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             List of unused password resets
         """
-        return self.find_by_attribute('is_used', False)
+        return self.find_by_indexed_attribute('is_used', False)
     
     def find_expired_resets(self) -> List[PasswordReset]:
         """
@@ -102,11 +282,17 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             List of expired password resets
         """
-        expired = []
-        for reset in self.find_all():
-            if reset.is_expired() and not reset.is_used:
-                expired.append(reset)
-        return expired
+        now = _now()
+        prefix = self._expired_prefix_length(now)
+
+        return [
+            reset
+            for reset in map(
+                self._storage.__getitem__,
+                (reset_id for _, reset_id in self._by_expiry[:prefix])
+            )
+            if not reset.is_used
+        ]
     
     def find_active_resets(self) -> List[PasswordReset]:
         """
@@ -115,11 +301,8 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             List of active password resets
         """
-        active = []
-        for reset in self.find_all():
-            if reset.is_token_valid():
-                active.append(reset)
-        return active
+        now = _now()
+        return [reset for reset in self._storage.values() if reset.is_token_valid(now)]
     
     def find_by_ip_address(self, ip_address: str) -> List[PasswordReset]:
         """
@@ -133,8 +316,8 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         """
         if not ip_address:
             return []
-        
-        return self.find_by_attribute('ip_address', ip_address.strip())
+
+        return self.find_by_indexed_attribute('ip_address', ip_address.strip())
     
     def has_active_reset(self, user_id: str) -> bool:
         """
@@ -176,14 +359,7 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             Number of expired resets removed
         """
-        expired = self.find_expired_resets()
-        count = 0
-        
-        for reset in expired:
-            if self.delete_by_id(reset.id):
-                count += 1
-        
-        return count
+        return self.bulk_delete([reset.id for reset in self.find_expired_resets()])
     
     def cleanup_used_resets(self, older_than_days: int = 30) -> int:
         """
@@ -195,19 +371,12 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             Number of used resets removed
         """
-        cutoff_date = datetime.now(timezone.utc) - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(days=older_than_days)
-        
-        used_resets = self.find_used_resets()
-        count = 0
-        
-        for reset in used_resets:
-            if reset.used_at and reset.used_at < cutoff_date:
-                if self.delete_by_id(reset.id):
-                    count += 1
-        
-        return count
+        cutoff_date = _now() - timedelta(days=older_than_days)
+
+        return self.bulk_delete([
+            reset.id for reset in self.find_used_resets()
+            if reset.used_at and reset.used_at < cutoff_date
+        ])
     
     def get_reset_stats(self) -> dict:
         """
@@ -216,23 +385,27 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             Dictionary with reset statistics
         """
-        all_resets = self.find_all()
-        used_count = 0
-        active_count = 0
-        expired_count = 0
-        
-        for reset in all_resets:
-            if reset.is_used:
-                used_count += 1
-            elif reset.is_expired():
-                expired_count += 1
-            else:
-                active_count += 1
-        
+        total_count = len(self._storage)
+        used_count = len(self._indexes['is_used'].get(True, ()))
+
+        # Expired-but-unused entries live in the expired prefix of the
+        # sorted expiry list. The cursor remembers how much of the prefix
+        # earlier calls already examined, so a steady stream of stats
+        # requests only pays for entries that expired since the last one
+        now = _now()
+        prefix = self._expired_prefix_length(now)
+        scanned, used_in_prefix = self._expired_scan
+        used_in_prefix += sum(
+            1 for _, reset_id in self._by_expiry[scanned:prefix]
+            if self._storage[reset_id].is_used
+        )
+        self._expired_scan = (prefix, used_in_prefix)
+        expired_count = prefix - used_in_prefix
+
         return {
-            "total_resets": len(all_resets),
+            "total_resets": total_count,
             "used": used_count,
-            "active": active_count,
+            "active": total_count - used_count - expired_count,
             "expired": expired_count
         }
     
@@ -246,16 +419,14 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             List of recent password resets
         """
-        cutoff_time = datetime.now(timezone.utc) - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(hours=hours)
-        
-        recent = []
-        for reset in self.find_all():
-            if reset.created_at >= cutoff_time:
-                recent.append(reset)
-        
-        return recent
+        cutoff_time = _now() - timedelta(hours=hours)
+
+        # Recent entries form a suffix of the creation-sorted list
+        start = bisect.bisect_left(self._by_created_at, (cutoff_time,))
+        return [
+            self._storage[reset_id]
+            for _, reset_id in self._by_created_at[start:]
+        ]
     
     def find_frequent_reset_users(self, min_count: int = 3, days: int = 7) -> List[str]:
         """
@@ -268,23 +439,18 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             List of user IDs with frequent reset requests
         """
-        cutoff_time = datetime.now(timezone.utc) - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(days=days)
-        
-        user_reset_counts = {}
-        
-        for reset in self.find_all():
-            if reset.created_at >= cutoff_time:
-                user_id = reset.user_id
-                user_reset_counts[user_id] = user_reset_counts.get(user_id, 0) + 1
-        
-        frequent_users = []
-        for user_id, count in user_reset_counts.items():
-            if count >= min_count:
-                frequent_users.append(user_id)
-        
-        return frequent_users
+        cutoff_time = _now() - timedelta(days=days)
+
+        start = bisect.bisect_left(self._by_created_at, (cutoff_time,))
+        user_reset_counts = Counter(
+            self._storage[reset_id].user_id
+            for _, reset_id in self._by_created_at[start:]
+        )
+
+        return [
+            user_id for user_id, count in user_reset_counts.items()
+            if count >= min_count
+        ]
     
     def delete_by_user_id(self, user_id: str) -> int:
         """
@@ -296,11 +462,4 @@ class PasswordResetRepository(InMemoryRepository[PasswordReset]):
         Returns:
             Number of resets deleted
         """
-        resets = self.find_by_user_id(user_id)
-        count = 0
-        
-        for reset in resets:
-            if self.delete_by_id(reset.id):
-                count += 1
-        
-        return count
+        return self.bulk_delete([reset.id for reset in self.find_by_user_id(user_id)])
@@ -3,13 +3,73 @@ SecurityAuditLog entity for the User Management domain model.
 """
 
 import json
+import sys
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # C-accelerated serializer is an optional speedup
+    orjson = None
+    _probe_dumps = json.dumps
+else:
+    # Passthrough keeps the probe as strict as stdlib json, which rejects
+    # datetimes orjson would otherwise serialize natively
+    def _probe_dumps(value):
+        return orjson.dumps(value, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
 from base_entity import BaseEntity
 from enums import SecurityEventType
 from exceptions import ValidationException
 
+# Scalar leaves accepted by the structural JSON check
+_JSON_SAFE = (str, int, float, bool, type(None))
+
+# Factory descriptions keyed by (event type, success); built once so every
+# log entry shares one interned string per outcome
+_DESCRIPTIONS = {
+    (SecurityEventType.USER_REGISTRATION, True): sys.intern("User registration completed"),
+    (SecurityEventType.USER_REGISTRATION, False): sys.intern("User registration failed"),
+    (SecurityEventType.LOGIN_SUCCESS, True): sys.intern("User successfully logged in"),
+    (SecurityEventType.LOGIN_FAILURE, False): sys.intern("User login failed"),
+    (SecurityEventType.PASSWORD_RESET_REQUEST, True): sys.intern("Password reset requested"),
+    (SecurityEventType.PASSWORD_RESET_REQUEST, False): sys.intern("Password reset request failed"),
+    (SecurityEventType.PASSWORD_RESET_COMPLETE, True): sys.intern("Password reset completed"),
+    (SecurityEventType.PASSWORD_RESET_COMPLETE, False): sys.intern("Password reset completion failed"),
+}
+
+
+def _is_jsonable(value: Any, depth: int = 0) -> bool:
+    """
+    Structurally check JSON-serializability without encoding.
+
+    Covers the common scalar/list/dict payloads; unusually deep or exotic
+    values return False and are left to a real serialization probe.
+
+    Args:
+        value: Value to check
+        depth: Current recursion depth (capped at 8)
+
+    Returns:
+        True if the value is definitely JSON serializable
+    """
+    if isinstance(value, _JSON_SAFE):
+        return True
+
+    if depth >= 8:
+        return False
+
+    if isinstance(value, (list, tuple)):
+        return all(_is_jsonable(item, depth + 1) for item in value)
+
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_jsonable(item, depth + 1)
+            for key, item in value.items()
+        )
+
+    return False
+
 
 class SecurityAuditLog(BaseEntity):
     """
@@ -26,7 +86,15 @@ class SecurityAuditLog(BaseEntity):
         additional_data (dict): Additional event-specific data
         created_at (datetime): When the event occurred
     """
-    
+
+    # Audit entries are produced in bulk on busy days; skip the per-instance
+    # __dict__ like the other stored entities
+    __slots__ = (
+        'user_id', 'event_type', 'event_description', 'success',
+        'ip_address', 'user_agent', 'additional_data',
+        '_cached_dict', '_cached_json', '_summary', '_str'
+    )
+
     def __init__(
         self,
         event_type: SecurityEventType,
@@ -63,7 +131,22 @@ class SecurityAuditLog(BaseEntity):
         self.ip_address = ip_address
         self.user_agent = user_agent
         self.additional_data = additional_data or {}
-    
+
+        # Audit entries are write-once/read-many; the serialized forms are
+        # memoized and only invalidated by add_additional_data
+        self._cached_dict: Optional[dict] = None
+        self._cached_json: Optional[str] = None
+
+        # The display strings only depend on fields that are fixed after
+        # construction, so build them once instead of per call
+        status = "SUCCESS" if self.success else "FAILURE"
+        user_info = f" (User: {self.user_id})" if self.user_id else ""
+        self._summary = f"[{status}] {self.event_type.value}: {self.event_description}{user_info}"
+        self._str = (
+            f"SecurityAuditLog(id='{self.id}', "
+            f"event='{self.event_type.value}', success={self.success})"
+        )
+
     def _validate_event_type(self, event_type: SecurityEventType) -> SecurityEventType:
         """Validate event type."""
         if not isinstance(event_type, SecurityEventType):
@@ -89,12 +172,18 @@ class SecurityAuditLog(BaseEntity):
         Raises:
             ValidationException: If value is not JSON serializable
         """
-        try:
-            # Test JSON serialization
-            json.dumps(value)
+        if _is_jsonable(value):
             self.additional_data[key] = value
-        except (TypeError, ValueError) as e:
-            raise ValidationException(f"Additional data value must be JSON serializable: {e}")
+        else:
+            try:
+                # Slow path: let the encoder decide (and produce the message)
+                _probe_dumps(value)
+                self.additional_data[key] = value
+            except (TypeError, ValueError) as e:
+                raise ValidationException(f"Additional data value must be JSON serializable: {e}")
+
+        self._cached_dict = None
+        self._cached_json = None
     
     def get_additional_data(self, key: str, default: Any = None) -> Any:
         """
@@ -143,23 +232,25 @@ class SecurityAuditLog(BaseEntity):
         Returns:
             Event summary string
         """
-        status = "SUCCESS" if self.success else "FAILURE"
-        user_info = f" (User: {self.user_id})" if self.user_id else ""
-        return f"[{status}] {self.event_type.value}: {self.event_description}{user_info}"
+        return self._summary
     
     def to_dict(self) -> dict:
         """Convert audit log to dictionary representation."""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "event_type": self.event_type.value,
-            "event_description": self.event_description,
-            "success": self.success,
-            "ip_address": self.ip_address,
-            "user_agent": self.user_agent,
-            "additional_data": self.additional_data,
-            "created_at": self.created_at.isoformat()
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "id": self.id,
+                "user_id": self.user_id,
+                "event_type": self.event_type.value,
+                "event_description": self.event_description,
+                "success": self.success,
+                "ip_address": self.ip_address,
+                "user_agent": self.user_agent,
+                "additional_data": self.additional_data,
+                "created_at": self.created_at.isoformat()
+            }
+
+        # Shallow copy so callers can't mutate the memoized form
+        return dict(self._cached_dict)
     
     def to_json(self) -> str:
         """
@@ -168,7 +259,15 @@ class SecurityAuditLog(BaseEntity):
         Returns:
             JSON representation of the audit log
         """
-        return json.dumps(self.to_dict(), indent=2)
+        if self._cached_json is None:
+            if orjson is not None:
+                self._cached_json = orjson.dumps(
+                    self.to_dict(), option=orjson.OPT_INDENT_2
+                ).decode('utf-8')
+            else:
+                self._cached_json = json.dumps(self.to_dict(), indent=2)
+
+        return self._cached_json
     
     @classmethod
     def create_user_registration_log(
@@ -192,13 +291,15 @@ class SecurityAuditLog(BaseEntity):
         Returns:
             SecurityAuditLog instance
         """
-        description = "User registration completed" if success else "User registration failed"
+        # The id/ip values repeat heavily across entries, so intern them to
+        # share one string object per distinct value; descriptions come
+        # pre-interned from the table
         return cls(
             event_type=SecurityEventType.USER_REGISTRATION,
-            event_description=description,
+            event_description=_DESCRIPTIONS[(SecurityEventType.USER_REGISTRATION, success)],
             success=success,
-            user_id=user_id,
-            ip_address=ip_address,
+            user_id=sys.intern(user_id) if user_id else user_id,
+            ip_address=sys.intern(ip_address) if ip_address else ip_address,
             user_agent=user_agent,
             additional_data=additional_data
         )
@@ -210,36 +311,37 @@ class SecurityAuditLog(BaseEntity):
         success: bool,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
-        failure_reason: Optional[str] = None
+        failure_reason: Optional[str] = None,
+        additional_data: Optional[Dict[str, Any]] = None
     ) -> 'SecurityAuditLog':
         """
         Create a login audit log entry.
-        
+
         Args:
             user_id: User ID
             success: Whether login was successful
             ip_address: IP address
             user_agent: User agent
             failure_reason: Reason for login failure
-        
+            additional_data: Additional data set in a single assignment
+
         Returns:
             SecurityAuditLog instance
         """
         if success:
             event_type = SecurityEventType.LOGIN_SUCCESS
-            description = "User successfully logged in"
-            additional_data = None
         else:
             event_type = SecurityEventType.LOGIN_FAILURE
-            description = "User login failed"
-            additional_data = {"failure_reason": failure_reason} if failure_reason else None
-        
+            if failure_reason:
+                additional_data = dict(additional_data) if additional_data else {}
+                additional_data["failure_reason"] = failure_reason
+
         return cls(
             event_type=event_type,
-            event_description=description,
+            event_description=_DESCRIPTIONS[(event_type, success)],
             success=success,
-            user_id=user_id,
-            ip_address=ip_address,
+            user_id=sys.intern(user_id) if user_id else user_id,
+            ip_address=sys.intern(ip_address) if ip_address else ip_address,
             user_agent=user_agent,
             additional_data=additional_data
         )
@@ -266,22 +368,19 @@ class SecurityAuditLog(BaseEntity):
         Returns:
             SecurityAuditLog instance
         """
-        if event_type == SecurityEventType.PASSWORD_RESET_REQUEST:
-            description = "Password reset requested" if success else "Password reset request failed"
-        elif event_type == SecurityEventType.PASSWORD_RESET_COMPLETE:
-            description = "Password reset completed" if success else "Password reset completion failed"
-        else:
-            description = f"Password reset event: {event_type.value}"
-        
+        description = _DESCRIPTIONS.get(
+            (event_type, success), f"Password reset event: {event_type.value}"
+        )
+
         return cls(
             event_type=event_type,
             event_description=description,
             success=success,
-            user_id=user_id,
-            ip_address=ip_address,
+            user_id=sys.intern(user_id) if user_id else user_id,
+            ip_address=sys.intern(ip_address) if ip_address else ip_address,
             user_agent=user_agent
         )
     
     def __str__(self) -> str:
         """String representation of the audit log."""
-        return f"SecurityAuditLog(id='{self.id}', event='{self.event_type.value}', success={self.success})"
+        return self._str
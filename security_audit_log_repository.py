@@ -2,13 +2,65 @@
 SecurityAuditLogRepository for the User Management domain model.
 """
 
-from typing import List, Optional
-from datetime import datetime, timezone
+import bisect
+import copy
+import heapq
+import math
+import time
+from collections import Counter, defaultdict
+from array import array
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timezone, timedelta
 
 from base_repository import InMemoryRepository
 from security_audit_log import SecurityAuditLog
 from enums import SecurityEventType
 
+# Compact event-type codes for the columnar store (one byte per entry)
+_EVENT_CODES = {member: code for code, member in enumerate(SecurityEventType)}
+
+# HyperLogLog geometry for approximate distinct counts: 2^10 one-byte
+# registers (~1KB) regardless of how many values stream through
+_HLL_BITS = 10
+_HLL_M = 1 << _HLL_BITS
+_HLL_ALPHA = 0.7213 / (1 + 1.079 / _HLL_M)
+
+
+def _estimate_distinct(values) -> int:
+    """
+    Estimate the number of distinct values with a HyperLogLog sketch.
+
+    Standard error is about 3% at this register count; memory stays fixed
+    no matter how many values are consumed.
+
+    Args:
+        values: Iterable of hashable values
+
+    Returns:
+        Estimated distinct count
+    """
+    registers = bytearray(_HLL_M)
+
+    for value in values:
+        h = hash(value) & 0xFFFFFFFFFFFFFFFF
+        idx = h >> (64 - _HLL_BITS)
+        w = h & ((1 << (64 - _HLL_BITS)) - 1)
+        rank = (64 - _HLL_BITS) - w.bit_length() + 1
+        if rank > registers[idx]:
+            registers[idx] = rank
+
+    estimate = _HLL_ALPHA * _HLL_M * _HLL_M / sum(2.0 ** -r for r in registers)
+
+    # Linear-counting correction for small cardinalities
+    if estimate <= 2.5 * _HLL_M:
+        zeros = registers.count(0)
+        if zeros:
+            estimate = _HLL_M * math.log(_HLL_M / zeros)
+
+    return int(estimate)
+
 
 class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
     """
@@ -17,7 +69,235 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
     Provides methods for finding audit logs by user, event type, success status, and time ranges.
     Supports security monitoring and compliance reporting.
     """
-    
+
+    def __init__(self):
+        """Initialize the repository and its columnar scan structures."""
+        super().__init__()
+
+        # Inverted indexes on the hot filter keys; every find below is a
+        # bucket probe instead of a full scan
+        self.register_index('user_id')
+        self.register_index('event_type')
+        self.register_index('ip_address')
+        self.register_index('success')
+
+        # Columnar (structure-of-arrays) mirror of the scan-relevant fields,
+        # appended in creation order. Analytics that filter on one or two
+        # fields walk these compact typed arrays instead of touching every
+        # entity object. Deletions are rare (retention cleanup), so they just
+        # mark the columns dirty for a lazy rebuild.
+        self._col_ts = array('d')        # created_at as POSIX timestamps
+        self._col_event = array('B')     # event type codes (_EVENT_CODES)
+        self._col_success = array('B')   # success flags
+        self._col_ids: List[str] = []    # row -> entity id
+        self._cols_dirty = False
+
+        # Compound buckets for the two filter pairs the security views hit
+        # constantly; one hash probe replaces intersecting two single-key
+        # buckets. Each pair costs an extra set entry per log with a
+        # user_id, so only the pairs the UI actually queries are kept here.
+        self._by_user_success: Dict[Tuple[str, bool], set] = {}
+        self._by_user_event: Dict[Tuple[str, SecurityEventType], set] = {}
+        self._by_event_success: Dict[Tuple[SecurityEventType, bool], set] = {}
+
+        # Per-event-type (created_at, id) lists kept sorted ascending, so
+        # "recent first" reads are a reversed walk and two-type listings a
+        # lazy heap merge instead of concatenate-and-sort
+        self._sorted_by_type: Dict[SecurityEventType, List[Tuple[datetime, str]]] = {}
+
+        # Short-TTL cache for the aggregate reports, keyed by the query
+        # arguments plus the current minute; dashboards polling the same
+        # window hit the cache until the minute rolls over or a write
+        # bumps the version
+        self._report_cache: Dict[Tuple, Any] = {}
+        self._version = 0
+
+    def save(self, log: SecurityAuditLog) -> SecurityAuditLog:
+        """
+        Save an audit log, appending its row to the columnar mirror.
+
+        Args:
+            log: Audit log to save
+
+        Returns:
+            Saved audit log
+        """
+        is_new = log.id not in self._storage
+        saved = super().save(log)
+
+        # Columns only hold fields that are fixed at construction, so a
+        # re-save of a stored entry changes nothing column-side
+        if is_new:
+            ts = saved.created_at.timestamp()
+            if self._col_ts and ts < self._col_ts[-1]:
+                # Out-of-order insert (e.g. rehydration); fix ordering lazily
+                self._cols_dirty = True
+            self._col_ts.append(ts)
+            self._col_event.append(_EVENT_CODES[saved.event_type])
+            self._col_success.append(1 if saved.success else 0)
+            self._col_ids.append(saved.id)
+
+            bisect.insort(
+                self._sorted_by_type.setdefault(saved.event_type, []),
+                (saved.created_at, saved.id)
+            )
+            if saved.user_id:
+                self._by_user_success.setdefault(
+                    (saved.user_id, saved.success), set()
+                ).add(saved.id)
+                self._by_user_event.setdefault(
+                    (saved.user_id, saved.event_type), set()
+                ).add(saved.id)
+            self._by_event_success.setdefault(
+                (saved.event_type, saved.success), set()
+            ).add(saved.id)
+            self._version += 1
+
+        return saved
+
+    def delete_by_id(self, entity_id: str) -> bool:
+        """
+        Delete an audit log, marking the columnar mirror for rebuild.
+
+        Args:
+            entity_id: ID of the audit log to delete
+
+        Returns:
+            True if the log was deleted, False if not found
+        """
+        log = self._storage.get(entity_id)
+
+        if not super().delete_by_id(entity_id):
+            return False
+
+        self._cols_dirty = True
+        self._version += 1
+        bucket = self._sorted_by_type.get(log.event_type)
+        if bucket is not None:
+            i = bisect.bisect_left(bucket, (log.created_at, entity_id))
+            if i < len(bucket) and bucket[i] == (log.created_at, entity_id):
+                del bucket[i]
+        self._drop_from_compound(log)
+        return True
+
+    def bulk_delete(self, entity_ids) -> int:
+        """
+        Delete a batch of audit logs, marking the columnar mirror for rebuild.
+
+        Args:
+            entity_ids: IDs of the audit logs to delete
+
+        Returns:
+            Number of audit logs deleted
+        """
+        ids = [entity_id for entity_id in entity_ids if entity_id in self._storage]
+        if not ids:
+            return 0
+
+        dropped = set(ids)
+        # Compound buckets need the entities' keys, so capture them before
+        # super() empties storage
+        logs = [self._storage[entity_id] for entity_id in ids]
+        count = super().bulk_delete(ids)
+        self._cols_dirty = True
+        self._version += 1
+        for event_type, bucket in self._sorted_by_type.items():
+            self._sorted_by_type[event_type] = [
+                pair for pair in bucket if pair[1] not in dropped
+            ]
+        for log in logs:
+            self._drop_from_compound(log)
+        return count
+
+    def _drop_from_compound(self, log: SecurityAuditLog) -> None:
+        """Remove a deleted log's id from its compound index buckets."""
+        if log.user_id:
+            bucket = self._by_user_success.get((log.user_id, log.success))
+            if bucket is not None:
+                bucket.discard(log.id)
+                if not bucket:
+                    del self._by_user_success[(log.user_id, log.success)]
+            bucket = self._by_user_event.get((log.user_id, log.event_type))
+            if bucket is not None:
+                bucket.discard(log.id)
+                if not bucket:
+                    del self._by_user_event[(log.user_id, log.event_type)]
+        bucket = self._by_event_success.get((log.event_type, log.success))
+        if bucket is not None:
+            bucket.discard(log.id)
+            if not bucket:
+                del self._by_event_success[(log.event_type, log.success)]
+
+    def clear(self) -> None:
+        """Clear all audit logs and the columnar mirror."""
+        super().clear()
+        del self._col_ts[:]
+        del self._col_event[:]
+        del self._col_success[:]
+        self._col_ids.clear()
+        self._cols_dirty = False
+        self._sorted_by_type.clear()
+        self._by_user_success.clear()
+        self._by_user_event.clear()
+        self._by_event_success.clear()
+        self._report_cache.clear()
+        self._version += 1
+
+    def _ensure_columns(self) -> None:
+        """Rebuild the columnar mirror from storage if it went stale."""
+        if not self._cols_dirty:
+            return
+
+        logs = sorted(self._storage.values(), key=lambda log: log.created_at)
+        self._col_ts = array('d', (log.created_at.timestamp() for log in logs))
+        self._col_event = array('B', (_EVENT_CODES[log.event_type] for log in logs))
+        self._col_success = array('B', (1 if log.success else 0 for log in logs))
+        self._col_ids = [log.id for log in logs]
+        self._cols_dirty = False
+
+    def _cached_report(self, key: Tuple, compute) -> Any:
+        """
+        Serve an aggregate report through the short-TTL cache.
+
+        The key carries the repository version and the current minute, so
+        entries expire on writes or when the minute rolls over. A deep copy
+        is returned so callers cannot mutate the cached report.
+
+        Args:
+            key: Query-identifying tuple (without version/time bucket)
+            compute: Zero-argument callable producing the report
+
+        Returns:
+            The cached or freshly computed report
+        """
+        full_key = key + (self._version, int(time.time()) // 60)
+        report = self._report_cache.get(full_key)
+        if report is None:
+            # Stale entries never match again; drop them wholesale rather
+            # than tracking per-entry age
+            if len(self._report_cache) >= 128:
+                self._report_cache.clear()
+            report = self._report_cache[full_key] = compute()
+        return copy.deepcopy(report)
+
+    def count_failures_since(self, cutoff: datetime) -> int:
+        """
+        Count failed events at or after the given time.
+
+        The timestamp column is sorted, so the window is located with one
+        bisect and only the success column of the matching suffix is read.
+
+        Args:
+            cutoff: Start of the time window
+
+        Returns:
+            Number of failed events in the window
+        """
+        self._ensure_columns()
+        start = bisect.bisect_left(self._col_ts, cutoff.timestamp())
+        window = self._col_success[start:]
+        return len(window) - sum(window)
+
     def find_by_user_id(self, user_id: str) -> List[SecurityAuditLog]:
         """
         Find all audit logs for a specific user.
@@ -30,8 +310,8 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         """
         if not user_id:
             return []
-        
-        return self.find_by_attribute('user_id', user_id.strip())
+
+        return self.find_by_indexed_attribute('user_id', user_id.strip())
     
     def find_by_event_type(self, event_type: SecurityEventType) -> List[SecurityAuditLog]:
         """
@@ -43,8 +323,56 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             List of audit logs for the event type
         """
-        return self.find_by_attribute('event_type', event_type)
-    
+        return self.find_by_indexed_attribute('event_type', event_type)
+
+    def iter_by_event_type(self, event_type: SecurityEventType) -> Iterator[SecurityAuditLog]:
+        """
+        Iterate over audit logs for an event type without building a list.
+
+        Useful for single-pass aggregations where the caller only needs to
+        tally matching entries.
+
+        Args:
+            event_type: Event type to iterate over
+
+        Yields:
+            Audit logs matching the event type
+        """
+        bucket = self._indexes['event_type'].get(event_type, ())
+        for log_id in bucket:
+            yield self._storage[log_id]
+
+    def find_by_event_type_success(
+        self, event_type: SecurityEventType, success: bool
+    ) -> List[SecurityAuditLog]:
+        """
+        Find audit logs matching an event type and outcome.
+
+        Args:
+            event_type: Event type to search for
+            success: Outcome to search for
+
+        Returns:
+            List of audit logs matching both criteria
+        """
+        bucket = self._by_event_success.get((event_type, success), ())
+        return [self._storage[log_id] for log_id in bucket]
+
+    def count_by_event_type_success(
+        self, event_type: SecurityEventType, success: bool
+    ) -> int:
+        """
+        Count audit logs matching an event type and outcome.
+
+        Args:
+            event_type: Event type to count
+            success: Outcome to count
+
+        Returns:
+            Number of audit logs matching both criteria
+        """
+        return len(self._by_event_success.get((event_type, success), ()))
+
     def find_successful_events(self) -> List[SecurityAuditLog]:
         """
         Find all successful security events.
@@ -52,7 +380,7 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             List of successful audit logs
         """
-        return self.find_by_attribute('success', True)
+        return self.find_by_indexed_attribute('success', True)
     
     def find_failed_events(self) -> List[SecurityAuditLog]:
         """
@@ -61,7 +389,7 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             List of failed audit logs
         """
-        return self.find_by_attribute('success', False)
+        return self.find_by_indexed_attribute('success', False)
     
     def find_by_ip_address(self, ip_address: str) -> List[SecurityAuditLog]:
         """
@@ -75,8 +403,8 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         """
         if not ip_address:
             return []
-        
-        return self.find_by_attribute('ip_address', ip_address.strip())
+
+        return self.find_by_indexed_attribute('ip_address', ip_address.strip())
     
     def find_by_user_and_event_type(self, user_id: str, event_type: SecurityEventType) -> List[SecurityAuditLog]:
         """
@@ -91,11 +419,10 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         """
         if not user_id:
             return []
-        
-        return self.find_by_multiple_attributes(
-            user_id=user_id.strip(),
-            event_type=event_type
-        )
+
+        # Compound bucket: the pair is one hash probe, already filtered
+        bucket = self._by_user_event.get((user_id.strip(), event_type), ())
+        return [self._storage[log_id] for log_id in bucket]
     
     def find_failed_events_by_user(self, user_id: str) -> List[SecurityAuditLog]:
         """
@@ -109,12 +436,11 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         """
         if not user_id:
             return []
-        
-        return self.find_by_multiple_attributes(
-            user_id=user_id.strip(),
-            success=False
-        )
-    
+
+        # Compound bucket: the pair is one hash probe, already filtered
+        bucket = self._by_user_success.get((user_id.strip(), False), ())
+        return [self._storage[log_id] for log_id in bucket]
+
     def find_login_attempts(self, user_id: Optional[str] = None) -> List[SecurityAuditLog]:
         """
         Find all login attempts (both successful and failed).
@@ -125,22 +451,38 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             List of login attempt audit logs
         """
-        login_events = []
-        
-        # Find both success and failure login events
-        success_logins = self.find_by_event_type(SecurityEventType.LOGIN_SUCCESS)
-        failed_logins = self.find_by_event_type(SecurityEventType.LOGIN_FAILURE)
-        
-        login_events.extend(success_logins)
-        login_events.extend(failed_logins)
-        
-        # Filter by user if specified
+        # Each event-type bucket is already time-sorted, so a lazy merge
+        # of the two reversed buckets yields newest-first order directly,
+        # with no concatenation and no O(n log n) sort
+        merged = heapq.merge(
+            reversed(self._sorted_by_type.get(SecurityEventType.LOGIN_SUCCESS, [])),
+            reversed(self._sorted_by_type.get(SecurityEventType.LOGIN_FAILURE, [])),
+            reverse=True
+        )
+
+        logs = (self._storage[log_id] for _, log_id in merged)
         if user_id:
-            login_events = [log for log in login_events if log.user_id == user_id.strip()]
-        
-        # Sort by created_at descending
-        return sorted(login_events, key=lambda log: log.created_at, reverse=True)
+            wanted = user_id.strip()
+            return [log for log in logs if log.user_id == wanted]
+        return list(logs)
     
+    def count_login_attempts(self) -> dict:
+        """
+        Count login attempts in a single pass without materializing lists.
+
+        Returns:
+            Dictionary with total, successful and failed login attempt counts
+        """
+        self._ensure_columns()
+        successful = self._col_event.count(_EVENT_CODES[SecurityEventType.LOGIN_SUCCESS])
+        failed = self._col_event.count(_EVENT_CODES[SecurityEventType.LOGIN_FAILURE])
+
+        return {
+            "total": successful + failed,
+            "successful": successful,
+            "failed": failed
+        }
+
     def find_failed_login_attempts(self, user_id: Optional[str] = None) -> List[SecurityAuditLog]:
         """
         Find failed login attempts.
@@ -151,141 +493,190 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             List of failed login attempt audit logs
         """
-        failed_logins = self.find_by_event_type(SecurityEventType.LOGIN_FAILURE)
-        
+        bucket = self._sorted_by_type.get(SecurityEventType.LOGIN_FAILURE, [])
+        logs = (self._storage[log_id] for _, log_id in reversed(bucket))
+
         if user_id:
-            failed_logins = [log for log in failed_logins if log.user_id == user_id.strip()]
-        
-        return sorted(failed_logins, key=lambda log: log.created_at, reverse=True)
+            wanted = user_id.strip()
+            return [log for log in logs if log.user_id == wanted]
+        return list(logs)
     
-    def find_events_in_time_range(
+    def _iter_events_in_time_range(
         self,
         start_time: datetime,
         end_time: datetime,
         user_id: Optional[str] = None,
         event_type: Optional[SecurityEventType] = None
+    ) -> Iterator[SecurityAuditLog]:
+        """
+        Iterate audit logs within a time range, newest first.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+            user_id: Optional user ID to filter by
+            event_type: Optional event type to filter by
+
+        Yields:
+            Audit logs within the time range
+        """
+        # The timestamp column is sorted, so the window is two bisects and
+        # the newest-first order falls out of walking the slice backwards;
+        # optional filters are bucket membership tests on the window only
+        self._ensure_columns()
+        lo = bisect.bisect_left(self._col_ts, start_time.timestamp())
+        hi = bisect.bisect_right(self._col_ts, end_time.timestamp())
+
+        user_bucket = None
+        if user_id:
+            user_bucket = self._indexes['user_id'].get(user_id.strip(), set())
+        event_bucket = None
+        if event_type:
+            event_bucket = self._indexes['event_type'].get(event_type, set())
+
+        for i in range(hi - 1, lo - 1, -1):
+            log_id = self._col_ids[i]
+            if user_bucket is not None and log_id not in user_bucket:
+                continue
+            if event_bucket is not None and log_id not in event_bucket:
+                continue
+            yield self._storage[log_id]
+
+    def find_events_in_time_range(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        user_id: Optional[str] = None,
+        event_type: Optional[SecurityEventType] = None,
+        limit: Optional[int] = None
     ) -> List[SecurityAuditLog]:
         """
         Find audit logs within a specific time range.
-        
+
         Args:
             start_time: Start of time range
             end_time: End of time range
             user_id: Optional user ID to filter by
             event_type: Optional event type to filter by
-        
+            limit: Optional cap on results; the generator stops as soon as
+                that many newest entries are produced
+
         Returns:
-            List of audit logs within the time range
+            List of audit logs within the time range, newest first
         """
-        results = []
-        
-        for log in self.find_all():
-            # Check time range
-            if not (start_time <= log.created_at <= end_time):
-                continue
-            
-            # Check user filter
-            if user_id and log.user_id != user_id.strip():
-                continue
-            
-            # Check event type filter
-            if event_type and log.event_type != event_type:
-                continue
-            
-            results.append(log)
-        
-        return sorted(results, key=lambda log: log.created_at, reverse=True)
+        events = self._iter_events_in_time_range(
+            start_time, end_time, user_id, event_type
+        )
+        return list(islice(events, limit) if limit is not None else events)
     
-    def find_recent_events(self, hours: int = 24, user_id: Optional[str] = None) -> List[SecurityAuditLog]:
+    def find_recent_events(
+        self,
+        hours: int = 24,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[SecurityAuditLog]:
         """
         Find recent audit logs within the specified hours.
-        
+
         Args:
             hours: Number of hours to look back
             user_id: Optional user ID to filter by
-        
+            limit: Optional cap on results (newest first)
+
         Returns:
             List of recent audit logs
         """
         end_time = datetime.now(timezone.utc)
-        start_time = end_time - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(hours=hours)
-        
-        return self.find_events_in_time_range(start_time, end_time, user_id)
+        start_time = end_time - timedelta(hours=hours)
+
+        return self.find_events_in_time_range(start_time, end_time, user_id, limit=limit)
     
-    def find_suspicious_activities(self, hours: int = 1) -> List[SecurityAuditLog]:
+    def find_suspicious_activities(
+        self, hours: int = 1, limit: Optional[int] = None
+    ) -> List[SecurityAuditLog]:
         """
         Find potentially suspicious activities (multiple failed attempts from same IP).
-        
+
         Args:
             hours: Number of hours to look back
-        
+            limit: Optional cap on results (newest first)
+
         Returns:
             List of suspicious audit logs
         """
-        recent_failed = self.find_recent_events(hours)
-        failed_events = [log for log in recent_failed if not log.success]
-        
-        # Group by IP address and count failures
-        ip_failure_counts = {}
-        for log in failed_events:
-            if log.ip_address:
-                ip = log.ip_address
-                if ip not in ip_failure_counts:
-                    ip_failure_counts[ip] = []
-                ip_failure_counts[ip].append(log)
-        
-        # Return logs from IPs with multiple failures
-        suspicious = []
-        for ip, logs in ip_failure_counts.items():
-            if len(logs) >= 3:  # 3 or more failures from same IP
-                suspicious.extend(logs)
-        
-        return sorted(suspicious, key=lambda log: log.created_at, reverse=True)
+        # Single streaming pass over the recent window: bisect the sorted
+        # timestamp column for the cutoff, keep only failures with an IP,
+        # and group as we go
+        self._ensure_columns()
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        start = bisect.bisect_left(self._col_ts, cutoff.timestamp())
+
+        ip_failures = defaultdict(list)
+        for i in range(start, len(self._col_ids)):
+            if not self._col_success[i]:
+                log = self._storage[self._col_ids[i]]
+                if log.ip_address:
+                    ip_failures[log.ip_address].append(log)
+
+        # 3 or more failures from the same IP counts as suspicious
+        suspicious = (
+            log
+            for logs in ip_failures.values()
+            if len(logs) >= 3
+            for log in logs
+        )
+
+        if limit is not None:
+            # Top-N heap selection: O(n log k) instead of sorting everything
+            return heapq.nlargest(limit, suspicious, key=attrgetter('created_at'))
+
+        return sorted(suspicious, key=attrgetter('created_at'), reverse=True)
     
-    def get_event_statistics(self, hours: int = 24) -> dict:
+    def get_event_statistics(self, hours: int = 24, exact: bool = True) -> dict:
         """
         Get statistics about security events within the specified time period.
         
         Args:
             hours: Number of hours to analyze
+            exact: If False, estimate the unique user/IP counts with a
+                fixed-memory sketch instead of building full sets; useful
+                for very large windows
         
         Returns:
             Dictionary with event statistics
         """
+        return self._cached_report(
+            ('event_statistics', hours, exact),
+            lambda: self._compute_event_statistics(hours, exact)
+        )
+
+    def _compute_event_statistics(self, hours: int, exact: bool = True) -> dict:
+        """Build the event statistics report (uncached)."""
         recent_events = self.find_recent_events(hours)
-        
-        stats = {
+
+        # Comprehension/Counter passes keep the per-log work at C level
+        # instead of interpreting dict.get and set.add per entry
+        successful = sum(1 for log in recent_events if log.success)
+
+        if exact:
+            unique_users = len({log.user_id for log in recent_events if log.user_id})
+            unique_ips = len({log.ip_address for log in recent_events if log.ip_address})
+        else:
+            unique_users = _estimate_distinct(
+                log.user_id for log in recent_events if log.user_id
+            )
+            unique_ips = _estimate_distinct(
+                log.ip_address for log in recent_events if log.ip_address
+            )
+
+        return {
             "total_events": len(recent_events),
-            "successful_events": 0,
-            "failed_events": 0,
-            "event_types": {},
-            "unique_users": set(),
-            "unique_ips": set()
+            "successful_events": successful,
+            "failed_events": len(recent_events) - successful,
+            "event_types": dict(Counter(log.event_type.value for log in recent_events)),
+            "unique_users": unique_users,
+            "unique_ips": unique_ips
         }
-        
-        for log in recent_events:
-            if log.success:
-                stats["successful_events"] += 1
-            else:
-                stats["failed_events"] += 1
-            
-            # Count event types
-            event_type = log.event_type.value
-            stats["event_types"][event_type] = stats["event_types"].get(event_type, 0) + 1
-            
-            # Track unique users and IPs
-            if log.user_id:
-                stats["unique_users"].add(log.user_id)
-            if log.ip_address:
-                stats["unique_ips"].add(log.ip_address)
-        
-        # Convert sets to counts
-        stats["unique_users"] = len(stats["unique_users"])
-        stats["unique_ips"] = len(stats["unique_ips"])
-        
-        return stats
     
     def get_user_activity_summary(self, user_id: str, hours: int = 24) -> dict:
         """
@@ -298,31 +689,24 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             Dictionary with user activity summary
         """
+        return self._cached_report(
+            ('user_activity', user_id, hours),
+            lambda: self._compute_user_activity_summary(user_id, hours)
+        )
+
+    def _compute_user_activity_summary(self, user_id: str, hours: int) -> dict:
+        """Build the user activity summary (uncached)."""
+        # Events arrive newest first, so the first entry is the last activity
         user_events = self.find_recent_events(hours, user_id)
-        
-        summary = {
+        successful = sum(1 for log in user_events if log.success)
+
+        return {
             "total_events": len(user_events),
-            "successful_events": 0,
-            "failed_events": 0,
-            "event_types": {},
-            "last_activity": None
+            "successful_events": successful,
+            "failed_events": len(user_events) - successful,
+            "event_types": dict(Counter(log.event_type.value for log in user_events)),
+            "last_activity": user_events[0].created_at if user_events else None
         }
-        
-        for log in user_events:
-            if log.success:
-                summary["successful_events"] += 1
-            else:
-                summary["failed_events"] += 1
-            
-            # Count event types
-            event_type = log.event_type.value
-            summary["event_types"][event_type] = summary["event_types"].get(event_type, 0) + 1
-            
-            # Track last activity
-            if summary["last_activity"] is None or log.created_at > summary["last_activity"]:
-                summary["last_activity"] = log.created_at
-        
-        return summary
     
     def cleanup_old_logs(self, older_than_days: int = 90) -> int:
         """
@@ -334,21 +718,13 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             Number of logs removed
         """
-        cutoff_date = datetime.now(timezone.utc) - timezone.utc.localize(
-            datetime.now()
-        ).replace(tzinfo=None).timedelta(days=older_than_days)
-        
-        old_logs = []
-        for log in self.find_all():
-            if log.created_at < cutoff_date:
-                old_logs.append(log)
-        
-        count = 0
-        for log in old_logs:
-            if self.delete_by_id(log.id):
-                count += 1
-        
-        return count
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+        # Expired logs form a prefix of the sorted timestamp column; slice
+        # it and hand the ids to bulk_delete for batched index teardown
+        self._ensure_columns()
+        hi = bisect.bisect_left(self._col_ts, cutoff_date.timestamp())
+        return self.bulk_delete(self._col_ids[:hi])
     
     def delete_by_user_id(self, user_id: str) -> int:
         """
@@ -360,11 +736,8 @@ class SecurityAuditLogRepository(InMemoryRepository[SecurityAuditLog]):
         Returns:
             Number of logs deleted
         """
-        user_logs = self.find_by_user_id(user_id)
-        count = 0
-        
-        for log in user_logs:
-            if self.delete_by_id(log.id):
-                count += 1
-        
-        return count
+        if not user_id:
+            return 0
+
+        bucket = self._indexes['user_id'].get(user_id.strip())
+        return self.bulk_delete(list(bucket)) if bucket else 0
@@ -5,11 +5,24 @@ User entity for the User Management domain model.
 from datetime import datetime, timezone
 from typing import Optional
 import re
+import sys
 
 from base_entity import BaseEntity
 from enums import UserRole
 from exceptions import ValidationException
 
+# Basic email format validation (RFC 5322 compliant), compiled once so
+# per-user validation skips the re module's cache lookup
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# role.value resolved once per member instead of through the enum
+# descriptor on every serialization
+_ROLE_VALUE = {role: role.value for role in UserRole}
+
+# Value-string to member table so role validation can coerce string
+# input with one dict probe instead of a try/except around UserRole()
+_ROLE_BY_VALUE = {role.value: role for role in UserRole}
+
 
 class User(BaseEntity):
     """
@@ -29,7 +42,15 @@ class User(BaseEntity):
         profile_picture_url (str): URL to profile picture
         phone_number (str): Contact phone number
     """
-    
+
+    # User collections dominate the store; skip the per-instance __dict__
+    # like the other stored entities
+    __slots__ = (
+        'name', 'email', 'role', 'employee_id', 'department', 'job_title',
+        'is_active', 'last_login_at', 'profile_picture_url', 'phone_number',
+        '_iso_cache'
+    )
+
     def __init__(
         self,
         name: str,
@@ -78,6 +99,10 @@ class User(BaseEntity):
         self.last_login_at = last_login_at
         self.profile_picture_url = profile_picture_url
         self.phone_number = phone_number
+
+        # isoformat strings memoized per field; every mutation funnels
+        # through update_timestamp, which resets the cache
+        self._iso_cache: dict = {}
     
     def _validate_name(self, name: str) -> str:
         """Validate user name."""
@@ -93,19 +118,32 @@ class User(BaseEntity):
             raise ValidationException("Email is required")
         
         email = email.strip().lower()
-        
-        # Basic email format validation (RFC 5322 compliant)
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+
+        # Cheap structural check first: exactly one '@' with a dotted
+        # domain. Obviously bad input never engages the regex; the regex
+        # stays the final authority for anything that passes
+        at = email.find('@')
+        if at < 1 or email.find('@', at + 1) != -1 or '.' not in email[at + 1:]:
             raise ValidationException("Invalid email format")
-        
+
+        if not _EMAIL_RE.match(email):
+            raise ValidationException("Invalid email format")
+
         return email
     
     def _validate_role(self, role: UserRole) -> UserRole:
-        """Validate user role."""
-        if not isinstance(role, UserRole):
-            raise ValidationException("Role must be a valid UserRole enum")
-        return role
+        """Validate user role, coercing value strings to enum members."""
+        # Exact class check instead of the isinstance MRO walk; members
+        # are always direct UserRole instances
+        if role.__class__ is UserRole:
+            return role
+
+        if isinstance(role, str):
+            member = _ROLE_BY_VALUE.get(role)
+            if member is not None:
+                return member
+
+        raise ValidationException("Role must be a valid UserRole enum")
     
     def _validate_employee_id(self, employee_id: str) -> str:
         """Validate employee ID (must be pure numeric string)."""
@@ -116,8 +154,8 @@ class User(BaseEntity):
         
         if not employee_id.isdigit():
             raise ValidationException("Employee ID must be a pure numeric string")
-        
-        return employee_id
+
+        return sys.intern(employee_id)
     
     def _validate_department(self, department: str) -> str:
         """Validate department."""
@@ -125,7 +163,9 @@ class User(BaseEntity):
             raise ValidationException("Department is required")
         if len(department.strip()) > 255:
             raise ValidationException("Department must be 255 characters or less")
-        return department.strip()
+        # Departments come from a small shared vocabulary; intern so every
+        # user in a department references one string object
+        return sys.intern(department.strip())
     
     def _validate_job_title(self, job_title: str) -> str:
         """Validate job title."""
@@ -133,8 +173,21 @@ class User(BaseEntity):
             raise ValidationException("Job title is required")
         if len(job_title.strip()) > 255:
             raise ValidationException("Job title must be 255 characters or less")
-        return job_title.strip()
+        return sys.intern(job_title.strip())
     
+    def update_timestamp(self, now: Optional[datetime] = None) -> None:
+        """Update the updated_at timestamp and drop stale isoformat strings."""
+        self._iso_cache = {}
+        super().update_timestamp(now)
+
+    def _iso(self, name: str, value: Optional[datetime]) -> Optional[str]:
+        """Memoized isoformat for a datetime field; None passes through."""
+        formatted = self._iso_cache.get(name)
+        if formatted is None and value is not None:
+            formatted = value.isoformat()
+            self._iso_cache[name] = formatted
+        return formatted
+
     def activate(self) -> None:
         """Activate the user account."""
         self.is_active = True
@@ -187,18 +240,18 @@ class User(BaseEntity):
             "id": self.id,
             "name": self.name,
             "email": self.email,
-            "role": self.role.value,
+            "role": _ROLE_VALUE[self.role],
             "employee_id": self.employee_id,
             "department": self.department,
             "job_title": self.job_title,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat(),
-            "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None,
+            "created_at": self._iso("created_at", self.created_at),
+            "last_login_at": self._iso("last_login_at", self.last_login_at),
             "profile_picture_url": self.profile_picture_url,
             "phone_number": self.phone_number,
-            "updated_at": self.updated_at.isoformat()
+            "updated_at": self._iso("updated_at", self.updated_at)
         }
     
     def __str__(self) -> str:
         """String representation of the user."""
-        return f"User(id='{self.id}', name='{self.name}', email='{self.email}', role='{self.role.value}')"
+        return f"User(id='{self.id}', name='{self.name}', email='{self.email}', role='{_ROLE_VALUE[self.role]}')"
@@ -3,12 +3,26 @@ UserCredentials entity for the User Management domain model.
 """
 
 import bcrypt
+import hmac
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from os import urandom
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # C-accelerated serializer is an optional speedup
+    orjson = None
 
 from base_entity import BaseEntity
 from exceptions import ValidationException, AccountLockedException
 
+# Per-process key for the verify-cache HMAC; never persisted, so cached
+# entries cannot outlive the process or leak password material
+_PROCESS_KEY = urandom(32)
+
 
 class UserCredentials(BaseEntity):
     """
@@ -17,8 +31,8 @@ class UserCredentials(BaseEntity):
     Attributes:
         id (str): Unique identifier for the credentials
         user_id (str): Reference to the User entity
-        password_hash (str): Hashed password using bcrypt
-        password_salt (str): Salt used for password hashing
+        password_hash (bytes): Hashed password using bcrypt
+        password_salt (bytes): Salt used for password hashing
         password_last_changed (datetime): When the password was last changed
         failed_login_attempts (int): Number of consecutive failed login attempts
         account_locked_until (datetime): Account lockout expiration time
@@ -27,11 +41,20 @@ class UserCredentials(BaseEntity):
         updated_at (datetime): When the credentials were last updated
     """
     
+    # One credentials row per user; skip the per-instance __dict__ like
+    # the other stored entities
+    __slots__ = (
+        'user_id', 'password_hash', 'password_salt', 'password_last_changed',
+        'failed_login_attempts', 'account_locked_until', 'must_change_password',
+        '_verify_cache', '_iso_cache'
+    )
+
     # Security constants
     MAX_FAILED_ATTEMPTS = 5
     LOCKOUT_DURATION_MINUTES = 30
     BCRYPT_ROUNDS = 12
     MIN_PASSWORD_LENGTH = 6
+    VERIFY_CACHE_TTL_SECONDS = 30
     
     def __init__(
         self,
@@ -60,22 +83,31 @@ class UserCredentials(BaseEntity):
         self.failed_login_attempts = 0
         self.account_locked_until: Optional[datetime] = None
         self.must_change_password = must_change_password
-    
+
+        # Successful verifies cached briefly (HMAC key -> monotonic time)
+        # so re-auth flows within a request lifetime skip the bcrypt cost
+        self._verify_cache: Dict[bytes, float] = {}
+
+        # isoformat strings memoized per field; every mutation funnels
+        # through update_timestamp, which resets the cache
+        self._iso_cache: Dict[str, str] = {}
+
     def _validate_user_id(self, user_id: str) -> str:
         """Validate user ID."""
         if not user_id or not user_id.strip():
             raise ValidationException("User ID is required")
         return user_id.strip()
     
-    def _validate_password(self, password: str) -> str:
+    @classmethod
+    def _validate_password(cls, password: str) -> str:
         """Validate password requirements."""
         if not password:
             raise ValidationException("Password is required")
-        if len(password) < self.MIN_PASSWORD_LENGTH:
-            raise ValidationException(f"Password must be at least {self.MIN_PASSWORD_LENGTH} characters long")
+        if len(password) < cls.MIN_PASSWORD_LENGTH:
+            raise ValidationException(f"Password must be at least {cls.MIN_PASSWORD_LENGTH} characters long")
         return password
     
-    def _hash_password(self, password: str) -> tuple[str, str]:
+    def _hash_password(self, password: str) -> tuple[bytes, bytes]:
         """
         Hash password using bcrypt.
         
@@ -87,12 +119,83 @@ class UserCredentials(BaseEntity):
         """
         validated_password = self._validate_password(password)
         
-        # Generate salt and hash password
+        # Generate salt and hash password; both stay bytes so verification
+        # feeds bcrypt directly without a decode/encode round trip
         salt = bcrypt.gensalt(rounds=self.BCRYPT_ROUNDS)
         password_hash = bcrypt.hashpw(validated_password.encode('utf-8'), salt)
-        
-        return password_hash.decode('utf-8'), salt.decode('utf-8')
+
+        return password_hash, salt
     
+    @classmethod
+    def _from_prehashed(
+        cls,
+        user_id: str,
+        password_hash: bytes,
+        password_salt: bytes,
+        must_change_password: bool = False
+    ) -> 'UserCredentials':
+        """
+        Build credentials from an already-computed hash, skipping bcrypt.
+
+        Args:
+            user_id: Reference to the User entity
+            password_hash: bcrypt hash of the password
+            password_salt: Salt the hash was computed with
+            must_change_password: Whether user must change password on next login
+
+        Returns:
+            UserCredentials instance
+        """
+        credentials = object.__new__(cls)
+        BaseEntity.__init__(credentials)
+        credentials.user_id = credentials._validate_user_id(user_id)
+        credentials.password_hash = password_hash
+        credentials.password_salt = password_salt
+        credentials.password_last_changed = datetime.now(timezone.utc)
+        credentials.failed_login_attempts = 0
+        credentials.account_locked_until = None
+        credentials.must_change_password = must_change_password
+        credentials._verify_cache = {}
+        credentials._iso_cache = {}
+        return credentials
+
+    @classmethod
+    def bulk_create(
+        cls,
+        pairs: List[Tuple[str, str]],
+        workers: Optional[int] = None
+    ) -> List['UserCredentials']:
+        """
+        Create credentials for many users, hashing passwords in parallel.
+
+        bcrypt is CPU-bound C work, so a bulk import hashing sequentially
+        pays the full per-password cost serially; farming the hashing out
+        to a process pool scales it with cores.
+
+        Args:
+            pairs: (user_id, plain text password) tuples
+            workers: Optional process count (defaults to the executor's)
+
+        Returns:
+            List of UserCredentials in the same order as pairs
+
+        Raises:
+            ValidationException: If any user ID or password is invalid
+        """
+        pairs = list(pairs)
+        for _, password in pairs:
+            cls._validate_password(password)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            hashes = list(executor.map(
+                _bcrypt_hash_worker, [password for _, password in pairs], chunksize=8
+            ))
+
+        return [
+            cls._from_prehashed(user_id, password_hash, password_salt)
+            for (user_id, _), (password_hash, password_salt) in zip(pairs, hashes)
+        ]
+
     def verify_password(self, password: str) -> bool:
         """
         Verify password against stored hash.
@@ -106,29 +209,44 @@ class UserCredentials(BaseEntity):
         Raises:
             AccountLockedException: If account is currently locked
         """
+        # One clock read per verification, shared by the lockout check and
+        # whichever attempt counter update follows
+        now = datetime.now(timezone.utc)
+
         # Check if account is locked
-        if self.is_account_locked():
+        if self.is_account_locked(now=now):
             raise AccountLockedException("Account is temporarily locked due to too many failed login attempts")
-        
+
         if not password:
             return False
-        
+
+        # Only successful verifies are cached, so failed attempts always
+        # reach bcrypt and the lockout counters; a cache hit means this
+        # exact password already passed within the TTL
+        cache_key = hmac.new(_PROCESS_KEY, password.encode('utf-8'), 'sha256').digest()
+        cached_at = self._verify_cache.get(cache_key)
+        if cached_at is not None:
+            if time.monotonic() - cached_at < self.VERIFY_CACHE_TTL_SECONDS:
+                # A cache hit is still a successful login: clear the
+                # failure counters exactly as the bcrypt path does
+                self._reset_failed_attempts(now=now)
+                return True
+            del self._verify_cache[cache_key]
+
         try:
             # Verify password using bcrypt
-            is_valid = bcrypt.checkpw(
-                password.encode('utf-8'),
-                self.password_hash.encode('utf-8')
-            )
+            is_valid = bcrypt.checkpw(password.encode('utf-8'), self.password_hash)
             
             if is_valid:
-                self._reset_failed_attempts()
+                self._verify_cache[cache_key] = time.monotonic()
+                self._reset_failed_attempts(now=now)
             else:
-                self._increment_failed_attempts()
-            
+                self._increment_failed_attempts(now=now)
+
             return is_valid
-        
+
         except Exception:
-            self._increment_failed_attempts()
+            self._increment_failed_attempts(now=now)
             return False
     
     def change_password(self, old_password: str, new_password: str) -> None:
@@ -151,6 +269,7 @@ class UserCredentials(BaseEntity):
         self.password_hash, self.password_salt = self._hash_password(new_password)
         self.password_last_changed = datetime.now(timezone.utc)
         self.must_change_password = False
+        self._verify_cache.clear()
         self.update_timestamp()
     
     def reset_password(self, new_password: str) -> None:
@@ -163,43 +282,79 @@ class UserCredentials(BaseEntity):
         self.password_hash, self.password_salt = self._hash_password(new_password)
         self.password_last_changed = datetime.now(timezone.utc)
         self.must_change_password = False
+        self._verify_cache.clear()
         self._reset_failed_attempts()
         self.update_timestamp()
     
-    def _increment_failed_attempts(self) -> None:
-        """Increment failed login attempts and lock account if necessary."""
+    def _increment_failed_attempts(self, now: Optional[datetime] = None) -> None:
+        """
+        Increment failed login attempts and lock account if necessary.
+
+        Args:
+            now: Optional precomputed current time to share one clock read
+                across the verification path
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         self.failed_login_attempts += 1
-        
+
         if self.failed_login_attempts >= self.MAX_FAILED_ATTEMPTS:
-            self.account_locked_until = datetime.now(timezone.utc) + timedelta(
+            self.account_locked_until = now + timedelta(
                 minutes=self.LOCKOUT_DURATION_MINUTES
             )
-        
-        self.update_timestamp()
-    
-    def _reset_failed_attempts(self) -> None:
-        """Reset failed login attempts and unlock account."""
+
+        self.update_timestamp(now=now)
+
+    def _reset_failed_attempts(self, now: Optional[datetime] = None) -> None:
+        """
+        Reset failed login attempts and unlock account.
+
+        Args:
+            now: Optional precomputed current time to share one clock read
+                across the verification path
+        """
         self.failed_login_attempts = 0
         self.account_locked_until = None
-        self.update_timestamp()
-    
-    def is_account_locked(self) -> bool:
+        self.update_timestamp(now=now)
+
+    def is_account_locked(self, now: Optional[datetime] = None) -> bool:
         """
         Check if account is currently locked.
-        
+
+        Args:
+            now: Optional precomputed current time to share one clock read
+                across the verification path
+
         Returns:
             True if account is locked, False otherwise
         """
         if self.account_locked_until is None:
             return False
-        
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         # Check if lockout period has expired
-        if datetime.now(timezone.utc) >= self.account_locked_until:
-            self._reset_failed_attempts()
+        if now >= self.account_locked_until:
+            self._reset_failed_attempts(now=now)
             return False
-        
+
         return True
     
+    def update_timestamp(self, now: Optional[datetime] = None) -> None:
+        """Update the updated_at timestamp and drop stale isoformat strings."""
+        self._iso_cache = {}
+        super().update_timestamp(now)
+
+    def _iso(self, name: str, value: Optional[datetime]) -> Optional[str]:
+        """Memoized isoformat for a datetime field; None passes through."""
+        formatted = self._iso_cache.get(name)
+        if formatted is None and value is not None:
+            formatted = value.isoformat()
+            self._iso_cache[name] = formatted
+        return formatted
+
     def unlock_account(self) -> None:
         """Manually unlock account (admin function)."""
         self._reset_failed_attempts()
@@ -214,14 +369,55 @@ class UserCredentials(BaseEntity):
         return {
             "id": self.id,
             "user_id": self.user_id,
-            "password_last_changed": self.password_last_changed.isoformat(),
+            "password_last_changed": self._iso("password_last_changed", self.password_last_changed),
             "failed_login_attempts": self.failed_login_attempts,
-            "account_locked_until": self.account_locked_until.isoformat() if self.account_locked_until else None,
+            "account_locked_until": self._iso("account_locked_until", self.account_locked_until),
             "must_change_password": self.must_change_password,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": self._iso("created_at", self.created_at),
+            "updated_at": self._iso("updated_at", self.updated_at)
         }
     
+    def to_json(self) -> str:
+        """
+        Convert credentials metadata to a JSON string (excluding sensitive data).
+
+        With orjson available, datetimes are handed over raw and formatted
+        in C, skipping the Python-level isoformat calls entirely; otherwise
+        this falls back to to_dict plus stdlib json.
+
+        Returns:
+            JSON representation of the credentials metadata
+        """
+        if orjson is not None:
+            return orjson.dumps({
+                "id": self.id,
+                "user_id": self.user_id,
+                "password_last_changed": self.password_last_changed,
+                "failed_login_attempts": self.failed_login_attempts,
+                "account_locked_until": self.account_locked_until,
+                "must_change_password": self.must_change_password,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at
+            }).decode('utf-8')
+
+        return json.dumps(self.to_dict())
+
     def __str__(self) -> str:
         """String representation of the credentials."""
         return f"UserCredentials(id='{self.id}', user_id='{self.user_id}')"
+
+
+def _bcrypt_hash_worker(password: str) -> Tuple[bytes, bytes]:
+    """
+    Hash one password in a pool worker process.
+
+    Module-level so the executor can pickle it.
+
+    Args:
+        password: Plain text password (already validated by the caller)
+
+    Returns:
+        Tuple of (password_hash, password_salt)
+    """
+    salt = bcrypt.gensalt(rounds=UserCredentials.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode('utf-8'), salt), salt
@@ -2,8 +2,9 @@
 UserCredentialsRepository for the User Management domain model.
 """
 
-from typing import List, Optional
-from datetime import datetime, timezone
+import bisect
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from datetime import datetime, timezone, timedelta
 
 from base_repository import InMemoryRepository
 from user_credentials import UserCredentials
@@ -17,7 +18,31 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
     Provides methods for finding credentials by user ID and managing account security.
     Enforces one-to-one relationship between User and UserCredentials.
     """
-    
+
+    def __init__(self):
+        """Initialize the credentials repository with its secondary indexes."""
+        super().__init__()
+
+        # Every lookup, uniqueness check and admin action keys on user_id;
+        # the index turns those scans into single hash probes
+        self.register_index('user_id')
+
+        # (password_last_changed, id) kept sorted so password-age queries
+        # bisect to the stale prefix instead of scanning every account.
+        # The per-id snapshot detects in-place password changes on re-save.
+        self._by_password_changed: List[Tuple[datetime, str]] = []
+        self._pwd_changed_of: Dict[str, datetime] = {}
+
+        # Running aggregates for the security summary, delta-adjusted from
+        # per-id snapshots on save/delete so the dashboard reads are O(1).
+        # Lock expiry depends on the wall clock, so lockouts live in a
+        # sorted (locked_until, id) list instead of a counter: the locked
+        # accounts are the suffix after a bisect on "now"
+        self._failed_ids: Set[str] = set()
+        self._must_change_count = 0
+        self._locked_until: List[Tuple[datetime, str]] = []
+        self._flags_of: Dict[str, Tuple[bool, bool, Optional[datetime]]] = {}
+
     def save(self, credentials: UserCredentials) -> UserCredentials:
         """
         Save user credentials with uniqueness validation.
@@ -35,8 +60,157 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         existing_credentials = self.find_by_user_id(credentials.user_id)
         if existing_credentials and existing_credentials.id != credentials.id:
             raise DuplicateEntityException(f"Credentials for user '{credentials.user_id}' already exist")
-        
-        return super().save(credentials)
+
+        saved = super().save(credentials)
+        self._refresh_aggregates(saved)
+        return saved
+
+    def _refresh_aggregates(self, credentials: UserCredentials) -> None:
+        """
+        Re-sync the sorted lists and counters with a stored entity's state.
+
+        Args:
+            credentials: Stored credentials whose fields may have changed
+        """
+        old_changed = self._pwd_changed_of.get(credentials.id)
+        if old_changed != credentials.password_last_changed:
+            if old_changed is not None:
+                self._discard_sorted_entry(
+                    self._by_password_changed, (old_changed, credentials.id)
+                )
+            bisect.insort(
+                self._by_password_changed,
+                (credentials.password_last_changed, credentials.id)
+            )
+            self._pwd_changed_of[credentials.id] = credentials.password_last_changed
+
+        old_flags = self._flags_of.get(credentials.id, (False, False, None))
+        new_flags = (
+            credentials.failed_login_attempts > 0,
+            credentials.must_change_password,
+            credentials.account_locked_until
+        )
+        if new_flags != old_flags:
+            if new_flags[0]:
+                self._failed_ids.add(credentials.id)
+            else:
+                self._failed_ids.discard(credentials.id)
+            self._must_change_count += new_flags[1] - old_flags[1]
+            if new_flags[2] != old_flags[2]:
+                if old_flags[2] is not None:
+                    self._discard_sorted_entry(
+                        self._locked_until, (old_flags[2], credentials.id)
+                    )
+                if new_flags[2] is not None:
+                    bisect.insort(
+                        self._locked_until, (new_flags[2], credentials.id)
+                    )
+            self._flags_of[credentials.id] = new_flags
+
+    def insert_new(self, credentials: UserCredentials) -> UserCredentials:
+        """
+        Insert freshly constructed credentials whose user_id the caller
+        knows to be unclaimed, skipping the duplicate probe in save.
+
+        Args:
+            credentials: New credentials to insert
+
+        Returns:
+            Inserted credentials
+        """
+        saved = InMemoryRepository.save(self, credentials)
+        self._refresh_aggregates(saved)
+        return saved
+
+    def refresh_security_state(self, credentials: UserCredentials) -> None:
+        """
+        Re-sync the aggregates with stored credentials mutated in place.
+
+        verify_password updates the attempt counter and lockout timestamp
+        directly on the stored instance without a save, so callers on the
+        authentication path hand the instance back here to keep the
+        lockout list and failed-attempt set tracking live state.
+
+        Args:
+            credentials: Stored credentials whose security fields changed
+        """
+        if credentials.id in self._storage:
+            self._refresh_aggregates(credentials)
+            self._version += 1
+
+    def delete_by_id(self, entity_id: str) -> bool:
+        """
+        Delete credentials, keeping the password-age list in step.
+
+        Args:
+            entity_id: ID of the credentials to delete
+
+        Returns:
+            True if the credentials were deleted, False if not found
+        """
+        if not super().delete_by_id(entity_id):
+            return False
+
+        changed = self._pwd_changed_of.pop(entity_id, None)
+        if changed is not None:
+            self._discard_sorted_entry(
+                self._by_password_changed, (changed, entity_id)
+            )
+
+        flags = self._flags_of.pop(entity_id, None)
+        if flags is not None:
+            self._failed_ids.discard(entity_id)
+            self._must_change_count -= flags[1]
+            if flags[2] is not None:
+                self._discard_sorted_entry(self._locked_until, (flags[2], entity_id))
+        return True
+
+    def bulk_delete(self, entity_ids) -> int:
+        """
+        Delete a batch of credentials, keeping the aggregates in step.
+
+        Args:
+            entity_ids: IDs of the credentials to delete
+
+        Returns:
+            Number of credentials deleted
+        """
+        ids = [entity_id for entity_id in entity_ids if entity_id in self._storage]
+        count = super().bulk_delete(ids)
+
+        for entity_id in ids:
+            changed = self._pwd_changed_of.pop(entity_id, None)
+            if changed is not None:
+                self._discard_sorted_entry(
+                    self._by_password_changed, (changed, entity_id)
+                )
+            flags = self._flags_of.pop(entity_id, None)
+            if flags is not None:
+                self._failed_ids.discard(entity_id)
+                self._must_change_count -= flags[1]
+                if flags[2] is not None:
+                    self._discard_sorted_entry(
+                        self._locked_until, (flags[2], entity_id)
+                    )
+
+        return count
+
+    def clear(self) -> None:
+        """Clear all credentials and the aggregate structures."""
+        super().clear()
+        self._by_password_changed.clear()
+        self._pwd_changed_of.clear()
+        self._failed_ids.clear()
+        self._must_change_count = 0
+        self._locked_until.clear()
+        self._flags_of.clear()
+
+    @staticmethod
+    def _discard_sorted_entry(entries: List[Tuple], entry: Tuple) -> None:
+        """Remove an entry from a sorted list if present."""
+        i = bisect.bisect_left(entries, entry)
+        if i < len(entries) and entries[i] == entry:
+            del entries[i]
     
     def find_by_user_id(self, user_id: str) -> Optional[UserCredentials]:
         """
@@ -50,8 +224,9 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         """
         if not user_id:
             return None
-        
-        return self.find_first_by_attribute('user_id', user_id.strip())
+
+        matches = self.find_by_indexed_attribute('user_id', user_id.strip())
+        return matches[0] if matches else None
     
     def find_locked_accounts(self) -> List[UserCredentials]:
         """
@@ -60,11 +235,26 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         Returns:
             List of credentials for locked accounts
         """
-        locked_accounts = []
-        for credentials in self.find_all():
-            if credentials.is_account_locked():
-                locked_accounts.append(credentials)
-        return locked_accounts
+        return list(self.iter_locked_accounts())
+
+    def iter_locked_accounts(self) -> Iterator[UserCredentials]:
+        """
+        Iterate over currently locked accounts without building a list.
+
+        Yields:
+            Credentials for locked accounts
+        """
+        # Still-locked accounts are the suffix of the sorted lockout list
+        # whose expiry lies beyond "now"
+        for _, credentials_id in self._locked_until[self._locked_suffix():]:
+            yield self._storage[credentials_id]
+
+    def _locked_suffix(self) -> int:
+        """Index of the first still-active entry in the lockout list."""
+        now = datetime.now(timezone.utc)
+        # Expiry exactly at "now" counts as unlocked, so the sentinel id
+        # pushes the split past any entry with that timestamp
+        return bisect.bisect_right(self._locked_until, (now, '\uffff'))
     
     def find_accounts_with_failed_attempts(self, min_attempts: int = 1) -> List[UserCredentials]:
         """
@@ -76,11 +266,29 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         Returns:
             List of credentials with failed attempts
         """
-        results = []
-        for credentials in self.find_all():
-            if credentials.failed_login_attempts >= min_attempts:
-                results.append(credentials)
-        return results
+        return list(self.iter_accounts_with_failed_attempts(min_attempts))
+
+    def iter_accounts_with_failed_attempts(
+        self, min_attempts: int = 1
+    ) -> Iterator[UserCredentials]:
+        """
+        Iterate over accounts with failed login attempts without a list.
+
+        Args:
+            min_attempts: Minimum number of failed attempts to include
+
+        Yields:
+            Credentials with failed attempts
+        """
+        # Only accounts with any failures are candidates, so scan the
+        # maintained id set rather than the whole table; the auth path
+        # keeps it in step via refresh_security_state. Iterate a snapshot
+        # and re-check the live attribute so remediation sweeps can unlock
+        # or reset accounts mid-iteration without tripping the generator
+        for credentials_id in list(self._failed_ids):
+            credentials = self._storage.get(credentials_id)
+            if credentials is not None and credentials.failed_login_attempts >= min_attempts:
+                yield credentials
     
     def find_accounts_requiring_password_change(self) -> List[UserCredentials]:
         """
@@ -101,15 +309,15 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         Returns:
             List of credentials with old passwords
         """
-        cutoff_date = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timezone.utc.localize(datetime.now()).replace(tzinfo=None).timedelta(days=days_old)
-        
-        results = []
-        for credentials in self.find_all():
-            if credentials.password_last_changed < cutoff_date:
-                results.append(credentials)
-        return results
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
+
+        # Stale passwords form a prefix of the sorted list; one bisect
+        # finds it
+        hi = bisect.bisect_left(self._by_password_changed, (cutoff_date,))
+        return [
+            self._storage[credentials_id]
+            for _, credentials_id in self._by_password_changed[:hi]
+        ]
     
     def unlock_account(self, user_id: str) -> bool:
         """
@@ -123,8 +331,11 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         """
         credentials = self.find_by_user_id(user_id)
         if credentials:
+            # The stored instance was mutated in place; a full save would
+            # only repeat the uniqueness probe, so re-sync the aggregates
+            # directly
             credentials.unlock_account()
-            self.save(credentials)
+            self.refresh_security_state(credentials)
             return True
         return False
     
@@ -141,7 +352,7 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         credentials = self.find_by_user_id(user_id)
         if credentials:
             credentials.force_password_change()
-            self.save(credentials)
+            self.refresh_security_state(credentials)
             return True
         return False
     
@@ -152,7 +363,7 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         Returns:
             Count of locked accounts
         """
-        return len(self.find_locked_accounts())
+        return len(self._locked_until) - self._locked_suffix()
     
     def get_failed_attempts_count(self, min_attempts: int = 1) -> int:
         """
@@ -164,7 +375,13 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         Returns:
             Count of accounts with failed attempts
         """
-        return len(self.find_accounts_with_failed_attempts(min_attempts))
+        if min_attempts <= 1:
+            return len(self._failed_ids)
+
+        return sum(
+            1 for credentials_id in self._failed_ids
+            if self._storage[credentials_id].failed_login_attempts >= min_attempts
+        )
     
     def get_password_change_required_count(self) -> int:
         """
@@ -173,7 +390,7 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         Returns:
             Count of accounts requiring password change
         """
-        return len(self.find_accounts_requiring_password_change())
+        return self._must_change_count
     
     def delete_by_user_id(self, user_id: str) -> bool:
         """
@@ -209,22 +426,10 @@ class UserCredentialsRepository(InMemoryRepository[UserCredentials]):
         Returns:
             Dictionary with security statistics
         """
-        all_credentials = self.find_all()
-        locked_count = 0
-        failed_attempts_count = 0
-        password_change_required_count = 0
-        
-        for credentials in all_credentials:
-            if credentials.is_account_locked():
-                locked_count += 1
-            if credentials.failed_login_attempts > 0:
-                failed_attempts_count += 1
-            if credentials.must_change_password:
-                password_change_required_count += 1
-        
+        # Every figure is a maintained aggregate; no per-account work
         return {
-            "total_accounts": len(all_credentials),
-            "locked_accounts": locked_count,
-            "accounts_with_failed_attempts": failed_attempts_count,
-            "accounts_requiring_password_change": password_change_required_count
+            "total_accounts": len(self._storage),
+            "locked_accounts": self.get_locked_account_count(),
+            "accounts_with_failed_attempts": len(self._failed_ids),
+            "accounts_requiring_password_change": self._must_change_count
         }
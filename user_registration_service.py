@@ -2,7 +2,8 @@
 UserRegistrationService for the User Management domain model.
 """
 
-from typing import Optional, Dict, Any
+import copy
+from typing import List, Optional, Dict, Any, Tuple
 
 from user import User
 from user_credentials import UserCredentials
@@ -27,7 +28,11 @@ class UserRegistrationService:
     - Email verification initiation
     - Security audit logging
     """
-    
+
+    # Buffered audit entries are written through once the buffer reaches
+    # this size (or on an explicit flush)
+    AUDIT_FLUSH_BATCH_SIZE = 50
+
     def __init__(
         self,
         user_repository: UserRepository,
@@ -48,6 +53,14 @@ class UserRegistrationService:
         self.credentials_repository = credentials_repository
         self.email_verification_repository = email_verification_repository
         self.audit_log_repository = audit_log_repository
+
+        # Statistics memoized against the contributing repositories'
+        # version counters; any write there invalidates the cache
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_versions: Optional[Tuple[int, int]] = None
+
+        # Write-behind buffer for audit log entries (batched repository writes)
+        self._audit_buffer: List[SecurityAuditLog] = []
     
     def register_user(
         self,
@@ -99,16 +112,18 @@ class UserRegistrationService:
                 is_active=False  # User starts inactive until email verification
             )
             
-            # Step 3: Save user
-            saved_user = self.user_repository.save(user)
+            # Step 3: Save user. Uniqueness was established in step 1 and
+            # the entity is brand new, so skip the duplicate re-probes
+            saved_user = self.user_repository.insert_new(user)
             logger.info(f"User created with ID: {saved_user.id}")
-            
-            # Step 4: Create credentials
+
+            # Step 4: Create credentials; the fresh user id cannot have
+            # existing credentials
             credentials = UserCredentials(
                 user_id=saved_user.id,
                 password=password
             )
-            saved_credentials = self.credentials_repository.save(credentials)
+            saved_credentials = self.credentials_repository.insert_new(credentials)
             logger.info(f"Credentials created for user: {saved_user.id}")
             
             # Step 5: Create email verification
@@ -190,13 +205,29 @@ class UserRegistrationService:
         Raises:
             DuplicateEntityException: If email or employee ID already exists
         """
-        # Check email uniqueness
+        issues = self._collect_uniqueness_issues(email, employee_id)
+        if issues:
+            # Both probes are index hits, so reporting every conflict at
+            # once costs nothing extra and saves the caller a round trip
+            raise DuplicateEntityException("; ".join(issues))
+
+    def _collect_uniqueness_issues(self, email: str, employee_id: str) -> list:
+        """
+        Collect uniqueness conflicts for an email/employee ID pair.
+
+        Args:
+            email: Email to check
+            employee_id: Employee ID to check
+
+        Returns:
+            List of human-readable conflict descriptions (empty if unique)
+        """
+        issues = []
         if self.user_repository.email_exists(email):
-            raise DuplicateEntityException(f"User with email '{email}' already exists")
-        
-        # Check employee ID uniqueness
+            issues.append(f"User with email '{email}' already exists")
         if self.user_repository.employee_id_exists(employee_id):
-            raise DuplicateEntityException(f"User with employee ID '{employee_id}' already exists")
+            issues.append(f"User with employee ID '{employee_id}' already exists")
+        return issues
     
     def _log_registration_event(
         self,
@@ -224,9 +255,32 @@ class UserRegistrationService:
                 user_agent=user_agent,
                 additional_data=additional_data
             )
-            self.audit_log_repository.save(audit_log)
+            # Buffered so the repository write (and its index updates)
+            # stays off the registration request path
+            self._audit_buffer.append(audit_log)
+
+            if len(self._audit_buffer) >= self.AUDIT_FLUSH_BATCH_SIZE:
+                self.flush_audit_logs()
         except Exception as e:
             logger.error(f"Failed to log registration event: {str(e)}")
+
+    def flush_audit_logs(self) -> int:
+        """
+        Flush all buffered audit log entries to the repository.
+
+        Returns:
+            Number of entries flushed
+        """
+        if not self._audit_buffer:
+            return 0
+
+        pending = self._audit_buffer
+        self._audit_buffer = []
+
+        for audit_log in pending:
+            self.audit_log_repository.save(audit_log)
+
+        return len(pending)
     
     def check_registration_eligibility(self, email: str, employee_id: str) -> Dict[str, Any]:
         """
@@ -239,22 +293,16 @@ class UserRegistrationService:
         Returns:
             Dictionary with eligibility status
         """
-        result = {
-            "eligible": True,
-            "issues": []
-        }
-        
-        # Check email availability
+        issues = []
         if self.user_repository.email_exists(email):
-            result["eligible"] = False
-            result["issues"].append(f"Email '{email}' is already registered")
-        
-        # Check employee ID availability
+            issues.append(f"Email '{email}' is already registered")
         if self.user_repository.employee_id_exists(employee_id):
-            result["eligible"] = False
-            result["issues"].append(f"Employee ID '{employee_id}' is already registered")
-        
-        return result
+            issues.append(f"Employee ID '{employee_id}' is already registered")
+
+        return {
+            "eligible": not issues,
+            "issues": issues
+        }
     
     def get_registration_statistics(self) -> Dict[str, Any]:
         """
@@ -263,34 +311,46 @@ class UserRegistrationService:
         Returns:
             Dictionary with registration statistics
         """
-        # Get all users
-        all_users = self.user_repository.find_all()
-        active_users = self.user_repository.find_active_users()
-        inactive_users = self.user_repository.find_inactive_users()
-        
-        # Get users by role
-        solution_architects = self.user_repository.find_by_role(UserRole.SOLUTION_ARCHITECT)
-        sales_managers = self.user_repository.find_by_role(UserRole.SALES_MANAGER)
-        
-        # Get recent registration events
-        recent_registrations = self.audit_log_repository.find_by_event_type(
-            SecurityEventType.USER_REGISTRATION
+        # Buffered registration events must land before they can be counted
+        self.flush_audit_logs()
+
+        versions = (self.user_repository.version, self.audit_log_repository.version)
+        if self._stats_cache is not None and versions == self._stats_versions:
+            return copy.deepcopy(self._stats_cache)
+
+        # Every figure below is an index bucket size or maintained count;
+        # no user list is materialized
+
+        # Registration outcomes are pre-bucketed at write time, so the
+        # split is two count reads rather than a filtering pass
+        successful_count = self.audit_log_repository.count_by_event_type_success(
+            SecurityEventType.USER_REGISTRATION, True
         )
-        successful_registrations = [log for log in recent_registrations if log.success]
-        failed_registrations = [log for log in recent_registrations if not log.success]
-        
-        return {
-            "total_users": len(all_users),
-            "active_users": len(active_users),
-            "inactive_users": len(inactive_users),
-            "solution_architects": len(solution_architects),
-            "sales_managers": len(sales_managers),
-            "total_registration_attempts": len(recent_registrations),
-            "successful_registrations": len(successful_registrations),
-            "failed_registrations": len(failed_registrations),
+        failed_count = self.audit_log_repository.count_by_event_type_success(
+            SecurityEventType.USER_REGISTRATION, False
+        )
+
+        stats = {
+            "total_users": self.user_repository.count(),
+            "active_users": self.user_repository.count_active_users(),
+            "inactive_users": self.user_repository.count_inactive_users(),
+            "solution_architects": self.user_repository.get_user_count_by_role(
+                UserRole.SOLUTION_ARCHITECT
+            ),
+            "sales_managers": self.user_repository.get_user_count_by_role(
+                UserRole.SALES_MANAGER
+            ),
+            "total_registration_attempts": successful_count + failed_count,
+            "successful_registrations": successful_count,
+            "failed_registrations": failed_count,
             "departments": self.user_repository.get_all_departments(),
             "job_titles": self.user_repository.get_all_job_titles()
         }
+
+        self._stats_cache = stats
+        self._stats_versions = versions
+        # Deep copy out so callers cannot mutate the cached report
+        return copy.deepcopy(stats)
     
     def cleanup_incomplete_registrations(self, hours_old: int = 24) -> Dict[str, int]:
         """
@@ -306,32 +366,33 @@ class UserRegistrationService:
         
         # Find expired email verifications
         expired_verifications = self.email_verification_repository.find_expired_verifications()
-        
-        users_cleaned = 0
-        credentials_cleaned = 0
-        verifications_cleaned = 0
-        
+
+        # Collect the doomed ids in one pass, then hand each repository a
+        # single batch so index teardown happens once per bucket instead
+        # of once per entity
+        user_ids = []
+        verification_ids = []
         for verification in expired_verifications:
-            # Check if user is still inactive
             user = self.user_repository.find_by_id(verification.user_id)
             if user and not user.is_active:
-                # Delete user, credentials, and verification
-                if self.user_repository.delete_by_id(user.id):
-                    users_cleaned += 1
-                
-                if self.credentials_repository.delete_by_user_id(user.id):
-                    credentials_cleaned += 1
-                
-                if self.email_verification_repository.delete_by_id(verification.id):
-                    verifications_cleaned += 1
-                
-                logger.info(f"Cleaned up incomplete registration for user: {user.email}")
-        
+                user_ids.append(user.id)
+                verification_ids.append(verification.id)
+
+        credentials_ids = [
+            credentials.id
+            for credentials in (
+                self.credentials_repository.find_by_user_id(user_id)
+                for user_id in user_ids
+            )
+            if credentials
+        ]
+
         result = {
-            "users_cleaned": users_cleaned,
-            "credentials_cleaned": credentials_cleaned,
-            "verifications_cleaned": verifications_cleaned
+            "users_cleaned": self.user_repository.bulk_delete(user_ids),
+            "credentials_cleaned": self.credentials_repository.bulk_delete(credentials_ids),
+            "verifications_cleaned": self.email_verification_repository.bulk_delete(verification_ids)
         }
-        
+
+        # One summary line; per-user log I/O dominates at scale
         logger.info(f"Cleanup completed: {result}")
         return result
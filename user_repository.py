@@ -2,7 +2,7 @@
 UserRepository for the User Management domain model.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 
 from base_repository import InMemoryRepository
 from user import User
@@ -10,6 +10,23 @@ from enums import UserRole
 from exceptions import DuplicateEntityException
 
 
+def _name_trigrams(name_lower: str) -> Set[str]:
+    """
+    Character trigrams of a lowercased name.
+
+    Names shorter than a trigram are keyed whole so they stay findable.
+
+    Args:
+        name_lower: Lowercased name or query string
+
+    Returns:
+        Set of 3-character substrings (or the whole string if shorter)
+    """
+    if len(name_lower) < 3:
+        return {name_lower}
+    return {name_lower[i:i + 3] for i in range(len(name_lower) - 2)}
+
+
 class UserRepository(InMemoryRepository[User]):
     """
     Repository for User entities with domain-specific query methods.
@@ -17,7 +34,37 @@ class UserRepository(InMemoryRepository[User]):
     Provides methods for finding users by email, employee ID, role, and other criteria.
     Enforces uniqueness constraints for email and employee ID.
     """
-    
+
+    def __init__(self):
+        """Initialize the user repository with its secondary indexes."""
+        super().__init__()
+
+        # Active/inactive splits back both the find methods and the O(1)
+        # counters used by the statistics endpoints
+        self.register_index('is_active')
+
+        # Emails are stored canonical (lowercased at construction), so the
+        # login/status lookups and the save-time uniqueness check are all
+        # single index probes
+        self.register_index('email')
+
+        # Employee IDs are the other unique key checked on every
+        # registration; indexed for the same reason
+        self.register_index('employee_id')
+
+        # Org-structure groupings backing the directory filters and the
+        # statistics endpoints; with these, the distinct-department and
+        # distinct-title listings are just the index key sets
+        self.register_index('role')
+        self.register_index('department')
+        self.register_index('job_title')
+
+        # Trigram postings over lowercased names so substring search
+        # intersects a few small id sets instead of scanning the whole
+        # directory per keystroke. The per-id snapshot catches renames.
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._name_of: Dict[str, str] = {}
+
     def save(self, user: User) -> User:
         """
         Save a user with uniqueness validation.
@@ -31,17 +78,113 @@ class UserRepository(InMemoryRepository[User]):
         Raises:
             DuplicateEntityException: If email or employee ID already exists
         """
-        # Check for duplicate email (case-insensitive)
-        existing_user_by_email = self.find_by_email(user.email)
-        if existing_user_by_email and existing_user_by_email.id != user.id:
-            raise DuplicateEntityException(f"User with email '{user.email}' already exists")
-        
-        # Check for duplicate employee ID
-        existing_user_by_employee_id = self.find_by_employee_id(user.employee_id)
-        if existing_user_by_employee_id and existing_user_by_employee_id.id != user.id:
-            raise DuplicateEntityException(f"User with employee ID '{user.employee_id}' already exists")
-        
-        return super().save(user)
+        # Re-saving a stored user whose unique keys are unchanged (the common
+        # case: a status flip like activate()) cannot introduce a duplicate,
+        # so skip the uniqueness scans for it. Entities are stored by
+        # reference, so the stored instance IS the argument after a
+        # fetch-mutate-save; diff against the values the user was last
+        # indexed under, not the live object
+        indexed = self._index_values.get(user.id)
+        needs_uniqueness_check = (
+            indexed is None
+            or indexed.get('email') != user.email
+            or indexed.get('employee_id') != user.employee_id
+        )
+
+        if needs_uniqueness_check:
+            # Check for duplicate email (case-insensitive)
+            existing_user_by_email = self.find_by_email(user.email)
+            if existing_user_by_email and existing_user_by_email.id != user.id:
+                raise DuplicateEntityException(f"User with email '{user.email}' already exists")
+
+            # Check for duplicate employee ID
+            existing_user_by_employee_id = self.find_by_employee_id(user.employee_id)
+            if existing_user_by_employee_id and existing_user_by_employee_id.id != user.id:
+                raise DuplicateEntityException(f"User with employee ID '{user.employee_id}' already exists")
+
+        saved = super().save(user)
+
+        name_lower = saved.name.lower()
+        old_name = self._name_of.get(saved.id)
+        if old_name != name_lower:
+            if old_name is not None:
+                self._drop_trigrams(saved.id, old_name)
+            for gram in _name_trigrams(name_lower):
+                self._trigrams.setdefault(gram, set()).add(saved.id)
+            self._name_of[saved.id] = name_lower
+
+        return saved
+
+    def insert_new(self, user: User) -> User:
+        """
+        Insert a freshly constructed user whose uniqueness the caller has
+        already established, skipping the duplicate probes in save.
+
+        Args:
+            user: New user to insert
+
+        Returns:
+            Inserted user
+        """
+        saved = InMemoryRepository.save(self, user)
+
+        name_lower = saved.name.lower()
+        for gram in _name_trigrams(name_lower):
+            self._trigrams.setdefault(gram, set()).add(saved.id)
+        self._name_of[saved.id] = name_lower
+
+        return saved
+
+    def delete_by_id(self, entity_id: str) -> bool:
+        """
+        Delete a user, keeping the name trigram postings in step.
+
+        Args:
+            entity_id: ID of the user to delete
+
+        Returns:
+            True if the user was deleted, False if not found
+        """
+        if not super().delete_by_id(entity_id):
+            return False
+
+        old_name = self._name_of.pop(entity_id, None)
+        if old_name is not None:
+            self._drop_trigrams(entity_id, old_name)
+        return True
+
+    def bulk_delete(self, entity_ids: Iterable[str]) -> int:
+        """
+        Delete a batch of users, keeping the name trigram postings in step.
+
+        Args:
+            entity_ids: IDs of the users to delete
+
+        Returns:
+            Number of users deleted
+        """
+        ids = [entity_id for entity_id in entity_ids if entity_id in self._storage]
+        count = super().bulk_delete(ids)
+        for entity_id in ids:
+            old_name = self._name_of.pop(entity_id, None)
+            if old_name is not None:
+                self._drop_trigrams(entity_id, old_name)
+        return count
+
+    def clear(self) -> None:
+        """Clear all users and the name trigram postings."""
+        super().clear()
+        self._trigrams.clear()
+        self._name_of.clear()
+
+    def _drop_trigrams(self, entity_id: str, name_lower: str) -> None:
+        """Remove a user's id from the postings of a (former) name."""
+        for gram in _name_trigrams(name_lower):
+            bucket = self._trigrams.get(gram)
+            if bucket is not None:
+                bucket.discard(entity_id)
+                if not bucket:
+                    del self._trigrams[gram]
     
     def find_by_email(self, email: str) -> Optional[User]:
         """
@@ -55,9 +198,14 @@ class UserRepository(InMemoryRepository[User]):
         """
         if not email:
             return None
-        
-        email_lower = email.lower().strip()
-        return self.find_first_by_attribute('email', email_lower)
+
+        matches = self.find_by_indexed_attribute('email', self._norm_email(email))
+        return matches[0] if matches else None
+
+    @staticmethod
+    def _norm_email(email: str) -> str:
+        """Canonical (stripped, lowercased) form of an email address."""
+        return email.strip().lower()
     
     def find_by_employee_id(self, employee_id: str) -> Optional[User]:
         """
@@ -71,8 +219,9 @@ class UserRepository(InMemoryRepository[User]):
         """
         if not employee_id:
             return None
-        
-        return self.find_first_by_attribute('employee_id', employee_id.strip())
+
+        matches = self.find_by_indexed_attribute('employee_id', employee_id.strip())
+        return matches[0] if matches else None
     
     def find_by_role(self, role: UserRole) -> List[User]:
         """
@@ -84,7 +233,7 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             List of users with the specified role
         """
-        return self.find_by_attribute('role', role)
+        return self.find_by_indexed_attribute('role', role)
     
     def find_active_users(self) -> List[User]:
         """
@@ -93,7 +242,7 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             List of active users
         """
-        return self.find_by_attribute('is_active', True)
+        return self.find_by_indexed_attribute('is_active', True)
     
     def find_inactive_users(self) -> List[User]:
         """
@@ -102,7 +251,25 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             List of inactive users
         """
-        return self.find_by_attribute('is_active', False)
+        return self.find_by_indexed_attribute('is_active', False)
+
+    def count_active_users(self) -> int:
+        """
+        Count active users without materializing the user list.
+
+        Returns:
+            Number of active users
+        """
+        return len(self._indexes['is_active'].get(True, ()))
+
+    def count_inactive_users(self) -> int:
+        """
+        Count inactive users without materializing the user list.
+
+        Returns:
+            Number of inactive users
+        """
+        return len(self._indexes['is_active'].get(False, ()))
     
     def find_by_department(self, department: str) -> List[User]:
         """
@@ -116,8 +283,25 @@ class UserRepository(InMemoryRepository[User]):
         """
         if not department:
             return []
-        
-        return self.find_by_attribute('department', department.strip())
+
+        return self.find_by_indexed_attribute('department', department.strip())
+
+    def iter_by_department(self, department: str):
+        """
+        Iterate over users in a department without building a list.
+
+        Args:
+            department: Department name to iterate over
+
+        Yields:
+            Users in the specified department
+        """
+        if not department:
+            return
+
+        bucket = self._indexes['department'].get(department.strip(), ())
+        for user_id in bucket:
+            yield self._storage[user_id]
     
     def find_by_job_title(self, job_title: str) -> List[User]:
         """
@@ -131,8 +315,8 @@ class UserRepository(InMemoryRepository[User]):
         """
         if not job_title:
             return []
-        
-        return self.find_by_attribute('job_title', job_title.strip())
+
+        return self.find_by_indexed_attribute('job_title', job_title.strip())
     
     def find_by_role_and_department(self, role: UserRole, department: str) -> List[User]:
         """
@@ -147,8 +331,12 @@ class UserRepository(InMemoryRepository[User]):
         """
         if not department:
             return []
-        
-        return self.find_by_multiple_attributes(role=role, department=department.strip())
+
+        # Both sides are indexed; intersect the id sets and materialize
+        # only the overlap
+        role_bucket = self._indexes['role'].get(role, set())
+        dept_bucket = self._indexes['department'].get(department.strip(), set())
+        return [self._storage[user_id] for user_id in role_bucket & dept_bucket]
     
     def find_active_users_by_role(self, role: UserRole) -> List[User]:
         """
@@ -160,7 +348,11 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             List of active users with the specified role
         """
-        return self.find_by_multiple_attributes(role=role, is_active=True)
+        # set.__and__ iterates the smaller operand, so the join cost
+        # tracks whichever bucket is more selective
+        role_bucket = self._indexes['role'].get(role, set())
+        active_bucket = self._indexes['is_active'].get(True, set())
+        return [self._storage[user_id] for user_id in role_bucket & active_bucket]
     
     def search_by_name(self, name_query: str) -> List[User]:
         """
@@ -174,15 +366,36 @@ class UserRepository(InMemoryRepository[User]):
         """
         if not name_query:
             return []
-        
+
         query_lower = name_query.lower().strip()
-        results = []
-        
-        for user in self.find_all():
-            if query_lower in user.name.lower():
-                results.append(user)
-        
-        return results
+        if not query_lower:
+            return []
+
+        if len(query_lower) < 3:
+            # Too short for trigram candidates; scan the cached lowercased
+            # names rather than re-lowercasing every user
+            return [
+                self._storage[user_id]
+                for user_id, name_lower in self._name_of.items()
+                if query_lower in name_lower
+            ]
+
+        # Intersect postings smallest-first so cost tracks the rarest
+        # trigram, then verify contiguity only on the candidate set
+        postings = [
+            self._trigrams.get(gram) for gram in _name_trigrams(query_lower)
+        ]
+        if any(bucket is None for bucket in postings):
+            return []
+
+        postings.sort(key=len)
+        candidates = set.intersection(*postings)
+
+        return [
+            self._storage[user_id]
+            for user_id in candidates
+            if query_lower in self._name_of[user_id]
+        ]
     
     def email_exists(self, email: str) -> bool:
         """
@@ -194,7 +407,12 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             True if email exists, False otherwise
         """
-        return self.find_by_email(email) is not None
+        if not email:
+            return False
+
+        # Existence only needs the key probe; empty buckets are pruned,
+        # so membership in the index is membership in the repository
+        return self._norm_email(email) in self._indexes['email']
     
     def employee_id_exists(self, employee_id: str) -> bool:
         """
@@ -206,7 +424,10 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             True if employee ID exists, False otherwise
         """
-        return self.find_by_employee_id(employee_id) is not None
+        if not employee_id:
+            return False
+
+        return employee_id.strip() in self._indexes['employee_id']
     
     def get_user_count_by_role(self, role: UserRole) -> int:
         """
@@ -218,7 +439,7 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             Count of users with the specified role
         """
-        return len(self.find_by_role(role))
+        return len(self._indexes['role'].get(role, ()))
     
     def get_active_user_count(self) -> int:
         """
@@ -227,7 +448,7 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             Count of active users
         """
-        return len(self.find_active_users())
+        return self.count_active_users()
     
     def get_department_user_count(self, department: str) -> int:
         """
@@ -239,7 +460,10 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             Count of users in the specified department
         """
-        return len(self.find_by_department(department))
+        if not department:
+            return 0
+
+        return len(self._indexes['department'].get(department.strip(), ()))
     
     def get_all_departments(self) -> List[str]:
         """
@@ -248,10 +472,9 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             List of unique department names
         """
-        departments = set()
-        for user in self.find_all():
-            departments.add(user.department)
-        return sorted(list(departments))
+        # Empty buckets are pruned on delete, so the index keys are
+        # exactly the departments currently in use
+        return sorted(self._indexes['department'])
     
     def get_all_job_titles(self) -> List[str]:
         """
@@ -260,7 +483,4 @@ class UserRepository(InMemoryRepository[User]):
         Returns:
             List of unique job titles
         """
-        job_titles = set()
-        for user in self.find_all():
-            job_titles.add(user.job_title)
-        return sorted(list(job_titles))
+        return sorted(self._indexes['job_title'])